@@ -0,0 +1,122 @@
+"""
+Carga de recursos en segundo plano mientras se anima la pantalla de título.
+
+Cada recurso es un trabajo en dos partes:
+    load()          en un hilo del ThreadPoolExecutor: leer ficheros, dibujar
+                    en Surfaces sin convertir, sintetizar sonidos...
+    finish(result)  en el hilo principal, desde poll(): convert(), dejar el
+                    resultado en su caché, empezar la música...
+Si load() falla, finish recibe None y el recurso se carga como antes, de
+forma perezosa la primera vez que se usa (get_image, LazyFont, Backdrop).
+
+Uso (main.py):
+    ASSETS.start()                  # antes del primer frame
+    ASSETS.poll()                   # cada frame
+    ASSETS.wait(GAME_ASSETS)        # antes de start_new_game
+"""
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from config import WIDTH, HEIGHT, FONT, BIG_FONT, ASSET_WORKERS
+from background import BACKDROP
+from entities import bake_images, install_images
+from music import init_mixer, load_music, play_music
+from sfx import SFX
+
+# Lo que necesita una partida para su primer frame (la música y los
+# efectos pueden llegar después)
+GAME_ASSETS = ("fonts", "backdrop", "images")
+
+
+class AssetLoader:
+    """Trabajos de carga con nombre en un pool de hilos; progress va de 0 a 1."""
+
+    def __init__(self, workers=ASSET_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._jobs = {}  # nombre -> (future, finish)
+        self._done = set()
+        self.times = {}  # nombre -> ms de load() (en su hilo)
+
+    def add(self, name, load, finish=None):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+        self._jobs[name] = (self._executor.submit(self._timed, name, load), finish)
+
+    def _timed(self, name, load):
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            self.times[name] = (time.perf_counter() - start) * 1000.0
+
+    def start(self):
+        """Lanza la carga de todo: fuentes, fondo, sprites, música y efectos."""
+
+        def load_fonts():
+            for font in (FONT, BIG_FONT):
+                font.font
+
+        def finish_backdrop(image):
+            BACKDROP.loading = False
+            if image is not None:
+                BACKDROP.install(image)
+
+        def finish_images(images):
+            if images is not None:
+                install_images(images)
+
+        # el mixer se inicializa aquí, en el hilo principal: los trabajos de
+        # música y efectos sólo cargan y sintetizan
+        init_mixer()
+        BACKDROP.loading = True
+        self.add("fonts", load_fonts)
+        self.add("backdrop", lambda: BACKDROP.paint((WIDTH, HEIGHT)), finish_backdrop)
+        self.add("images", bake_images, finish_images)
+        self.add("music", load_music, play_music)
+        self.add("sfx", SFX.synthesize, SFX.setup)
+
+    @property
+    def progress(self):
+        if not self._jobs:
+            return 1.0
+        return len(self._done) / len(self._jobs)
+
+    def ready(self, name):
+        return name in self._done or name not in self._jobs
+
+    def poll(self):
+        """Termina (en este hilo) los trabajos ya cargados; devuelve progress."""
+        for name, (future, _) in self._jobs.items():
+            if name not in self._done and future.done():
+                self._finish(name)
+        return self.progress
+
+    def wait(self, names):
+        """Espera sólo a los trabajos `names` (y los termina)."""
+        for name in names:
+            if name in self._jobs and name not in self._done:
+                self._finish(name)  # future.result() bloquea hasta que termine
+
+    def _finish(self, name):
+        future, finish = self._jobs[name]
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"[ASSETS] Error cargando {name}: {e}")
+            result = None
+        self._done.add(name)
+        if finish is not None:
+            finish(result)
+        if len(self._done) == len(self._jobs):
+            times = ", ".join(f"{n} {ms:.1f}" for n, ms in self.times.items())
+            print(f"[ASSETS] {len(self._jobs)} recursos cargados en segundo plano (ms: {times})")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Cargador compartido (main.py)
+ASSETS = AssetLoader()
@@ -1,42 +1,148 @@
 import pygame
-import random
+import numpy as np
 from config import WIDTH, HEIGHT
+from profiler import PROFILER
+from rng import RNG
 
 
-def init_stars(num_far=55, num_near=35):
+# Capas de parallax por defecto: lejanas (lentas, pequeñas) y cercanas
+# (rápidas, con glow). Se pueden pasar más capas a init_stars/Starfield.
+DEFAULT_STAR_LAYERS = (
+    {"count": 55, "speed": (0.2, 0.7), "size": (1, 2), "color": (200, 200, 255), "glow": False},
+    {"count": 35, "speed": (0.8, 2.0), "size": (2, 3), "color": (255, 255, 255), "glow": True},
+)
+
+
+class Starfield:
     """
-    Crea dos capas de estrellas: lejanas (más lentas) y cercanas (más rápidas).
-    Cada estrella: [x, y, speed, size, layer]
+    Campo de estrellas guardado en arrays de NumPy (una entrada por estrella).
+    El movimiento y la reaparición se hacen en bloque y el dibujo es un único
+    Surface.blits con sprites pre-renderizados por (capa, tamaño).
     """
-    stars = []
 
-    # Capa lejana
-    for _ in range(num_far):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        speed = random.uniform(0.2, 0.7)
-        size = random.randint(1, 2)
-        stars.append([x, y, speed, size, 0])
+    def __init__(self, layers=DEFAULT_STAR_LAYERS, width=WIDTH, height=HEIGHT, seed=None):
+        self.layers = [dict(layer) for layer in layers]
+        self.width = width
+        self.height = height
+        # sin semilla explícita: la del flujo "stars" de la partida actual
+        self.rng = np.random.default_rng(RNG.derive("stars") if seed is None else seed)
+
+        counts = [layer["count"] for layer in self.layers]
+        self.layer = np.repeat(np.arange(len(self.layers)), counts)
+        n = len(self.layer)
+
+        # rangos de cada estrella según su capa
+        self.speed_min = np.array([l["speed"][0] for l in self.layers])[self.layer]
+        self.speed_max = np.array([l["speed"][1] for l in self.layers])[self.layer]
+        self.size_min = np.array([l["size"][0] for l in self.layers])[self.layer]
+        self.size_max = np.array([l["size"][1] for l in self.layers])[self.layer]
+        self.glow = np.array([bool(l.get("glow")) for l in self.layers])[self.layer]
+
+        self.x = self.rng.integers(0, width + 1, n).astype(np.float64)
+        self.y = self.rng.integers(0, height + 1, n).astype(np.float64)
+        self.speed = self.rng.uniform(self.speed_min, self.speed_max)
+        self.size = self.rng.integers(self.size_min, self.size_max + 1)
+        # ticks de lógica que avanza cada update(); main lo ajusta al tiempo
+        # real de cada frame para que el fondo no dependa de los FPS de dibujo
+        self.time_scale = 1.0
+
+        self._sprites = {}
+        self._star_sprites = [self._sprite(l, s) for l, s in zip(self.layer.tolist(), self.size.tolist())]
+
+    def __len__(self):
+        return len(self.layer)
+
+    def _sprite(self, layer_idx, size):
+        """Sprite compartido para una estrella de esa capa y tamaño."""
+        key = (layer_idx, size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            color = self.layers[layer_idx]["color"]
+            if self.layers[layer_idx].get("glow"):
+                # glow ligero + núcleo, centrado como en el dibujo original
+                sprite = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (color[0], color[1], color[2], 80), (size * 2, size * 2), size * 2)
+                pygame.draw.rect(sprite, color, (size * 2, size * 2, size, size))
+                if pygame.display.get_surface() is not None:
+                    sprite = sprite.convert_alpha()
+            else:
+                sprite = pygame.Surface((size, size))
+                sprite.fill(color)
+                if pygame.display.get_surface() is not None:
+                    sprite = sprite.convert()
+            self._sprites[key] = sprite
+        return sprite
+
+    def update(self):
+        self.y += self.speed * self.time_scale
+        out = np.flatnonzero(self.y > self.height)
+        if out.size:
+            self._respawn(out)
+
+    def _respawn(self, idx):
+        n = idx.size
+        self.y[idx] = 0
+        self.x[idx] = self.rng.integers(0, self.width + 1, n)
+        self.speed[idx] = self.rng.uniform(self.speed_min[idx], self.speed_max[idx])
+        self.size[idx] = self.rng.integers(self.size_min[idx], self.size_max[idx] + 1)
+        for i, layer_idx, size in zip(idx.tolist(), self.layer[idx].tolist(), self.size[idx].tolist()):
+            self._star_sprites[i] = self._sprite(layer_idx, size)
+
+    def _positions(self):
+        # las estrellas con glow se dibujan desplazadas para quedar centradas
+        offset = np.where(self.glow, self.size * 2, 0)
+        xs = (self.x - offset).astype(np.int32).tolist()
+        ys = (self.y - offset).astype(np.int32).tolist()
+        return xs, ys
+
+    def draw(self, surface):
+        xs, ys = self._positions()
+        surface.blits(zip(self._star_sprites, zip(xs, ys)), doreturn=False)
+
+    def rects(self):
+        """Rect que ocupa cada estrella en pantalla (para el modo dirty rects)."""
+        xs, ys = self._positions()
+        sides = np.where(self.glow, self.size * 4, self.size).tolist()
+        return [pygame.Rect(x, y, s, s) for x, y, s in zip(xs, ys, sides)]
+
+
+def init_stars(num_far=55, num_near=35, layers=None, seed=None):
+    """
+    Crea el campo de estrellas. Por defecto dos capas: lejanas (más lentas)
+    y cercanas (más rápidas, con glow). `layers` permite más capas de parallax.
+    """
+    if layers is None:
+        far, near = DEFAULT_STAR_LAYERS
+        layers = (dict(far, count=num_far), dict(near, count=num_near))
+    return Starfield(layers, seed=seed)
 
-    # Capa cercana
-    for _ in range(num_near):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        speed = random.uniform(0.8, 2.0)
-        size = random.randint(2, 3)
-        stars.append([x, y, speed, size, 1])
 
-    return stars
+# Paleta por defecto del fondo: degradado (arriba, medio, abajo) y elipses
+# translúcidas del planeta y las nebulosas.
+DEFAULT_PALETTE = {
+    "top": (5, 5, 25),
+    "mid": (30, 10, 50),
+    "bottom": (5, 5, 40),
+    "planet": ((40, 10, 60, 180), (20, 40, 80, 120)),
+    "nebula": ((120, 40, 180, 70), (80, 160, 220, 60)),
+}
 
 
-def update_and_draw_background(surface, stars):
+def paint_backdrop(surface, palette=DEFAULT_PALETTE):
+    """
+    Pinta directamente el degradado, el planeta y las nebulosas en `surface`.
+    Es el trabajo caro (una línea por fila + dos superficies SRCALPHA):
+    normalmente se usa a través de Backdrop, que lo hace una sola vez.
+    """
+    width, height = surface.get_size()
+
     # --- Fondo degradado tipo galaxia ---
-    top_color = (5, 5, 25)
-    mid_color = (30, 10, 50)
-    bottom_color = (5, 5, 40)
+    top_color = palette["top"]
+    mid_color = palette["mid"]
+    bottom_color = palette["bottom"]
 
-    for i in range(HEIGHT):
-        t = i / HEIGHT
+    for i in range(height):
+        t = i / height
         if t < 0.5:
             tt = t / 0.5
             r = int(top_color[0] + (mid_color[0] - top_color[0]) * tt)
@@ -47,45 +153,86 @@ def update_and_draw_background(surface, stars):
             r = int(mid_color[0] + (bottom_color[0] - mid_color[0]) * tt)
             g = int(mid_color[1] + (bottom_color[1] - mid_color[1]) * tt)
             b = int(mid_color[2] + (bottom_color[2] - mid_color[2]) * tt)
-        pygame.draw.line(surface, (r, g, b), (0, i), (WIDTH, i))
+        pygame.draw.line(surface, (r, g, b), (0, i), (width, i))
 
     # Curvatura tipo planeta + nebulosas suaves
-    planet = pygame.Surface((WIDTH * 2, HEIGHT), pygame.SRCALPHA)
-    pygame.draw.ellipse(planet, (40, 10, 60, 180), (-WIDTH // 2, HEIGHT // 3, WIDTH * 2, HEIGHT))
-    pygame.draw.ellipse(planet, (20, 40, 80, 120), (-WIDTH // 4, HEIGHT // 2, WIDTH * 2, HEIGHT))
+    planet_a, planet_b = palette["planet"]
+    planet = pygame.Surface((width * 2, height), pygame.SRCALPHA)
+    pygame.draw.ellipse(planet, planet_a, (-width // 2, height // 3, width * 2, height))
+    pygame.draw.ellipse(planet, planet_b, (-width // 4, height // 2, width * 2, height))
     surface.blit(planet, (0, 0))
 
-    nebula = pygame.Surface((WIDTH * 2, HEIGHT), pygame.SRCALPHA)
-    pygame.draw.ellipse(nebula, (120, 40, 180, 70), (-WIDTH // 2, -HEIGHT // 4, WIDTH * 2, HEIGHT))
-    pygame.draw.ellipse(nebula, (80, 160, 220, 60), (-WIDTH // 3, HEIGHT // 4, WIDTH * 2, HEIGHT))
+    nebula_a, nebula_b = palette["nebula"]
+    nebula = pygame.Surface((width * 2, height), pygame.SRCALPHA)
+    pygame.draw.ellipse(nebula, nebula_a, (-width // 2, -height // 4, width * 2, height))
+    pygame.draw.ellipse(nebula, nebula_b, (-width // 3, height // 4, width * 2, height))
     surface.blit(nebula, (0, 0))
 
-    # --- Estrellas con parallax y un poco de glow ---
-    for star in stars:
-        x, y, speed, size, layer = star
-
-        y += speed
-        if y > HEIGHT:
-            y = 0
-            x = random.randint(0, WIDTH)
-            if layer == 0:
-                speed = random.uniform(0.2, 0.7)
-                size = random.randint(1, 2)
-            else:
-                speed = random.uniform(0.8, 2.0)
-                size = random.randint(2, 3)
 
-        star[0], star[1], star[2], star[3] = x, y, speed, size
+class Backdrop:
+    """
+    Fondo estático compuesto una sola vez en una superficie con el formato
+    de la pantalla. Sólo se reconstruye si cambia la resolución de la
+    superficie destino o la paleta; el resto de frames es un único blit.
+    """
+
+    def __init__(self, palette=None):
+        self.palette = dict(palette or DEFAULT_PALETTE)
+        self.image = None
+        self.rebuilds = 0
+        # True mientras otro hilo compone la imagen (assets.py): se dibuja negro
+        self.loading = False
 
-        if layer == 0:
-            color = (200, 200, 255)
-        else:
-            color = (255, 255, 255)
+    def set_palette(self, palette):
+        palette = dict(palette)
+        if palette != self.palette:
+            self.palette = palette
+            self.image = None
+
+    def invalidate(self):
+        self.image = None
+
+    def paint(self, size):
+        """Fondo sin convertir; no toca la pantalla, así que vale en otro hilo."""
+        image = pygame.Surface(size)
+        paint_backdrop(image, self.palette)
+        return image
+
+    def install(self, image):
+        # formato de la pantalla => blit sin conversión cada frame
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        self.image = image
+        self.rebuilds += 1
+
+    def _build(self, size):
+        self.install(self.paint(size))
 
-        # glow ligero en las estrellas cercanas
-        if layer == 1:
-            glow = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (color[0], color[1], color[2], 80), (size * 2, size * 2), size * 2)
-            surface.blit(glow, (x - size * 2, y - size * 2))
+    def ensure(self, size):
+        """Compone el fondo si aún no existe para ese tamaño."""
+        if self.image is None or self.image.get_size() != size:
+            self._build(size)
+        return self.image
 
-        pygame.draw.rect(surface, color, (x, y, size, size))
+    def draw(self, surface):
+        if self.loading and self.image is None:
+            surface.fill((0, 0, 0))
+            return
+        surface.blit(self.ensure(surface.get_size()), (0, 0))
+
+    def restore(self, surface, rects):
+        """Vuelve a pintar el fondo sólo dentro de `rects`."""
+        image = self.ensure(surface.get_size())
+        surface.blits([(image, r, r) for r in rects], doreturn=False)
+
+
+# Fondo compartido por todas las pantallas (título, juego, pausa, etc.)
+BACKDROP = Backdrop()
+
+
+def update_and_draw_background(surface, stars):
+    with PROFILER.phase("background"):
+        BACKDROP.draw(surface)
+        # --- Estrellas con parallax y un poco de glow ---
+        stars.update()
+        stars.draw(surface)
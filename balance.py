@@ -0,0 +1,312 @@
+"""
+Simulador de equilibrio por lotes: miles de partidas headless con semilla,
+jugadas por bots, repartidas entre los núcleos con un ProcessPoolExecutor.
+Sirve para ajustar la escala de vida/cadencia de Boss y las mejoras de
+upgrades.UPGRADES sin jugar a mano.
+
+Para cada bot el informe da, por nivel: partidas que llegan, tiempo
+sobrevivido, daño recibido y tiempo en matar al boss; y de las mejoras,
+cuántas veces se eligen de las que se ofrecen.
+
+Rendimiento: unos 64 minutos simulados por minuto real en cada proceso
+(ver la línea [BALANCE] del informe), así que 8 núcleos dan unos 500, no
+los 1000 que se buscaban. Queda pendiente: las balas del jugador y los
+minions siguen siendo sprites (update, rejillas de colisión) y son ya la
+mayor parte de cada tick; pasarlos a arrays como ProjectileField es el
+siguiente paso para llegar.
+
+Uso:
+    python balance.py --runs 1000                       -> todos los bots
+    python balance.py --runs 200 --policy dodge --minutes 10
+    python balance.py --runs 1000 --workers 8 --json balance.json
+"""
+import os
+
+# Sin ventana ni audio: tiene que ir antes de importar pygame/config
+# (los procesos hijos también importan este módulo)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import random
+import time
+
+import numpy as np
+
+from config import FPS, HEIGHT, STATE_GAME_OVER, STATE_UPGRADE
+from game import GameState, InputSnapshot, IN_LEFT, IN_RIGHT, IN_UP, IN_DOWN, IN_SHOOT, IN_SPECIAL
+from headless import default_policy
+from rng import check_seed
+from upgrades import UPGRADES, up_fire_rate, up_hp, up_special_charge, up_bullet_speed, up_move_speed
+
+
+# ============================================================
+# BOTS
+# ============================================================
+# Cada bot es un objeto con move(game) -> máscara de entrada y
+# upgrade(game) -> índice en game.upgrade_options. Su azar sale de su
+# propio random.Random (semilla de la partida): no toca los flujos de rng.py.
+class RandomBot:
+    """Se mueve al azar (cambia de dirección cada ~10 ticks), dispara casi siempre, mejoras al azar."""
+
+    MOVES = (0, IN_LEFT, IN_RIGHT, IN_UP, IN_DOWN, IN_LEFT | IN_UP, IN_RIGHT | IN_UP)
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.mask = 0
+        self.hold = 0
+
+    def move(self, game):
+        if self.hold <= 0:
+            rng = self.rng
+            self.mask = rng.choice(self.MOVES)
+            if rng.random() < 0.9:
+                self.mask |= IN_SHOOT
+            self.hold = rng.randint(5, 15)
+        self.hold -= 1
+        mask = self.mask
+        if self.rng.random() < 0.002:
+            mask |= IN_SPECIAL
+        return mask
+
+    def upgrade(self, game):
+        return self.rng.randrange(len(game.upgrade_options))
+
+
+class GreedyUpgradeBot:
+    """Sigue al boss como headless.default_policy y elige siempre la mejora mejor clasificada."""
+
+    # de más a menos valiosa (según se quiera probar, se cambia el orden)
+    PRIORITY = (up_fire_rate, up_hp, up_special_charge, up_bullet_speed, up_move_speed)
+
+    def __init__(self, seed):
+        pass
+
+    def move(self, game):
+        return default_policy(game)
+
+    def upgrade(self, game):
+        ranks = [self.PRIORITY.index(option["apply"]) for option in game.upgrade_options]
+        return ranks.index(min(ranks))
+
+
+class DodgeBot:
+    """
+    Prioriza esquivar: si hay balas del boss cerca por encima, se aparta
+    de ellas (y baja si están muy cerca); si no, sigue al boss disparando.
+    """
+
+    # zona vigilada alrededor del centro del jugador (px)
+    REACH_X = 70
+    REACH_ABOVE = 160
+    REACH_BELOW = 20
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def move(self, game):
+        player = game.player
+        field = game.enemy_bullets
+        cx, cy = player.rect.center
+        n = field.count
+        if n:
+            dx = field.x[:n] - cx
+            dy = field.y[:n] - cy
+            near = (np.abs(dx) < self.REACH_X) & (dy > -self.REACH_ABOVE) & (dy < self.REACH_BELOW)
+            if near.any():
+                mask = IN_SHOOT
+                # hacia el lado con menos balas (al azar si están igual)
+                side = float(dx[near].mean())
+                if side > 0 or (side == 0 and self.rng.random() < 0.5):
+                    mask |= IN_LEFT
+                else:
+                    mask |= IN_RIGHT
+                if cy < HEIGHT - 40 and float(dy[near].max()) > -60:
+                    mask |= IN_DOWN
+                return mask
+        return default_policy(game)
+
+    def upgrade(self, game):
+        # sobrevivir primero: PV, luego velocidad
+        for apply in (up_hp, up_move_speed):
+            for idx, option in enumerate(game.upgrade_options):
+                if option["apply"] is apply:
+                    return idx
+        return 0
+
+
+POLICIES = {
+    "random": RandomBot,
+    "greedy": GreedyUpgradeBot,
+    "dodge": DodgeBot,
+}
+
+
+# ============================================================
+# UNA PARTIDA
+# ============================================================
+def simulate(job):
+    """
+    Juega una partida (policy, seed, max_ticks) hasta morir o agotar los
+    ticks. Devuelve un dict sólo con números y listas (se envía entre procesos).
+    """
+    policy, seed, max_ticks = job
+    bot = POLICIES[policy](seed)
+    game = GameState()
+    game.trails = False  # nadie los ve
+    game.start_new_game(seed)
+    player = game.player
+
+    # por nivel (índice = nivel - 1): ticks vividos, daño recibido, ticks hasta matar al boss
+    level_ticks = [0]
+    level_damage = [0]
+    boss_kills = []
+    offered = [0] * len(UPGRADES)
+    picked = [0] * len(UPGRADES)
+
+    hp = player.hp
+    tick = 0
+    while tick < max_ticks:
+        state = game.state
+        if state == STATE_UPGRADE:
+            boss_kills.append(level_ticks[-1])
+            for option in game.upgrade_options:
+                offered[UPGRADES.index(option)] += 1
+            idx = bot.upgrade(game)
+            picked[UPGRADES.index(game.upgrade_options[idx])] += 1
+            game.choose_upgrade(idx)
+            level_ticks.append(0)
+            level_damage.append(0)
+            hp = player.hp  # la mejora de PV cura: no es daño negativo
+            continue
+        if state == STATE_GAME_OVER:
+            break
+        game.step(InputSnapshot(bot.move(game)))
+        tick += 1
+        level_ticks[-1] += 1
+        if player.hp < hp:
+            level_damage[-1] += hp - player.hp
+        hp = player.hp
+
+    return {
+        "policy": policy,
+        "seed": seed,
+        "ticks": tick,
+        "died": game.state == STATE_GAME_OVER,
+        "level": game.level,
+        "score": game.score,
+        "level_ticks": level_ticks,
+        "level_damage": level_damage,
+        "boss_kills": boss_kills,
+        "offered": offered,
+        "picked": picked,
+    }
+
+
+# ============================================================
+# LOTES
+# ============================================================
+def run_batch(runs, policies=tuple(POLICIES), max_ticks=FPS * 60 * 10, workers=None, seed=1):
+    """
+    `runs` partidas por bot, con las semillas seed, seed+1... (las mismas
+    para todos los bots). workers=1 juega en este proceso. Devuelve
+    (resultados, segundos de reloj, procesos usados).
+    """
+    jobs = [(policy, seed + i, max_ticks) for policy in policies for i in range(runs)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    start = time.perf_counter()
+    if workers == 1:
+        results = [simulate(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            # varias partidas por envío, pero bastantes lotes para repartir bien
+            chunksize = max(1, len(jobs) // (workers * 8))
+            results = list(pool.map(simulate, jobs, chunksize=chunksize))
+    return results, time.perf_counter() - start, workers
+
+
+def summarize(results):
+    """Agrega los resultados por bot: {policy: resumen}."""
+    summary = {}
+    for policy in dict.fromkeys(r["policy"] for r in results):
+        rows = [r for r in results if r["policy"] == policy]
+        max_level = max(len(r["level_ticks"]) for r in rows)
+        levels = []
+        for lv in range(max_level):
+            reached = [r for r in rows if len(r["level_ticks"]) > lv]
+            kills = [r["boss_kills"][lv] for r in reached if len(r["boss_kills"]) > lv]
+            levels.append({
+                "level": lv + 1,
+                "reached": len(reached),
+                "survival_s": float(np.mean([r["level_ticks"][lv] for r in reached])) / FPS,
+                "damage": float(np.mean([r["level_damage"][lv] for r in reached])),
+                "kill_rate": len(kills) / len(reached),
+                "time_to_kill_s": float(np.mean(kills)) / FPS if kills else None,
+            })
+        offered = np.sum([r["offered"] for r in rows], axis=0)
+        picked = np.sum([r["picked"] for r in rows], axis=0)
+        summary[policy] = {
+            "runs": len(rows),
+            "deaths": sum(r["died"] for r in rows),
+            "mean_level": float(np.mean([r["level"] for r in rows])),
+            "mean_score": float(np.mean([r["score"] for r in rows])),
+            "mean_minutes": float(np.mean([r["ticks"] for r in rows])) / (FPS * 60),
+            "levels": levels,
+            "upgrades": [
+                {"name": up["name"], "offered": int(o), "picked": int(p), "pick_rate": p / o if o else None}
+                for up, o, p in zip(UPGRADES, offered, picked)
+            ],
+        }
+    return summary
+
+
+def print_report(summary, elapsed, sim_ticks, workers=1):
+    sim_minutes = sim_ticks / (FPS * 60)
+    rate = sim_minutes / (elapsed / 60) if elapsed > 0 else float("inf")
+    print(f"[BALANCE] {sim_minutes:.0f} minutos simulados en {elapsed:.1f} s con {workers} proceso{'s' if workers > 1 else ''} "
+          f"({rate:.0f} min simulados / min real, {rate / workers:.0f} por proceso)")
+    for policy, s in summary.items():
+        print(f"\n=== {policy}: {s['runs']} partidas, {s['deaths']} muertes | nivel medio {s['mean_level']:.2f} "
+              f"| score medio {s['mean_score']:.0f} | {s['mean_minutes']:.2f} min por partida")
+        print(f"  {'nivel':>5} {'llegan':>7} {'vive (s)':>9} {'daño':>7} {'mata %':>7} {'boss (s)':>9}")
+        for lv in s["levels"]:
+            ttk = f"{lv['time_to_kill_s']:9.1f}" if lv["time_to_kill_s"] is not None else f"{'-':>9}"
+            print(f"  {lv['level']:>5} {lv['reached']:>7} {lv['survival_s']:>9.1f} {lv['damage']:>7.1f} "
+                  f"{lv['kill_rate'] * 100:>6.0f}% {ttk}")
+        print(f"  {'mejora':<26} {'ofrecida':>8} {'elegida':>8} {'%':>5}")
+        for up in s["upgrades"]:
+            rate = f"{up['pick_rate'] * 100:5.0f}" if up["pick_rate"] is not None else f"{'-':>5}"
+            print(f"  {up['name']:<26} {up['offered']:>8} {up['picked']:>8} {rate}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Partidas headless por lotes con bots, en varios procesos")
+    parser.add_argument("--runs", type=int, default=200, help="partidas por bot")
+    parser.add_argument("--policy", action="append", choices=list(POLICIES), help="bot (repetible; por defecto todos)")
+    parser.add_argument("--minutes", type=float, default=10.0, help="duración máxima de cada partida")
+    parser.add_argument("--workers", type=int, default=None, help="procesos (por defecto, uno por núcleo)")
+    parser.add_argument("--seed", type=int, default=1, help="primera semilla")
+    parser.add_argument("--json", metavar="PATH", help="guardar el resumen en JSON")
+    args = parser.parse_args(argv)
+    try:
+        # todas las semillas del lote, antes de repartirlas entre procesos
+        check_seed(args.seed)
+        check_seed(args.seed + max(args.runs, 1) - 1)
+    except ValueError as e:
+        parser.error(str(e))
+
+    policies = tuple(args.policy or POLICIES)
+    max_ticks = int(args.minutes * 60 * FPS)
+    results, elapsed, workers = run_batch(args.runs, policies, max_ticks, args.workers, args.seed)
+    summary = summarize(results)
+    print_report(summary, elapsed, sum(r["ticks"] for r in results), workers)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"[BALANCE] Resumen guardado en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
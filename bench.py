@@ -0,0 +1,604 @@
+"""
+Benchmarks del juego (sin ventana, con el driver "dummy" de SDL).
+
+Uso:
+    python bench.py                 -> ejecuta todos
+    python bench.py backdrop        -> sólo el fondo
+    python bench.py starfield       -> campo de estrellas
+    python bench.py pools           -> balas con y sin pool
+    python bench.py projectiles     -> balas del boss en arrays (hasta 20000)
+    python bench.py patterns        -> ráfagas de patrones compilados (y los de demostración)
+    python bench.py collision       -> fase amplia de colisiones
+    python bench.py text            -> caché de textos
+    python bench.py snapshot        -> tamaño y tiempo de snapshot/restore
+    python bench.py memory          -> bytes por bala, trail y minion
+    python bench.py sprites         -> arte dibujado vs caché de sprites en disco
+    python bench.py startup         -> import de config y main, primer frame (fuentes perezosas, carga en hilos)
+    python bench.py sfx             -> efectos con fuego intenso: Sound.play por evento vs SFX
+"""
+import os
+import sys
+import time
+
+# Sin ventana ni audio: tiene que ir antes de importar pygame/config
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import WIDTH, HEIGHT
+
+
+def _time_per_frame(fn, frames):
+    """Ejecuta fn() `frames` veces y devuelve milisegundos medios por llamada."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def _report(name, before_ms, after_ms):
+    speedup = before_ms / after_ms if after_ms > 0 else float("inf")
+    print(f"{name:<28} antes {before_ms:8.3f} ms/frame | despues {after_ms:8.3f} ms/frame | x{speedup:.1f}")
+
+
+def bench_backdrop(frames=300):
+    """Fondo pintado cada frame (comportamiento antiguo) vs Backdrop cacheado."""
+    from background import Backdrop, paint_backdrop
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    world = pygame.Surface((WIDTH, HEIGHT))
+    backdrop = Backdrop()
+    backdrop.draw(world)  # primera composición fuera de la medida
+
+    before = _time_per_frame(lambda: paint_backdrop(world), frames)
+    after = _time_per_frame(lambda: backdrop.draw(world), frames)
+    _report("backdrop", before, after)
+
+
+def bench_starfield(frames=300):
+    """Coste de update + draw del campo de estrellas según el número de estrellas."""
+    from background import DEFAULT_STAR_LAYERS, Starfield
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    world = pygame.Surface((WIDTH, HEIGHT))
+    far, near = DEFAULT_STAR_LAYERS
+    budget_ms = 1000.0 / 60
+
+    for total, n_layers in ((90, 2), (1000, 3), (5000, 4), (10000, 4)):
+        # reparte las estrellas entre n capas, de lejanas a cercanas
+        layers = []
+        for i in range(n_layers):
+            base = far if i < n_layers // 2 else near
+            k = i + 1
+            layers.append(dict(base, count=total // n_layers, speed=(0.2 * k, 0.5 * k)))
+        field = Starfield(layers, seed=1)
+
+        def frame():
+            field.update()
+            field.draw(world)
+
+        ms = _time_per_frame(frame, frames)
+        print(f"starfield {len(field):>6} estrellas/{n_layers} capas  {ms:8.3f} ms/frame "
+              f"({100 * ms / budget_ms:5.1f}% de un frame a 60 FPS)")
+
+
+def bench_pools(frames=600):
+    """Ráfagas continuas de balas del jugador: construcción directa vs pool."""
+    from entities import Bullet, BULLET_POOL
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    group = pygame.sprite.Group()
+
+    def storm(spawn):
+        # abanico de 14 balas por frame que salen de la pantalla
+        for i in range(14):
+            group.add(spawn(WIDTH // 2, HEIGHT // 2, None, 12.0, "spread", -1.2 - i * 0.05))
+        group.update()
+
+    def direct(x, y, target, speed, kind, angle):
+        return Bullet(x, y, target, speed, kind=kind, angle=angle)
+
+    before = _time_per_frame(lambda: storm(direct), frames)
+    group.empty()
+
+    storm(BULLET_POOL.acquire)  # calentamiento
+    for _ in range(60):
+        storm(BULLET_POOL.acquire)
+    misses = BULLET_POOL.misses
+    after = _time_per_frame(lambda: storm(BULLET_POOL.acquire), frames)
+    _report("bullet storm (pool)", before, after)
+
+    stats = BULLET_POOL.stats()
+    print(f"  pool: hits={stats['hits']} misses={stats['misses']} "
+          f"(nuevas durante la medida: {stats['misses'] - misses})")
+
+
+def bench_projectiles(frames=120):
+    """Balas del boss en ProjectileField: update + colisiones + dibujo según cuántas hay."""
+    import numpy as np
+    from projectiles import ProjectileField
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    world = pygame.Surface((WIDTH, HEIGHT))
+    beam = pygame.Rect(WIDTH // 3, 0, 60, HEIGHT)
+    budget_ms = 1000.0 / 60
+    rng = np.random.default_rng(1)
+
+    for total in (1000, 5000, 20000):
+        field = ProjectileField()
+
+        def refill():
+            # mitad dirigidas en todas direcciones, mitad "wave" bajando
+            missing = total - len(field)
+            half = missing // 2
+            angles = rng.uniform(0, 2 * np.pi, half)
+            field.spawn_many(rng.uniform(0, WIDTH, half), rng.uniform(0, HEIGHT, half),
+                             np.cos(angles) * 4, np.sin(angles) * 4)
+            rest = missing - half
+            field.spawn_many(rng.uniform(0, WIDTH, rest), rng.uniform(0, HEIGHT, rest), 0, 3.0, kind="wave")
+
+        def frame():
+            field.update()
+            field.collide_circle(WIDTH / 2, HEIGHT - 80, 12)
+            field.collide_rect(beam)
+            field.draw(world)
+
+        refill()
+        ms = 0.0
+        for _ in range(frames):
+            refill()  # fuera de la medida: mantiene `total` balas vivas
+            ms += _time_per_frame(frame, 1)
+        ms /= frames
+        print(f"projectiles {total:>6} balas  {ms:8.3f} ms/frame "
+              f"({100 * ms / budget_ms:5.1f}% de un frame a 60 FPS)")
+
+
+def bench_patterns(frames=300):
+    """
+    Ráfaga radial densa: trigonometría por bala (antes) vs tabla compilada
+    de patterns. Después, coste por frame de los SHOWCASE_PATTERNS (que el
+    boss de la partida no usa) disparando cada 10 frames.
+    """
+    import math
+    from patterns import Pattern, SHOWCASE_PATTERNS
+    from projectiles import ProjectileField
+
+    class _Boss:
+        rect = pygame.Rect(WIDTH // 2 - 80, 55, 160, 90)
+        spin_angle = 0.0
+
+    class _Player:
+        rect = pygame.Rect(WIDTH // 2 - 16, HEIGHT - 96, 32, 32)
+
+    boss = _Boss()
+    for count in (14, 100, 500):
+        spec = {"emitter": "radial", "count": count, "speed": 4.0, "spin": 0.3, "kind": "wave"}
+        pattern = Pattern(spec)
+        field = ProjectileField()
+
+        def per_bullet():
+            field.clear()
+            boss.spin_angle += 0.3
+            for i in range(count):
+                angle = boss.spin_angle + (2 * math.pi / count) * i
+                field.spawn(boss.rect.centerx, boss.rect.centery,
+                            math.cos(angle) * 4.0, math.sin(angle) * 4.0, kind="wave")
+
+        def compiled():
+            field.clear()
+            pattern.fire(boss, None, field, None)
+
+        before = _time_per_frame(per_bullet, frames)
+        after = _time_per_frame(compiled, frames)
+        _report(f"radial burst {count:>3} balas", before, after)
+
+    player = _Player()
+    for index, spec in enumerate(SHOWCASE_PATTERNS):
+        pattern = Pattern(spec)
+        field = ProjectileField()
+        tick = [0]
+
+        def volley():
+            if tick[0] % 10 == 0:
+                pattern.fire(boss, player, field, None)
+            tick[0] += 1
+            field.update()
+
+        ms = _time_per_frame(volley, frames)
+        label = f"{pattern.emitter}/{pattern.path}"
+        print(f"showcase {index} {label:<18} {ms:8.3f} ms/frame ({len(field)} balas vivas)")
+
+
+def bench_collision(frames=30):
+    """Minions contra balas y rayos contra balas enemigas: spritecollide vs SpatialHash."""
+    import random
+    from collision import SpatialHash
+
+    rng = random.Random(1)
+
+    def make_group(count, size):
+        group = pygame.sprite.Group()
+        for _ in range(count):
+            sprite = pygame.sprite.Sprite()
+            sprite.rect = pygame.Rect(rng.randrange(WIDTH), rng.randrange(HEIGHT), size, size)
+            group.add(sprite)
+        return group
+
+    beams = make_group(2, 60)
+    for beam in beams:
+        beam.rect.height = HEIGHT
+        beam.rect.top = 0
+
+    for n_bullets in (1000, 5000, 20000):
+        minions = make_group(200, 26)
+        bullets = make_group(n_bullets, 12)
+        enemy_bullets = make_group(n_bullets, 10)
+
+        def naive():
+            hits = 0
+            for minion in minions:
+                hits += len(pygame.sprite.spritecollide(minion, bullets, False))
+            for beam in beams:
+                hits += len(pygame.sprite.spritecollide(beam, enemy_bullets, False))
+            return hits
+
+        bullet_grid = SpatialHash()
+        enemy_grid = SpatialHash()
+
+        def grid():
+            bullet_grid.rebuild(bullets)
+            enemy_grid.rebuild(enemy_bullets)
+            hits = sum(len(h) for h in bullet_grid.groupcollide(minions).values())
+            hits += sum(len(h) for h in enemy_grid.groupcollide(beams).values())
+            return hits
+
+        assert naive() == grid()
+        before = _time_per_frame(naive, frames)
+        after = _time_per_frame(grid, frames)
+        _report(f"collision {n_bullets:>5}x2 balas", before, after)
+
+
+def bench_text(frames=300):
+    """Textos del HUD y de la pantalla de título: font.render cada frame vs TextCache."""
+    from config import FONT, BIG_FONT, WHITE, CYAN
+    from ui import TextCache
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    texts = [
+        (BIG_FONT, "CHRONIQUES PIXEL"),
+        (FONT, "Assaut des Boss"),
+        (FONT, "Fleches : se deplacer"),
+        (FONT, "Appuie sur ENTREE pour commencer"),
+        (FONT, "M : mute musique | B : pause musique"),
+        (FONT, "PV"),
+        (FONT, "Niveau : 3"),
+    ]
+    cache = TextCache()
+    score = [0]
+
+    def direct():
+        for font, text in texts:
+            font.render(text, True, WHITE)
+        score[0] += 1
+        FONT.render(f"Score : {score[0] // 10}", True, CYAN)
+
+    def cached():
+        for font, text in texts:
+            cache.render(font, text, WHITE)
+        score[0] += 1
+        cache.render(FONT, f"Score : {score[0] // 10}", CYAN)
+
+    before = _time_per_frame(direct, frames)
+    after = _time_per_frame(cached, frames)
+    _report("text", before, after)
+    stats = cache.stats()
+    print(f"  cache: hits={stats['hits']} misses={stats['misses']} entradas={stats['entries']}")
+
+
+def bench_snapshot(frames=300):
+    """Tamaño de snapshot.capture y tiempo de capture/restore en partidas más o menos cargadas."""
+    import numpy as np
+    import headless
+    import snapshot
+    from game import GameState
+
+    def busy_game(ticks, extra_bullets):
+        game = GameState()
+        game.start_new_game(1)
+        game.player.hp = game.player.max_hp = 10 ** 9
+        headless.run(ticks, game=game)
+        if extra_bullets:
+            rng = np.random.default_rng(1)
+            game.enemy_bullets.spawn_many(rng.uniform(0, WIDTH, extra_bullets),
+                                          rng.uniform(0, HEIGHT, extra_bullets), 0.0, 3.0)
+        return game
+
+    for label, ticks, extra in (("inicio", 60, 0), ("nivel alto", 3000, 0), ("+2000 balas", 3000, 2000)):
+        game = busy_game(ticks, extra)
+        data = snapshot.capture(game)
+        capture_ms = _time_per_frame(lambda: snapshot.capture(game), frames)
+        restore_ms = _time_per_frame(lambda: snapshot.restore(game, data), frames)
+        print(f"snapshot {label:<12} nivel {game.level:>2} sprites {sum(len(g) for g in game.groups()):>3} "
+              f"balas boss {len(game.enemy_bullets):>4}: {len(data):>6} bytes | "
+              f"capture {capture_ms:6.3f} ms | restore {restore_ms:6.3f} ms")
+
+
+def bench_memory(count=2000):
+    """Memoria por entidad (tracemalloc): balas del jugador con el trail lleno, trails y minions."""
+    import gc
+    import tracemalloc
+    from config import TRAIL_LENGTH
+    from entities import Boss, Bullet, Minion
+    from trails import Trail, update_trails
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    boss = Boss(1)
+
+    def bullets():
+        group = pygame.sprite.Group(*(Bullet(WIDTH // 2, HEIGHT - 80, boss, 9) for _ in range(count)))
+        for _ in range(TRAIL_LENGTH):
+            group.update()
+            update_trails(group)
+        return group
+
+    def trails():
+        trails = [Trail() for _ in range(count)]
+        for trail in trails:
+            for i in range(TRAIL_LENGTH):
+                trail.push((300 + i * 7, 400 - i * 9))
+        return trails
+
+    def minions():
+        return pygame.sprite.Group(*(Minion(WIDTH // 2, 100, 3) for _ in range(count)))
+
+    for name, make in (("bullet + trail", bullets), ("trail", trails), ("minion", minions)):
+        gc.collect()
+        tracemalloc.start()
+        keep = make()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"memoria {name:<16} {size / count:7.0f} bytes/entidad ({count} entidades)")
+        del keep
+
+
+def bench_sprites(rounds=20):
+    """Cargar todo el arte (preload_images): dibujándolo vs caché en disco fría y caliente."""
+    import tempfile
+    import entities
+    from sprite_cache import SpriteCache
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    saved = entities.SPRITE_CACHE
+
+    def preload_ms(cache):
+        entities.SPRITE_CACHE = cache
+        entities.clear_image_cache()
+        start = time.perf_counter()
+        entities.preload_images()
+        return (time.perf_counter() - start) * 1000.0
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            draw = min(preload_ms(SpriteCache(tmp, enabled=False)) for _ in range(rounds))
+            cold = preload_ms(SpriteCache(tmp))
+            warm = min(preload_ms(SpriteCache(tmp)) for _ in range(rounds))
+        print(f"sprites (preload_images)      dibujados {draw:7.3f} ms | disco frío {cold:7.3f} ms | "
+              f"disco caliente {warm:7.3f} ms")
+        # un Boss nuevo por nivel: la imagen sale de la caché en memoria
+        entities.SPRITE_CACHE = saved
+        boss_ms = _time_per_frame(lambda: entities.Boss(3), rounds * 10)
+        print(f"sprites Boss(nivel)           {boss_ms:7.3f} ms por boss")
+    finally:
+        entities.SPRITE_CACHE = saved
+        entities.clear_image_cache()
+
+
+# Programas de bench_startup: cada uno imprime sus segundos en un proceso nuevo.
+# pygame se importa antes de empezar a medir (cuesta lo mismo antes y después).
+_STARTUP_IMPORT_OLD = """
+import time, pygame
+t = time.perf_counter()
+pygame.init()
+pygame.font.SysFont("Old English Text MT", 24)
+pygame.font.SysFont("Old English Text MT", 48)
+import config
+print(time.perf_counter() - t)
+"""
+_STARTUP_IMPORT_NEW = """
+import time, pygame
+t = time.perf_counter()
+import config
+print(time.perf_counter() - t)
+"""
+_STARTUP_IMPORT_MAIN = """
+import sys, time, pygame
+import fonts
+fonts.FONTS.cache_path = sys.argv[1]
+t = time.perf_counter()
+import main
+elapsed = time.perf_counter() - t
+print(len(fonts.FONTS._fonts), fonts.FONTS.scans, elapsed)
+"""
+_STARTUP_FIRST_FRAME = """
+import sys, time, pygame
+t = time.perf_counter()
+import fonts
+fonts.FONTS.cache_path = sys.argv[1]
+from config import WIDTH, HEIGHT
+from background import init_stars
+from ui import draw_title_screen
+pygame.init()
+screen = pygame.display.set_mode((WIDTH, HEIGHT))
+draw_title_screen(screen, init_stars())
+pygame.display.flip()
+print(time.perf_counter() - t)
+"""
+
+# argv: "sync" (todo en el hilo principal antes del título, como antes) o
+# "async" (assets.ASSETS), y carpeta para las cachés. Imprime los ms hasta
+# el primer frame y hasta poder empezar partida.
+_STARTUP_LOADING = """
+import sys, time, pygame
+t = time.perf_counter()
+import fonts, sprite_cache
+fonts.FONTS.cache_path = sys.argv[2] + "/fonts.json"
+sprite_cache.SPRITE_CACHE.directory = sys.argv[2]
+from config import WIDTH, HEIGHT
+from background import init_stars
+from ui import draw_title_screen
+from assets import ASSETS, GAME_ASSETS
+pygame.init()
+screen = pygame.display.set_mode((WIDTH, HEIGHT))
+stars = init_stars()
+if sys.argv[1] == "sync":
+    from entities import preload_images
+    from music import start_music
+    from sfx import SFX
+    start_music()
+    SFX.init()
+    preload_images()
+    draw_title_screen(screen, stars)
+    pygame.display.flip()
+    first = ready = time.perf_counter() - t
+else:
+    # fuentes ya cargadas (en este hilo) antes de lanzar la carga: deberían ser 0
+    early = len(fonts.FONTS._fonts)
+    ASSETS.start()
+    draw_title_screen(screen, stars, ASSETS)
+    pygame.display.flip()
+    first = time.perf_counter() - t
+    ASSETS.wait(GAME_ASSETS)
+    ready = time.perf_counter() - t
+    ASSETS.shutdown()
+    print(first, ready, early, ASSETS.times.get("fonts", 0.0))
+print(first, ready)
+"""
+
+
+def bench_startup(runs=5):
+    """Import de config y de main, y arranque hasta el primer frame del título, en procesos nuevos."""
+    import subprocess
+    import tempfile
+
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def run_ms_line(code, *args):
+        out = subprocess.run([sys.executable, "-W", "ignore", "-c", code, *args], cwd=here,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip().splitlines()[-1].split()
+
+    def run_ms(code, *args):
+        return float(run_ms_line(code, *args)[-1]) * 1000.0
+
+    before = min(run_ms(_STARTUP_IMPORT_OLD) for _ in range(runs))
+    after = min(run_ms(_STARTUP_IMPORT_NEW) for _ in range(runs))
+    print(f"startup import config        init + SysFont {before:7.2f} ms | perezoso {after:7.2f} ms")
+
+    # import main arrastra ui, render, assets...: ninguno debe cargar fuentes
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "fonts.json")
+        loaded = scans = 0
+        best = float("inf")
+        for _ in range(runs):
+            out = run_ms_line(_STARTUP_IMPORT_MAIN, cache_path)
+            loaded, scans, seconds = int(out[0]), int(out[1]), float(out[2])
+            best = min(best, seconds * 1000.0)
+    print(f"startup import main          {best:7.2f} ms | fuentes cargadas {loaded} (búsquedas en el sistema {scans})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "fonts.json")
+        cold = run_ms(_STARTUP_FIRST_FRAME, cache_path)
+        warm = min(run_ms(_STARTUP_FIRST_FRAME, cache_path) for _ in range(runs))
+    print(f"startup primer frame         caché de fuentes fría {cold:7.2f} ms | caliente {warm:7.2f} ms")
+
+    def loading_ms(mode, cache_dir):
+        out = subprocess.run([sys.executable, "-W", "ignore", "-c", _STARTUP_LOADING, mode, cache_dir],
+                             cwd=here, capture_output=True, text=True, check=True)
+        first, ready = out.stdout.strip().splitlines()[-1].split()
+        return float(first) * 1000.0, float(ready) * 1000.0
+
+    for mode, label in (("sync", "todo antes del título"), ("async", "en hilos (assets.py)")):
+        with tempfile.TemporaryDirectory() as tmp:
+            loading_ms(mode, tmp)  # cachés en disco calientes
+            first, ready = min(loading_ms(mode, tmp) for _ in range(runs))
+        print(f"startup carga {label:<22} primer frame {first:7.2f} ms | partida lista {ready:7.2f} ms")
+
+    # caché de fuentes fría: la búsqueda en el sistema tiene que caer en el
+    # hilo de "fonts", no en el primer frame del título
+    firsts = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = subprocess.run([sys.executable, "-W", "ignore", "-c", _STARTUP_LOADING, "async", tmp],
+                                 cwd=here, capture_output=True, text=True, check=True)
+            first, _, early, fonts_ms = out.stdout.strip().splitlines()[-2].split()
+            firsts.append(float(first) * 1000.0)
+    print(f"startup carga en hilos, caché fría   primer frame {min(firsts):7.2f} ms | "
+          f"fuentes antes de ASSETS.start {int(early)} | búsqueda en el hilo de fuentes {float(fonts_ms):6.2f} ms")
+
+
+def bench_sfx(frames=600):
+    """Un frame de fuego intenso (ráfaga de 14 balas, 30 impactos...): un play por evento vs SFX."""
+    from sfx import SoundEffects
+
+    pygame.mixer.init()
+    sfx = SoundEffects()
+    if not sfx.init():
+        return
+    heavy = {"shot": 2, "boss_shot": 14, "boss_hit": 30, "minion_death": 3, "player_hit": 1}
+
+    # antes: cada evento es un Sound.play() en el primer canal libre
+    pygame.mixer.set_reserved(0)
+    pygame.mixer.set_num_channels(32)
+    sounds = sfx.sounds
+
+    def naive():
+        for name, count in heavy.items():
+            for _ in range(count):
+                sounds[name].play()
+
+    before = _time_per_frame(naive, frames)
+    busy_before = sum(pygame.mixer.Channel(i).get_busy() for i in range(32))
+    pygame.mixer.stop()
+
+    pygame.mixer.set_num_channels(8)
+    sfx.init()
+    after = _time_per_frame(lambda: sfx.play_events(heavy), frames)
+    busy_after = sum(pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels()))
+    pygame.mixer.stop()
+    _report("sfx (fuego intenso)", before, after)
+    stats = sfx.stats()
+    print(f"  voces sonando: {busy_before} -> {busy_after} | eventos {stats['requested']} -> "
+          f"reproducciones {stats['played']} (cortadas {stats['stolen']})")
+
+
+BENCHMARKS = {
+    "backdrop": bench_backdrop,
+    "starfield": bench_starfield,
+    "pools": bench_pools,
+    "projectiles": bench_projectiles,
+    "patterns": bench_patterns,
+    "collision": bench_collision,
+    "text": bench_text,
+    "snapshot": bench_snapshot,
+    "memory": bench_memory,
+    "sprites": bench_sprites,
+    "startup": bench_startup,
+    "sfx": bench_sfx,
+}
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+    pygame.init()
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"[BENCH] Benchmark desconocido: {name} (disponibles: {', '.join(BENCHMARKS)})")
+            continue
+        BENCHMARKS[name]()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+from itertools import chain
+
+import numpy as np
+from config import WIDTH, HEIGHT, COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Rejilla uniforme para la fase amplia de colisiones.
+    Se reconstruye cada frame con los sprites de un grupo grande (balas) y
+    luego se consulta con los sprites de grupos pequeños (boss, minions,
+    rayos, jugador): cada consulta sólo mira las celdas que toca su rect.
+
+    La reconstrucción es vectorizada: cada sprite va a la celda de su esquina
+    superior izquierda (los índices se ordenan por celda con NumPy) y las
+    consultas se amplían con el tamaño máximo de sprite para no perder nada.
+    Lo que queda fuera de la pantalla cae en las celdas del borde.
+    """
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE, width=WIDTH, height=HEIGHT):
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self._cell_ids = np.arange(self.cols * self.rows + 1)
+        self.sprites = []
+        self._empty()
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def _empty(self):
+        self.left = self.top = self.right = self.bottom = np.zeros(0, np.int32)
+        self.order = np.zeros(0, np.intp)
+        self.starts = [0] * (self.cols * self.rows + 1)
+        self.max_w = self.max_h = 0
+
+    def rebuild(self, sprites):
+        self.sprites = sprites = list(sprites)
+        if not sprites:
+            self._empty()
+            return
+
+        n = len(sprites)
+        flat = chain.from_iterable([s.rect for s in sprites])
+        rects = np.fromiter(flat, np.int32, n * 4).reshape(n, 4)
+        self.left = rects[:, 0]
+        self.top = rects[:, 1]
+        self.right = self.left + rects[:, 2]
+        self.bottom = self.top + rects[:, 3]
+        self.max_w, self.max_h = rects[:, 2:].max(axis=0).tolist()
+
+        # con las pocas decenas de sprites habituales manda el coste fijo de
+        # cada llamada de NumPy: minimum/maximum en vez de clip (mucho más
+        # lento con enteros) y searchsorted en vez de bincount + cumsum
+        cs = self.cell_size
+        cx = np.minimum(np.maximum(self.left // cs, 0), self.cols - 1)
+        cy = np.minimum(np.maximum(self.top // cs, 0), self.rows - 1)
+        keys = cy * self.cols + cx
+
+        # índices de sprites ordenados por celda + inicio de cada celda
+        self.order = np.argsort(keys, kind="stable")
+        self.starts = np.searchsorted(keys[self.order], self._cell_ids).tolist()
+
+    def query(self, rect):
+        """Sprites vivos de la rejilla cuyo rect choca con `rect`."""
+        if not self.sprites:
+            return []
+
+        cs = self.cell_size
+        cols = self.cols
+        x0 = min(max((rect.left - self.max_w) // cs, 0), cols - 1)
+        x1 = min(max((rect.right - 1) // cs, 0), cols - 1)
+        y0 = min(max((rect.top - self.max_h) // cs, 0), self.rows - 1)
+        y1 = min(max((rect.bottom - 1) // cs, 0), self.rows - 1)
+
+        # en cada fila de la rejilla las celdas x0..x1 son contiguas
+        starts = self.starts
+        slices = []
+        for cy in range(y0, y1 + 1):
+            a = starts[cy * cols + x0]
+            b = starts[cy * cols + x1 + 1]
+            if a < b:
+                slices.append(self.order[a:b])
+        if not slices:
+            return []
+        idx = slices[0] if len(slices) == 1 else np.concatenate(slices)
+
+        mask = (
+            (self.left[idx] < rect.right)
+            & (self.right[idx] > rect.left)
+            & (self.top[idx] < rect.bottom)
+            & (self.bottom[idx] > rect.top)
+        )
+        sprites = self.sprites
+        # los sprites muertos en este mismo frame siguen en la rejilla
+        hits = [sprites[i] for i in np.sort(idx[mask]).tolist()]
+        return [s for s in hits if s.alive()]
+
+    def spritecollide(self, sprite, dokill=False):
+        """Equivalente a pygame.sprite.spritecollide contra los sprites de la rejilla."""
+        hits = self.query(sprite.rect)
+        if dokill:
+            for hit in hits:
+                hit.kill()
+        return hits
+
+    def groupcollide(self, sprites, dokill=False):
+        """
+        Equivalente a pygame.sprite.groupcollide(sprites, rejilla, False, dokill):
+        dict {sprite: [sprites de la rejilla que lo tocan]} sólo con los que chocan.
+        """
+        collisions = {}
+        for sprite in sprites:
+            hits = self.spritecollide(sprite, dokill)
+            if hits:
+                collisions[sprite] = hits
+        return collisions
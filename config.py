@@ -1,22 +1,24 @@
 import pygame
 import os
 
-# Mixer antes para evitar problemas de sonido
+from fonts import LazyFont
+
+# Mixer antes para evitar problemas de sonido (pygame.init() lo hace cada
+# programa al arrancar: importar config no inicializa nada)
 try:
     pygame.mixer.pre_init(44100, -16, 2, 512)
 except Exception:
     pass
 
-pygame.init()
-
 # Tamaño ventana y FPS
 WIDTH, HEIGHT = 800, 600
 FPS = 60
 
-# Fuente estilo gótica (si no está, cae a la de sistema)
+# Fuente estilo gótica (si no está, cae a la de sistema). Se carga en el
+# primer uso y la ruta se guarda en .font_cache.json (ver fonts.py)
 GOTHIC_FONT_NAME = "Old English Text MT"
-FONT = pygame.font.SysFont(GOTHIC_FONT_NAME, 24)
-BIG_FONT = pygame.font.SysFont(GOTHIC_FONT_NAME, 48)
+FONT = LazyFont(GOTHIC_FONT_NAME, 24)
+BIG_FONT = LazyFont(GOTHIC_FONT_NAME, 48)
 
 # Colores
 BLACK  = (0, 0, 0)
@@ -30,6 +32,45 @@ PURPLE = (160, 80, 200)
 CYAN   = (80, 200, 200)
 ORANGE = (255, 160, 60)
 
+# Máximo de sprites libres guardados en cada pool (balas / minions)
+BULLET_POOL_CAP = 1024
+MINION_POOL_CAP = 256
+
+# Capacidad inicial de los arrays de balas del boss (crecen al doble si hace falta)
+ENEMY_BULLET_CAPACITY = 4096
+# A partir de cuántas balas del boss se dibujan opacas (colorkey en vez de
+# alfa por pixel: el doble de rápido, y con tantas no se nota)
+OPAQUE_BULLETS_FROM = 2000
+
+# Hitbox del jugador contra las balas del boss: None = el rect del sprite
+# (32x32, como siempre); un número = círculo de ese radio en el centro
+PLAYER_HIT_RADIUS = None
+
+# Tamaño de celda (px) de la rejilla de colisiones
+COLLISION_CELL_SIZE = 64
+
+# Frames guardados por el profiler integrado (F3 overlay, F4 CSV)
+PROFILER_FRAMES = 600
+
+# Puntos del trail de las balas del jugador
+TRAIL_LENGTH = 6
+
+# Máximo de textos renderizados guardados en la caché de ui.draw_text
+TEXT_CACHE_SIZE = 256
+
+# Modo dirty rects al arrancar (F5 lo cambia en partida)
+DIRTY_RECTS = False
+
+# Paso fijo de la lógica: ticks por segundo, independiente del dibujo.
+# Velocidades y timers de entities/game están pensados para 60 ticks/s.
+TICK_RATE = FPS
+# Límite de frames dibujados por segundo (0 = los que permita la máquina)
+RENDER_FPS = 0
+# Máximo de ticks recuperados en un frame: un frame lento no arrastra a los siguientes
+MAX_CATCHUP_TICKS = 5
+# Dibujar las posiciones interpoladas entre los dos últimos ticks
+INTERPOLATE = True
+
 # Estados del juego
 STATE_TITLE    = "TITLE"
 STATE_PLAYING  = "PLAYING"
@@ -40,5 +81,18 @@ STATE_UPGRADE  = "UPGRADE"
 # Carpeta base (para música)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Replays: cada partida guarda sus entradas en REPLAY_DIR (ver replay.py)
+RECORD_REPLAYS = True
+REPLAY_DIR = os.path.join(BASE_DIR, "replays")
+
+# Hilos que cargan música, fuentes, fondo y sprites durante el título (ver assets.py)
+ASSET_WORKERS = 4
+
+# Caché en disco del arte dibujado por código (ver sprite_cache.py)
+SPRITE_DISK_CACHE = True
+SPRITE_CACHE_DIR = os.path.join(BASE_DIR, ".sprite_cache")
+
 # Música
 MUSIC_VOLUME = 0.6
+# Volumen general de los efectos de sonido (ver sfx.py)
+SFX_VOLUME = 0.8
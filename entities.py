@@ -1,17 +1,263 @@
 import pygame
 import math
-import random
-from config import WIDTH, HEIGHT, GREEN, WHITE, BLUE, ORANGE, RED, FPS
+from config import (
+    WIDTH,
+    HEIGHT,
+    GREEN,
+    WHITE,
+    BLUE,
+    ORANGE,
+    RED,
+    FPS,
+    BULLET_POOL_CAP,
+    MINION_POOL_CAP,
+)
+from pools import PooledSprite, SpritePool
+from rng import RNG
+from sprite_cache import SPRITE_CACHE
+from patterns import PATTERNS, available_patterns
+from trajectories import accumulated_sine, linear_at, sine_at
+from trails import Trail
+
+
+# ============================================================
+# CACHÉ DE IMÁGENES COMPARTIDAS
+# ============================================================
+# Las balas, minions y el rayo especial siempre tienen el mismo aspecto
+# para un mismo tipo: se dibujan una sola vez y todas las instancias
+# comparten la misma Surface (no se debe modificar).
+
+def _build_bullet_image(kind):
+    surf = pygame.Surface((12, 12), pygame.SRCALPHA)
+
+    if kind == "wave":
+        color_outer = (150, 240, 255, 200)
+    elif kind == "spread":
+        color_outer = (255, 210, 120, 200)
+    else:
+        color_outer = (250, 230, 120, 160)
+
+    pygame.draw.circle(surf, color_outer, (6, 6), 6)
+    pygame.draw.circle(surf, (255, 255, 255, 220), (6, 6), 3)
+    return surf
+
+
+def _build_enemy_bullet_image(kind):
+    surf = pygame.Surface((10, 10), pygame.SRCALPHA)
+
+    if kind == "slow_orb":
+        base = (200, 160, 255, 230)
+    elif kind == "wave":
+        base = (255, 100, 160, 230)
+    else:
+        base = (255, 140, 60, 220)
+
+    pygame.draw.circle(surf, base, (5, 5), 5)
+    pygame.draw.circle(surf, (255, 255, 255, 230), (5, 4), 2)
+    return surf
+
+
+def _build_minion_image(variant=None):
+    surf = pygame.Surface((26, 26), pygame.SRCALPHA)
+    pygame.draw.rect(surf, (10, 10, 40), (0, 0, 26, 26), border_radius=6)
+    pygame.draw.rect(surf, (80, 80, 220), (3, 5, 20, 16), border_radius=4)
+    pygame.draw.rect(surf, (255, 255, 255), (6, 8, 4, 4), border_radius=2)
+    pygame.draw.rect(surf, (255, 255, 255), (16, 8, 4, 4), border_radius=2)
+    return surf
+
+
+def _build_special_image(variant=None):
+    surf = pygame.Surface((60, HEIGHT), pygame.SRCALPHA)
+    pygame.draw.rect(surf, (130, 0, 200, 140), (10, 0, 40, HEIGHT))
+    pygame.draw.rect(surf, (255, 255, 255, 220), (26, 0, 8, HEIGHT))
+    return surf
+
+
+def _build_player_image(variant=None):
+    surf = pygame.Surface((32, 32), pygame.SRCALPHA)
+
+    # Glow exterior
+    glow = pygame.Surface((32, 32), pygame.SRCALPHA)
+    pygame.draw.ellipse(glow, (80, 255, 140, 90), (-4, 4, 40, 26))
+    surf.blit(glow, (0, 0))
+
+    # contorno oscuro
+    pygame.draw.rect(surf, (5, 20, 5), (0, 0, 32, 32), border_radius=6)
+
+    # cuerpo principal
+    pygame.draw.rect(surf, GREEN, (3, 6, 26, 22), border_radius=6)
+
+    # pecho brillante
+    pygame.draw.rect(surf, (160, 255, 200), (10, 10, 12, 8), border_radius=4)
+
+    # ojos
+    pygame.draw.rect(surf, (230, 255, 255), (8, 18, 5, 5), border_radius=2)
+    pygame.draw.rect(surf, (230, 255, 255), (19, 18, 5, 5), border_radius=2)
+    pygame.draw.rect(surf, BLUE, (9, 19, 3, 3), border_radius=2)
+    pygame.draw.rect(surf, BLUE, (20, 19, 3, 3), border_radius=2)
+
+    # sombreado inferior
+    pygame.draw.rect(surf, (10, 50, 20), (3, 22, 26, 6), border_radius=3)
+    return surf
+
+
+def _build_boss_image(enraged=False):
+    """Boss normal o en enrage (segunda fase)."""
+    surf = pygame.Surface((160, 90), pygame.SRCALPHA)
+    if enraged:
+        pygame.draw.rect(surf, (80, 0, 0), (0, 10, 160, 70), border_radius=18)
+        pygame.draw.rect(surf, (220, 20, 20), (6, 16, 148, 58), border_radius=16)
+        pygame.draw.rect(surf, (120, 0, 0), (0, 26, 12, 40), border_radius=6)
+        pygame.draw.rect(surf, (120, 0, 0), (148, 26, 12, 40), border_radius=6)
+        pygame.draw.rect(surf, (255, 255, 255), (38, 28, 26, 16), border_radius=4)
+        pygame.draw.rect(surf, (255, 255, 255), (96, 28, 26, 16), border_radius=4)
+        pygame.draw.rect(surf, (255, 0, 0), (42, 32, 18, 6), border_radius=3)
+        pygame.draw.rect(surf, (255, 0, 0), (100, 32, 18, 6), border_radius=3)
+        pygame.draw.rect(surf, (40, 0, 0), (50, 54, 60, 10), border_radius=3)
+        for i in range(6):
+            pygame.draw.rect(surf, (255, 230, 230), (52 + i * 9, 56, 5, 6), border_radius=2)
+        return surf
+
+    # glow
+    glow = pygame.Surface((160, 90), pygame.SRCALPHA)
+    pygame.draw.ellipse(glow, (255, 80, 80, 90), (-20, 0, 200, 90))
+    surf.blit(glow, (0, 0))
+
+    # cuerpo
+    pygame.draw.rect(surf, (40, 0, 0), (0, 10, 160, 70), border_radius=18)
+    pygame.draw.rect(surf, (130, 0, 0), (6, 16, 148, 58), border_radius=16)
+
+    # cascos laterales
+    pygame.draw.rect(surf, (90, 0, 0), (0, 26, 12, 40), border_radius=6)
+    pygame.draw.rect(surf, (90, 0, 0), (148, 26, 12, 40), border_radius=6)
+
+    # ojos
+    pygame.draw.rect(surf, (250, 250, 250), (40, 32, 22, 14), border_radius=4)
+    pygame.draw.rect(surf, (250, 250, 250), (98, 32, 22, 14), border_radius=4)
+    pygame.draw.rect(surf, (255, 60, 60), (44, 36, 14, 6), border_radius=3)
+    pygame.draw.rect(surf, (255, 60, 60), (102, 36, 14, 6), border_radius=3)
+
+    # boca
+    pygame.draw.rect(surf, (30, 0, 0), (50, 54, 60, 10), border_radius=3)
+    for i in range(6):
+        pygame.draw.rect(surf, (220, 220, 220), (52 + i * 9, 56, 5, 6), border_radius=2)
+    return surf
+
+
+# Constructores del arte de cada entidad: builder(variante) -> Surface.
+# get_image los pasa por SPRITE_CACHE (caché en disco, ver sprite_cache.py).
+IMAGE_BUILDERS = {
+    "bullet": _build_bullet_image,
+    "enemy_bullet": _build_enemy_bullet_image,
+    "minion": _build_minion_image,
+    "special": _build_special_image,
+    "player": _build_player_image,
+    "boss": _build_boss_image,
+}
+
+# Todas las variantes que usa el juego (para hornearlas de antemano)
+ART_VARIANTS = {
+    "bullet": ("normal", "spread", "wave"),
+    "enemy_bullet": ("normal", "slow_orb", "wave"),
+    "minion": (None,),
+    "special": (None,),
+    "player": (None,),
+    "boss": (False, True),
+}
+
+_image_cache = {}
+
+
+def get_image(entity, variant=None):
+    """Imagen compartida para (entidad, variante), p.ej. ("enemy_bullet", "wave")."""
+    key = (entity, variant)
+    image = _image_cache.get(key)
+    if image is None:
+        image = _install_image(key, SPRITE_CACHE.bake(entity, variant, IMAGE_BUILDERS[entity]))
+    return image
+
+
+def _install_image(key, image):
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    _image_cache[key] = image
+    return image
+
+
+def bake_images():
+    """
+    Todas las imágenes de ART_VARIANTS sin convertir, {(entidad, variante): Surface}.
+    No toca la pantalla ni la caché en memoria: se puede llamar desde otro
+    hilo (assets.py) y pasar el resultado a install_images en el principal.
+    """
+    return {
+        (entity, variant): SPRITE_CACHE.bake(entity, variant, IMAGE_BUILDERS[entity])
+        for entity, variants in ART_VARIANTS.items()
+        for variant in variants
+    }
+
+
+def install_images(images):
+    """Deja en la caché de get_image las imágenes de bake_images (hilo principal)."""
+    for key, image in images.items():
+        if key not in _image_cache:
+            _install_image(key, image)
+
+
+def preload_images():
+    """Carga (o dibuja y guarda en disco) todas las imágenes de ART_VARIANTS; devuelve cuántas."""
+    count = 0
+    for entity, variants in ART_VARIANTS.items():
+        for variant in variants:
+            get_image(entity, variant)
+            count += 1
+    return count
+
+
+def clear_image_cache():
+    """Vacía la caché (p.ej. si cambia el modo de pantalla)."""
+    _image_cache.clear()
+    _flash_cache.clear()
+
+
+# Variantes "golpeadas" (flash blanco) de cada sprite, por su art_key.
+# La clave incluye el estado enrage del boss, así que sobreviven a los
+# cambios de imagen de Boss.redraw y a los Boss nuevos de cada nivel.
+FLASH_STRENGTH = 150  # 0..255, cuánto se acerca cada pixel al blanco
+
+_flash_cache = {}
+
+
+def _build_flash_image(image):
+    """Copia de la imagen aclarada hacia el blanco, respetando su alfa (silueta)."""
+    flash = image.copy()
+    keep = 255 - FLASH_STRENGTH
+    # rgb * keep/255 + FLASH_STRENGTH  ==  mezcla con blanco al FLASH_STRENGTH/255
+    flash.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+    flash.fill((FLASH_STRENGTH, FLASH_STRENGTH, FLASH_STRENGTH), special_flags=pygame.BLEND_RGB_ADD)
+    return flash
+
+
+def get_flash_image(sprite):
+    """Imagen con flash blanco del sprite (Player, Minion o Boss)."""
+    key = sprite.art_key
+    flash = _flash_cache.get(key)
+    if flash is None:
+        flash = _build_flash_image(sprite.image)
+        _flash_cache[key] = flash
+    return flash
 
 
 # ============================================================
 # JUGADOR
 # ============================================================
 class Player(pygame.sprite.Sprite):
+    # todos los jugadores se dibujan igual (clave para la caché de flash)
+    art_key = ("player", None)
+
     def __init__(self):
         super().__init__()
-        self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        self._draw_player_sprite()
+        self.image = get_image("player")
         self.rect = self.image.get_rect(center=(WIDTH // 2, HEIGHT - 80))
 
         self.base_speed = 5
@@ -31,37 +277,12 @@ class Player(pygame.sprite.Sprite):
 
         # Invencibilidad tras recibir daño (en frames)
         self.invincible = 0
+        # Ticks que quedan de flash blanco tras recibir daño
+        self.flash_timer = 0
 
         # Modo de disparo (0 = normal, 1 = triple, 2 = normal + ondas)
         self.fire_mode = 0
 
-    def _draw_player_sprite(self):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-
-        # Glow exterior
-        glow = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow, (80, 255, 140, 90), (-4, 4, 40, 26))
-        surf.blit(glow, (0, 0))
-
-        # contorno oscuro
-        pygame.draw.rect(surf, (5, 20, 5), (0, 0, 32, 32), border_radius=6)
-
-        # cuerpo principal
-        pygame.draw.rect(surf, GREEN, (3, 6, 26, 22), border_radius=6)
-
-        # pecho brillante
-        pygame.draw.rect(surf, (160, 255, 200), (10, 10, 12, 8), border_radius=4)
-
-        # ojos
-        pygame.draw.rect(surf, (230, 255, 255), (8, 18, 5, 5), border_radius=2)
-        pygame.draw.rect(surf, (230, 255, 255), (19, 18, 5, 5), border_radius=2)
-        pygame.draw.rect(surf, BLUE, (9, 19, 3, 3), border_radius=2)
-        pygame.draw.rect(surf, BLUE, (20, 19, 3, 3), border_radius=2)
-
-        # sombreado inferior
-        pygame.draw.rect(surf, (10, 50, 20), (3, 22, 26, 6), border_radius=3)
-
     def update(self, keys):
         vx, vy = 0, 0
         if keys[pygame.K_LEFT]:
@@ -126,20 +347,20 @@ class Player(pygame.sprite.Sprite):
 
         if self.fire_mode == 0:
             # Disparo normal auto-aim
-            bullets.append(Bullet(x, y, boss, self.bullet_speed, kind="normal"))
+            bullets.append(BULLET_POOL.acquire(x, y, boss, self.bullet_speed, kind="normal"))
 
         elif self.fire_mode == 1:
             # Triple disparo en abanico
             spread = 0.28  # ~16 grados
             angles = [angle_to_boss, angle_to_boss - spread, angle_to_boss + spread]
             for ang in angles:
-                bullets.append(Bullet(x, y, boss, self.bullet_speed, kind="spread", angle=ang))
+                bullets.append(BULLET_POOL.acquire(x, y, boss, self.bullet_speed, kind="spread", angle=ang))
 
         else:
             # Modo 2: una bala normal + dos ondas verticales
-            bullets.append(Bullet(x, y, boss, self.bullet_speed, kind="normal"))
-            bullets.append(Bullet(x - 8, y, None, self.bullet_speed - 1, kind="wave"))
-            bullets.append(Bullet(x + 8, y, None, self.bullet_speed - 1, kind="wave"))
+            bullets.append(BULLET_POOL.acquire(x, y, boss, self.bullet_speed, kind="normal"))
+            bullets.append(BULLET_POOL.acquire(x - 8, y, None, self.bullet_speed - 1, kind="wave"))
+            bullets.append(BULLET_POOL.acquire(x + 8, y, None, self.bullet_speed - 1, kind="wave"))
 
         return bullets
 
@@ -160,7 +381,11 @@ class Player(pygame.sprite.Sprite):
 # ============================================================
 # BALAS DEL JUGADOR
 # ============================================================
-class Bullet(pygame.sprite.Sprite):
+# Balas "wave": oscilan BULLET_WAVE_AMP px en X (0.18 rad/tick * 4)
+BULLET_WAVE_AMP = 18
+BULLET_WAVE_OMEGA = 0.72
+
+class Bullet(PooledSprite):
     """
     Bala del jugador.
     kind:
@@ -171,19 +396,24 @@ class Bullet(pygame.sprite.Sprite):
 
     def __init__(self, x, y, target_boss, speed, kind="normal", angle=None):
         super().__init__()
-        self.image = pygame.Surface((12, 12), pygame.SRCALPHA)
-        self._draw_bullet_sprite(kind)
+        self.trail = Trail()
+        self.reset(x, y, target_boss, speed, kind, angle)
+
+    def reset(self, x, y, target_boss, speed, kind="normal", angle=None):
+        self.image = get_image("bullet", kind)
         self.rect = self.image.get_rect(center=(x, y))
+        self.trail.clear()
 
         self.speed = speed
         self.kind = kind
+        # la posición se calcula desde el origen y los ticks vividos
+        self.origin = (x, y)
+        self.age = 0
 
         if kind == "wave":
             # se mueve recto hacia arriba pero oscila en X
             self.vx = 0
             self.vy = -self.speed
-            self.base_x = x
-            self.wave_t = 0.0
         elif kind == "spread":
             if angle is None:
                 if target_boss is not None:
@@ -207,77 +437,17 @@ class Bullet(pygame.sprite.Sprite):
                 self.vx = 0
                 self.vy = -self.speed
 
-    def _draw_bullet_sprite(self, kind):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-
-        if kind == "wave":
-            color_outer = (150, 240, 255, 200)
-        elif kind == "spread":
-            color_outer = (255, 210, 120, 200)
-        else:
-            color_outer = (250, 230, 120, 160)
-
-        pygame.draw.circle(surf, color_outer, (6, 6), 6)
-        pygame.draw.circle(surf, (255, 255, 255, 220), (6, 6), 3)
-
-    def update(self):
+    def position_at(self, age):
+        """Centro de la bala `age` ticks después de salir."""
+        x0, y0 = self.origin
         if self.kind == "wave":
-            self.rect.y += self.vy
-            self.wave_t += 0.18
-            self.rect.x = self.base_x + math.sin(self.wave_t * 4) * 18
-        else:
-            self.rect.x += self.vx
-            self.rect.y += self.vy
-
-        if (
-            self.rect.bottom < 0
-            or self.rect.top > HEIGHT
-            or self.rect.right < 0
-            or self.rect.left > WIDTH
-        ):
-            self.kill()
-
-
-# ============================================================
-# BALAS DEL BOSS
-# ============================================================
-class EnemyBullet(pygame.sprite.Sprite):
-    """Bala del boss."""
-
-    def __init__(self, x, y, vx, vy, kind="normal"):
-        super().__init__()
-        self.image = pygame.Surface((10, 10), pygame.SRCALPHA)
-        self._draw_enemy_bullet_sprite(kind)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.vx = vx
-        self.vy = vy
-        self.kind = kind
-        self.t = 0.0
-
-    def _draw_enemy_bullet_sprite(self, kind):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-
-        if kind == "slow_orb":
-            base = (200, 160, 255, 230)
-        elif kind == "wave":
-            base = (255, 100, 160, 230)
-        else:
-            base = (255, 140, 60, 220)
-
-        pygame.draw.circle(surf, base, (5, 5), 5)
-        pygame.draw.circle(surf, (255, 255, 255, 230), (5, 4), 2)
+            return sine_at(age, x0, y0, 0.0, self.vy, BULLET_WAVE_AMP, BULLET_WAVE_OMEGA, 0.0)
+        return linear_at(age, x0, y0, self.vx, self.vy)
 
     def update(self):
-        if self.kind == "wave":
-            # balas que bajan haciendo onda
-            self.rect.y += self.vy
-            self.t += 0.15
-            self.rect.x += math.sin(self.t * 4) * 2.5
-        else:
-            self.rect.x += self.vx
-            self.rect.y += self.vy
+        self.age += 1
+        x, y = self.position_at(self.age)
+        self.rect.center = (round(x), round(y))
 
         if (
             self.rect.bottom < 0
@@ -296,17 +466,10 @@ class SpecialAttack(pygame.sprite.Sprite):
 
     def __init__(self, x):
         super().__init__()
-        self.image = pygame.Surface((60, HEIGHT), pygame.SRCALPHA)
-        self._draw_beam()
+        self.image = get_image("special")
         self.rect = self.image.get_rect(center=(x, HEIGHT // 2))
         self.lifetime = 20  # frames
 
-    def _draw_beam(self):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-        pygame.draw.rect(surf, (130, 0, 200, 140), (10, 0, 40, HEIGHT))
-        pygame.draw.rect(surf, (255, 255, 255, 220), (26, 0, 8, HEIGHT))
-
     def update(self):
         self.lifetime -= 1
         if self.lifetime <= 0:
@@ -316,32 +479,44 @@ class SpecialAttack(pygame.sprite.Sprite):
 # ============================================================
 # ENEMIGOS PEQUEÑOS (MINIONS)
 # ============================================================
-class Minion(pygame.sprite.Sprite):
+# Vaivén de los minions: px por tick y rad/tick de la fase (0.06 * 2)
+MINION_SWAY = 1.8
+MINION_SWAY_OMEGA = 0.12
+
+class Minion(PooledSprite):
     """Enemigo pequeño con poca vida, baja desde el boss."""
 
+    art_key = ("minion", None)
+
     def __init__(self, x, y, level):
         super().__init__()
-        self.image = pygame.Surface((26, 26), pygame.SRCALPHA)
-        self._draw_minion_sprite()
+        self.reset(x, y, level)
+
+    def reset(self, x, y, level):
+        self.image = get_image("minion")
         self.rect = self.image.get_rect(center=(x, y))
 
         self.max_hp = 20 + level * 5
         self.hp = self.max_hp
         self.speed_y = 2.0 + level * 0.2
-        self.phase = random.uniform(0, math.pi * 2)
+        self.flash_timer = 0
 
-    def _draw_minion_sprite(self):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-        pygame.draw.rect(surf, (10, 10, 40), (0, 0, 26, 26), border_radius=6)
-        pygame.draw.rect(surf, (80, 80, 220), (3, 5, 20, 16), border_radius=4)
-        pygame.draw.rect(surf, (255, 255, 255), (6, 8, 4, 4), border_radius=2)
-        pygame.draw.rect(surf, (255, 255, 255), (16, 8, 4, 4), border_radius=2)
+        # baja en línea recta con un vaivén en X: en cada tick k se desplaza
+        # MINION_SWAY * sin(2 * (phase + 0.06 k)), sumado en forma cerrada
+        self.origin = (x, y)
+        self.age = 0
+        phase = RNG.minions.uniform(0, math.pi * 2)
+        self.sway_amp, self.sway_phase = accumulated_sine(MINION_SWAY, MINION_SWAY_OMEGA, 2 * phase)
+
+    def position_at(self, age):
+        """Centro del minion `age` ticks después de aparecer."""
+        x0, y0 = self.origin
+        return sine_at(age, x0, y0, 0.0, self.speed_y, self.sway_amp, MINION_SWAY_OMEGA, self.sway_phase)
 
     def update(self):
-        self.rect.y += self.speed_y
-        self.phase += 0.06
-        self.rect.x += math.sin(self.phase * 2) * 1.8
+        self.age += 1
+        x, y = self.position_at(self.age)
+        self.rect.center = (round(x), round(y))
 
         if self.rect.top > HEIGHT + 40:
             self.kill()
@@ -353,9 +528,9 @@ class Minion(pygame.sprite.Sprite):
 class Boss(pygame.sprite.Sprite):
     def __init__(self, level):
         super().__init__()
-        self.image = pygame.Surface((160, 90), pygame.SRCALPHA)
         self.level = level
-        self._draw_boss_sprite()
+        self.enraged = False
+        self.image = get_image("boss", self.enraged)
         self.rect = self.image.get_rect(center=(WIDTH // 2, 100))
 
         self.max_hp = 120 + level * 50
@@ -366,52 +541,19 @@ class Boss(pygame.sprite.Sprite):
 
         self.pattern_time = 0
         self.pattern_duration = FPS * 3
-        self.current_pattern = 0  # 0,1,2,3
-        self.enraged = False
+        self.current_pattern = 0  # índice en patterns.PATTERNS
         self.spin_angle = 0.0  # para patrón radial
+        self.age = 0  # ticks vividos (para el flotado)
+        self.flash_timer = 0  # ticks de flash blanco tras recibir daño
 
-    def _draw_boss_sprite(self):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-
-        # glow
-        glow = pygame.Surface((160, 90), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow, (255, 80, 80, 90), (-20, 0, 200, 90))
-        surf.blit(glow, (0, 0))
-
-        # cuerpo
-        pygame.draw.rect(surf, (40, 0, 0), (0, 10, 160, 70), border_radius=18)
-        pygame.draw.rect(surf, (130, 0, 0), (6, 16, 148, 58), border_radius=16)
-
-        # cascos laterales
-        pygame.draw.rect(surf, (90, 0, 0), (0, 26, 12, 40), border_radius=6)
-        pygame.draw.rect(surf, (90, 0, 0), (148, 26, 12, 40), border_radius=6)
+    @property
+    def art_key(self):
+        # el aspecto del boss sólo cambia con el enrage
+        return ("boss", self.enraged)
 
-        # ojos
-        pygame.draw.rect(surf, (250, 250, 250), (40, 32, 22, 14), border_radius=4)
-        pygame.draw.rect(surf, (250, 250, 250), (98, 32, 22, 14), border_radius=4)
-        pygame.draw.rect(surf, (255, 60, 60), (44, 36, 14, 6), border_radius=3)
-        pygame.draw.rect(surf, (255, 60, 60), (102, 36, 14, 6), border_radius=3)
-
-        # boca
-        pygame.draw.rect(surf, (30, 0, 0), (50, 54, 60, 10), border_radius=3)
-        for i in range(6):
-            pygame.draw.rect(surf, (220, 220, 220), (52 + i * 9, 56, 5, 6), border_radius=2)
-
-    def _draw_enraged_sprite(self):
-        surf = self.image
-        surf.fill((0, 0, 0, 0))
-        pygame.draw.rect(surf, (80, 0, 0), (0, 10, 160, 70), border_radius=18)
-        pygame.draw.rect(surf, (220, 20, 20), (6, 16, 148, 58), border_radius=16)
-        pygame.draw.rect(surf, (120, 0, 0), (0, 26, 12, 40), border_radius=6)
-        pygame.draw.rect(surf, (120, 0, 0), (148, 26, 12, 40), border_radius=6)
-        pygame.draw.rect(surf, (255, 255, 255), (38, 28, 26, 16), border_radius=4)
-        pygame.draw.rect(surf, (255, 255, 255), (96, 28, 26, 16), border_radius=4)
-        pygame.draw.rect(surf, (255, 0, 0), (42, 32, 18, 6), border_radius=3)
-        pygame.draw.rect(surf, (255, 0, 0), (100, 32, 18, 6), border_radius=3)
-        pygame.draw.rect(surf, (40, 0, 0), (50, 54, 60, 10), border_radius=3)
-        for i in range(6):
-            pygame.draw.rect(surf, (255, 230, 230), (52 + i * 9, 56, 5, 6), border_radius=2)
+    def redraw(self):
+        """Cambia el sprite al de la fase actual (normal o enrage)."""
+        self.image = get_image("boss", self.enraged)
 
     def update(self):
         # movimiento horizontal
@@ -419,8 +561,9 @@ class Boss(pygame.sprite.Sprite):
         if self.rect.left <= 0 or self.rect.right >= WIDTH:
             self.speed_x *= -1
 
-        # flotando un poquito
-        self.rect.y = 100 + int(10 * math.sin(pygame.time.get_ticks() * 0.002))
+        # flotando un poquito (por ticks de juego, no por reloj real)
+        self.age += 1
+        self.rect.y = 100 + int(10 * math.sin(self.age * 2.0 / FPS))
 
         # enrage: segunda fase cuando baja al 50%
         if not self.enraged and self.hp <= self.max_hp * 0.5:
@@ -428,72 +571,37 @@ class Boss(pygame.sprite.Sprite):
             self.speed_x *= 1.5
             self.shoot_interval = max(int(self.shoot_interval * 0.6), 5)
             self.pattern_duration = int(self.pattern_duration * 0.7)
-            self._draw_enraged_sprite()
+            self.redraw()
 
         self.pattern_time += 1
         if self.pattern_time >= self.pattern_duration:
             self.pattern_time = 0
-            patterns = [0, 1, 2, 3]
-            patterns.remove(self.current_pattern)
-            self.current_pattern = random.choice(patterns)
+            patterns = available_patterns(self.level, self.enraged)
+            if self.current_pattern in patterns and len(patterns) > 1:
+                patterns.remove(self.current_pattern)
+            self.current_pattern = RNG.boss.choice(patterns)
 
         if self.shoot_timer > 0:
             self.shoot_timer -= 1
 
-    def maybe_shoot(self, player, enemy_bullets_group, minions_group):
-        """Dispara según el patrón actual o invoca minions."""
+    def maybe_shoot(self, player, enemy_bullets, minions_group):
+        """Dispara según el patrón actual (a enemy_bullets, un ProjectileField) o invoca minions."""
         if self.shoot_timer > 0:
             return
 
-        self.shoot_timer = self.shoot_interval
-
-        # Patrón 0: ráfaga dirigida (triple shot)
-        if self.current_pattern == 0 and player is not None:
-            speeds = [5, 5, 5]
-            offsets = [0, -30, 30]
-            for offset, spd in zip(offsets, speeds):
-                px, py = player.rect.center
-                sx = self.rect.centerx + offset
-                sy = self.rect.bottom
-                dx = px - sx
-                dy = py - sy
-                dist = math.hypot(dx, dy)
-                if dist == 0:
-                    dist = 1
-                vx = dx / dist * spd
-                vy = dy / dist * spd
-                bullet = EnemyBullet(sx, sy, vx, vy, kind="normal")
-                enemy_bullets_group.add(bullet)
-
-        # Patrón 1: pared de orbes lentos que bajan recto
-        elif self.current_pattern == 1:
-            num = 9
-            margin = 80
-            span = WIDTH - margin * 2
-            for i in range(num):
-                x = margin + int(span * (i / (num - 1)))
-                y = self.rect.bottom
-                bullet = EnemyBullet(x, y, 0, 3.0, kind="slow_orb")
-                enemy_bullets_group.add(bullet)
-
-        # Patrón 2: círculo radial giratorio
-        elif self.current_pattern == 2:
-            num_bullets = 14
-            speed = 4.0
-            self.spin_angle += 0.3  # gira un poco cada ráfaga
-            for i in range(num_bullets):
-                angle = self.spin_angle + (2 * math.pi / num_bullets) * i
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
-                bullet = EnemyBullet(self.rect.centerx, self.rect.centery, vx, vy, kind="wave")
-                enemy_bullets_group.add(bullet)
-
-        # Patrón 3: invoca minions pequeños
-        elif self.current_pattern == 3:
-            offsets = [-80, 0, 80]
-            for off in offsets:
-                mx = self.rect.centerx + off
-                my = self.rect.bottom + 10
-                if 20 < mx < WIDTH - 20:
-                    minion = Minion(mx, my, self.level)
-                    minions_group.add(minion)
+        pattern = PATTERNS[self.current_pattern]
+        self.shoot_timer = max(1, int(self.shoot_interval * pattern.cadence))
+
+        def summon(x, y):
+            minions_group.add(MINION_POOL.acquire(x, y, self.level))
+
+        pattern.fire(self, player, enemy_bullets, summon)
+
+
+# ============================================================
+# POOLS DE SPRITES RECICLABLES
+# ============================================================
+# Las balas del jugador y los minions muertos (kill) vuelven aquí y se
+# reutilizan. Las balas del boss viven en arrays (projectiles.ProjectileField).
+BULLET_POOL = SpritePool(Bullet, BULLET_POOL_CAP)
+MINION_POOL = SpritePool(Minion, MINION_POOL_CAP)
@@ -0,0 +1,155 @@
+"""
+Fuentes resueltas bajo demanda. pygame.font.SysFont recorre la lista de
+fuentes del sistema (en Linux lanza fc-list), y eso se pagaba al importar
+config. Ahora:
+    - config.FONT / BIG_FONT son LazyFont: no se carga nada hasta el
+      primer render/size/get_linesize.
+    - el fichero de cada nombre de fuente se guarda en FONT_CACHE_PATH, así
+      que en los arranques siguientes ni siquiera se busca.
+    - FONTS comparte un pygame.font.Font por (nombre, tamaño).
+
+Uso:
+    python fonts.py            -> resuelve las fuentes de config y muestra la caché
+    python fonts.py --clear    -> borra la caché de rutas
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+import pygame
+
+# Junto al código, como las demás cachés (no se importa config: config importa este módulo)
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".font_cache.json")
+
+
+class FontRegistry:
+    """
+    get(nombre, tamaño) devuelve el pygame.font.Font compartido. El nombre
+    se resuelve a un fichero con pygame.font.match_font (o la fuente por
+    defecto si no existe, como SysFont) y la ruta se guarda en disco.
+    nombre None es la fuente por defecto de pygame.
+    """
+
+    def __init__(self, cache_path=FONT_CACHE_PATH):
+        self.cache_path = cache_path
+        self._fonts = {}
+        self._paths = None  # nombre -> ruta (o None); se lee del disco al primer uso
+        self.scans = 0  # nombres que hubo que buscar en el sistema
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def get(self, name, size):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            # assets.py carga las fuentes en otro hilo: una sola búsqueda por nombre
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    if not pygame.font.get_init():
+                        pygame.font.init()
+                    path = self.resolve(name) if name is not None else None
+                    font = pygame.font.Font(path, size)
+                    self._fonts[key] = font
+        return font
+
+    def resolve(self, name):
+        """Ruta del fichero de la fuente `name`, o None si no está instalada."""
+        if self._paths is None:
+            self._paths = self._load()
+        if name in self._paths:
+            return self._paths[name]
+        self.scans += 1
+        path = pygame.font.match_font(name)
+        self._paths[name] = path
+        self._save()
+        return path
+
+    def _load(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("pygame") != pygame.version.ver:
+            return {}
+        paths = data.get("fonts", {})
+        # una fuente desinstalada desde la última vez se vuelve a buscar
+        return {name: path for name, path in paths.items() if path is None or os.path.isfile(path)}
+
+    def _save(self):
+        data = {"pygame": pygame.version.ver, "fonts": self._paths}
+        tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            if not self._warned:
+                print(f"[FONTS] No se puede escribir la caché en {self.cache_path}: {e}")
+                self._warned = True
+
+    def clear(self):
+        """Olvida fuentes y rutas y borra la caché del disco."""
+        self._fonts.clear()
+        self._paths = {}
+        try:
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+
+
+# Registro compartido por todo el juego
+FONTS = FontRegistry()
+
+
+class LazyFont:
+    """
+    Se comporta como el pygame.font.Font de FONTS.get(name, size), pero no
+    lo carga hasta que se usa por primera vez. (Los atributos no se llaman
+    name/size: size() es un método de Font.)
+    """
+
+    __slots__ = ("font_name", "point_size", "_font")
+
+    def __init__(self, name, size):
+        self.font_name = name
+        self.point_size = size
+        self._font = None
+
+    @property
+    def font(self):
+        if self._font is None:
+            self._font = FONTS.get(self.font_name, self.point_size)
+        return self._font
+
+    def __getattr__(self, attr):
+        # sólo llega aquí lo que no es de LazyFont: render, size(), get_linesize...
+        return getattr(self.font, attr)
+
+    def __repr__(self):
+        state = "cargada" if self._font is not None else "sin cargar"
+        return f"LazyFont({self.font_name!r}, {self.point_size}, {state})"
+
+
+def main(argv=None):
+    args = argv if argv is not None else sys.argv[1:]
+    if "--clear" in args:
+        FONTS.clear()
+        print(f"[FONTS] Caché borrada: {FONTS.cache_path}")
+        return
+
+    from config import FONT, BIG_FONT
+
+    start = time.perf_counter()
+    for font in (FONT, BIG_FONT):
+        font.font
+    ms = (time.perf_counter() - start) * 1000.0
+    print(f"[FONTS] {FONT.font_name!r} resuelta en {ms:.2f} ms (búsquedas en el sistema: {FONTS.scans}) "
+          f"-> {FONTS.resolve(FONT.font_name) or 'fuente por defecto'}")
+
+
+if __name__ == "__main__":
+    main()
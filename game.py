@@ -0,0 +1,367 @@
+import pygame
+
+from config import (
+    FPS,
+    PLAYER_HIT_RADIUS,
+    STATE_TITLE,
+    STATE_PLAYING,
+    STATE_GAME_OVER,
+    STATE_UPGRADE,
+)
+from entities import Player, Boss
+from pools import recycle_group
+from collision import SpatialHash
+from projectiles import ProjectileField
+from upgrades import get_upgrade_options
+from profiler import PROFILER
+from rng import RNG, new_seed, check_seed
+from trails import update_trails
+
+
+# ============================================================
+# ENTRADA DE UN TICK
+# ============================================================
+# Cada acción del jugador es un bit; un tick de entrada es un entero.
+IN_LEFT = 1 << 0
+IN_RIGHT = 1 << 1
+IN_UP = 1 << 2
+IN_DOWN = 1 << 3
+IN_SLOW = 1 << 4
+IN_FAST = 1 << 5
+IN_SHOOT = 1 << 6
+IN_SPECIAL = 1 << 7  # se pulsó X en este tick (flanco, no mantenido)
+
+# Teclas de pygame -> bit de entrada
+KEY_BITS = {
+    pygame.K_LEFT: IN_LEFT,
+    pygame.K_RIGHT: IN_RIGHT,
+    pygame.K_UP: IN_UP,
+    pygame.K_DOWN: IN_DOWN,
+    pygame.K_LSHIFT: IN_SLOW,
+    pygame.K_RSHIFT: IN_SLOW,
+    pygame.K_LCTRL: IN_FAST,
+    pygame.K_RCTRL: IN_FAST,
+    pygame.K_z: IN_SHOOT,
+}
+
+
+class InputSnapshot:
+    """
+    Estado de los controles en un tick, como máscara de bits.
+    Se puede indexar con teclas de pygame igual que key.get_pressed(),
+    así Player.update funciona igual con teclado real, bots o replays.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+    def __contains__(self, bit):
+        return bool(self.mask & bit)
+
+    @classmethod
+    def from_keys(cls, keys, special=False):
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if keys[key]:
+                mask |= bit
+        if special:
+            mask |= IN_SPECIAL
+        return cls(mask)
+
+
+# ============================================================
+# ESTADO DE LA PARTIDA
+# ============================================================
+class GameState:
+    """
+    Todo el estado de la lógica del juego, sin nada de dibujo.
+    step() avanza un tick de PLAYING a partir de un InputSnapshot.
+    """
+
+    def __init__(self):
+        self.state = STATE_TITLE
+        self.level = 1
+        self.score = 0
+        self.tick = 0
+        # semilla de la partida actual (ver rng.py): con ella y las mismas
+        # entradas la partida se repite igual
+        self.seed = None
+
+        # Intensidad actual de temblor de cámara y offset de este tick
+        self.shake = 0
+        self.shake_offset = (0, 0)
+
+        self.player = None
+        self.boss = None
+        self.bullets_group = pygame.sprite.Group()
+        # balas del boss: arrays de NumPy, no sprites
+        self.enemy_bullets = ProjectileField()
+        self.special_group = pygame.sprite.Group()
+        self.minions_group = pygame.sprite.Group()
+
+        # Rejillas de colisión (se reconstruyen cada tick)
+        self.bullet_grid = SpatialHash()
+        self.minion_grid = SpatialHash()
+
+        # Sistema de mejoras
+        self.upgrade_options = []
+
+        # Posición (topleft) de cada sprite antes del último tick, para dibujar
+        # interpolando entre ticks (ver save_positions)
+        self.prev_positions = {}
+
+        # Los trails de las balas sólo se ven: las simulaciones sin dibujo
+        # (balance.py) los desactivan
+        self.trails = True
+
+        # Eventos de sonido desde la última take_sound_events: {categoría de
+        # sfx.SFX_CATEGORIES: veces}. La lógica no reproduce nada.
+        self.sound_events = {}
+
+    def groups(self):
+        return (self.bullets_group, self.special_group, self.minions_group)
+
+    # -------------------------------------------------
+    # TRANSICIONES
+    # -------------------------------------------------
+    def start_new_game(self, seed=None):
+        """Empieza una partida con la semilla `seed` (una nueva si es None; ver rng.check_seed)."""
+        if seed is None:
+            seed = new_seed()
+        self.seed = check_seed(seed)
+        RNG.seed(seed)
+
+        self.level = 1
+        self.score = 0
+        self.shake = 0
+        self.shake_offset = (0, 0)
+        self.tick = 0
+
+        self.player = Player()
+        self.boss = Boss(self.level)
+
+        # las balas/minions de la partida anterior vuelven a sus pools
+        for group in self.groups():
+            recycle_group(group)
+        self.enemy_bullets.clear()
+        self.prev_positions = {}
+        self.sound_events = {}
+
+        self.state = STATE_PLAYING
+
+    def next_level(self):
+        self.level += 1
+        self.shake = 0
+
+        # Mejorar el modo de disparo del jugador según el nivel
+        if self.player is not None:
+            # 1 -> triple; 2 -> ondas + normal
+            self.player.fire_mode = min(2, self.level - 1)
+
+        self.upgrade_options = get_upgrade_options(self.player)
+        self.state = STATE_UPGRADE
+
+        for group in self.groups():
+            recycle_group(group)
+        self.enemy_bullets.clear()
+        self.prev_positions = {}
+
+    def choose_upgrade(self, idx):
+        """Aplica la mejora `idx` de upgrade_options y lanza el boss del nivel."""
+        chosen_upgrade = self.upgrade_options[idx]
+        chosen_upgrade["apply"](self.player)
+        self.boss = Boss(self.level)
+        self.state = STATE_PLAYING
+
+    def sound(self, name, count=1):
+        events = self.sound_events
+        events[name] = events.get(name, 0) + count
+
+    def take_sound_events(self):
+        """Eventos de sonido acumulados (de todos los ticks del frame); los vacía."""
+        events = self.sound_events
+        self.sound_events = {}
+        return events
+
+    # -------------------------------------------------
+    # UN TICK DE LÓGICA
+    # -------------------------------------------------
+    def step(self, inp):
+        """Avanza un tick de juego (sólo en PLAYING). No dibuja nada."""
+        if self.state != STATE_PLAYING:
+            return
+        self.update(inp)
+        with PROFILER.phase("collisions"):
+            self.collide()
+        self.tick_timers()
+
+    def step_frame(self, inputs, recorder=None, interpolate=False):
+        """
+        Los ticks de un frame (un InputSnapshot por tick), grabando cada uno
+        en `recorder` si lo hay. Se para en cuanto la partida sale de PLAYING
+        (boss muerto, muerte): los ticks que quedan no se juegan ni se graban,
+        o el replay pondría la mejora en otro tick. Con `interpolate` guarda
+        las posiciones antes del último tick. Devuelve los ticks jugados.
+        """
+        last = len(inputs) - 1
+        for i, inp in enumerate(inputs):
+            if self.state != STATE_PLAYING:
+                return i
+            if interpolate and i == last:
+                self.save_positions()
+            if recorder is not None:
+                recorder.record_tick(inp.mask)
+            self.step(inp)
+        return len(inputs)
+
+    def save_positions(self):
+        """Guarda las posiciones actuales como las del tick anterior (antes de step)."""
+        prev = {}
+        for sprite in (self.player, self.boss):
+            if sprite is not None:
+                prev[sprite] = sprite.rect.topleft
+        for group in self.groups():
+            for sprite in group:
+                prev[sprite] = sprite.rect.topleft
+        self.prev_positions = prev
+        self.enemy_bullets.save_positions()
+
+    def update(self, inp):
+        """Movimiento, disparos y trails de un tick (primera fase de step)."""
+        player = self.player
+        boss = self.boss
+        bullets_group = self.bullets_group
+        enemy_bullets = self.enemy_bullets
+        special_group = self.special_group
+        minions_group = self.minions_group
+        self.tick += 1
+
+        # Screen shake: calcular offset de la cámara
+        if self.shake > 0:
+            shake = self.shake
+            rng = RNG.shake
+            self.shake_offset = (rng.randint(-shake, shake), rng.randint(-shake, shake))
+            # el temblor se va reduciendo
+            self.shake = max(0, shake - 1)
+        else:
+            self.shake_offset = (0, 0)
+
+        with PROFILER.phase("player_boss"):
+            # --- Player ---
+            if player is not None:
+                # Poder especial
+                if IN_SPECIAL in inp and player.can_use_special():
+                    player.use_special(special_group)
+                    self.sound("laser")
+
+                player.update(inp)
+                if inp[pygame.K_z] and player.can_shoot():
+                    bullets_group.add(*player.shoot(boss))
+                    self.sound("shot")
+
+            # --- Boss y disparos ---
+            if boss is not None:
+                boss.update()
+                fired = len(enemy_bullets)
+                boss.maybe_shoot(player, enemy_bullets, minions_group)
+                if len(enemy_bullets) > fired:
+                    self.sound("boss_shot", len(enemy_bullets) - fired)
+
+        with PROFILER.phase("groups"):
+            bullets_group.update()
+            enemy_bullets.update()
+            special_group.update()
+            minions_group.update()
+
+            # Actualizamos trail de balas del jugador
+            if self.trails:
+                update_trails(bullets_group)
+
+    def collide(self):
+        """Colisiones y sus consecuencias: daño, puntos, nivel (segunda fase de step)."""
+        player = self.player
+        boss = self.boss
+
+        # --- Fase amplia: rejillas con las posiciones de este tick ---
+        self.bullet_grid.rebuild(self.bullets_group)
+        self.minion_grid.rebuild(self.minions_group)
+
+        # --- Colisiones con boss ---
+        if boss is not None:
+            hits_on_boss = self.bullet_grid.spritecollide(boss, True)
+            if hits_on_boss:
+                boss.hp -= player.bullet_damage * len(hits_on_boss)
+                self.score += 10 * len(hits_on_boss)
+                boss.flash_timer = 6
+                self.shake = min(self.shake + 3, 14)
+                self.sound("boss_hit", len(hits_on_boss))
+
+            hits_special_on_boss = pygame.sprite.spritecollide(boss, self.special_group, False)
+            if hits_special_on_boss:
+                boss.hp -= 4 * len(hits_special_on_boss)
+                self.score += 4 * len(hits_special_on_boss)
+                boss.flash_timer = 4
+                self.shake = min(self.shake + 2, 14)
+
+        # Láser limpia balas enemigas
+        for beam in self.special_group:
+            self.enemy_bullets.collide_rect(beam.rect)
+
+        # --- Balas del jugador contra minions ---
+        for minion, hits in self.bullet_grid.groupcollide(self.minions_group, True).items():
+            minion.hp -= player.bullet_damage * len(hits)
+            minion.flash_timer = 6
+            self.shake = min(self.shake + 2, 12)
+            if minion.hp <= 0:
+                minion.kill()
+                self.score += 50  # recompensa por minion
+                self.sound("minion_death")
+
+        # --- Boss muerto, pasar de nivel ---
+        if boss is not None and boss.hp <= 0:
+            self.score += 200 * self.level  # bonus por matar al boss
+            self.next_level()
+
+        # --- Daño al jugador ---
+        if player is not None:
+            # Balas del boss (las que tocan desaparecen aunque sea invencible)
+            if PLAYER_HIT_RADIUS is None:
+                hits_on_player = self.enemy_bullets.collide_rect(player.rect)
+            else:
+                cx, cy = player.rect.center
+                hits_on_player = self.enemy_bullets.collide_circle(cx, cy, PLAYER_HIT_RADIUS)
+            if player.invincible <= 0:
+                if hits_on_player:
+                    player.hp -= 10 * hits_on_player
+                    player.invincible = FPS  # ~1 segundo invencible
+                    player.flash_timer = 10
+                    self.shake = min(self.shake + 6, 18)
+                    self.sound("player_hit")
+
+            # Choque con minions
+            hits_minions_player = self.minion_grid.spritecollide(player, False)
+            if hits_minions_player and player.invincible <= 0:
+                player.hp -= 20
+                player.invincible = FPS
+                player.flash_timer = 12
+                self.shake = min(self.shake + 8, 20)
+                self.sound("player_hit")
+                for m in hits_minions_player:
+                    m.kill()
+
+            if player.hp <= 0:
+                self.state = STATE_GAME_OVER
+
+    def tick_timers(self):
+        """Reduce los timers de flash (última fase de step)."""
+        for obj in (self.boss, self.player):
+            if obj is not None and obj.flash_timer > 0:
+                obj.flash_timer -= 1
+        for minion in self.minions_group:
+            if minion.flash_timer > 0:
+                minion.flash_timer -= 1
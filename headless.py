@@ -0,0 +1,108 @@
+"""
+Simulación sin ventana y sin límite de FPS (driver "dummy" de SDL).
+Sirve para pruebas de carga, barridos de equilibrio y medir tiempos en CI.
+
+Uso:
+    python headless.py --ticks 36000 --seed 1
+    python headless.py --seed 1 --record bot.rpl   -> guarda el replay (ver replay.py)
+"""
+import os
+
+# Sin ventana ni audio: tiene que ir antes de importar pygame/config
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import time
+
+from config import FPS, STATE_GAME_OVER, STATE_UPGRADE
+from game import (
+    GameState,
+    InputSnapshot,
+    IN_LEFT,
+    IN_RIGHT,
+    IN_SHOOT,
+    IN_SPECIAL,
+)
+from rng import RNG
+from replay import ReplayRecorder
+
+
+def default_policy(game):
+    """Bot sencillo: dispara siempre, usa X cuando puede y sigue al boss en X."""
+    player = game.player
+    boss = game.boss
+    mask = IN_SHOOT
+    if player.can_use_special() and game.tick % FPS == 0:
+        mask |= IN_SPECIAL
+    if boss is not None:
+        if boss.rect.centerx < player.rect.centerx - 20:
+            mask |= IN_LEFT
+        elif boss.rect.centerx > player.rect.centerx + 20:
+            mask |= IN_RIGHT
+    return mask
+
+
+def first_upgrade(game):
+    return 0
+
+
+def run(ticks, policy=default_policy, choose_upgrade=first_upgrade, seed=None, game=None, recorder=None):
+    """
+    Simula hasta `ticks` ticks de juego lo más rápido posible.
+    policy(game) -> máscara de bits de entrada; choose_upgrade(game) -> índice.
+    Sin `game` se empieza una partida con `seed` (una semilla nueva si es
+    None). Con `recorder` (ReplayRecorder) se graban entradas y mejoras.
+    Termina antes si el jugador muere. Devuelve (game, ticks simulados).
+    """
+    if game is None:
+        game = GameState()
+        game.start_new_game(seed)
+    elif seed is not None:
+        RNG.seed(seed)
+
+    done = 0
+    while done < ticks:
+        if game.state == STATE_UPGRADE:
+            idx = choose_upgrade(game)
+            if recorder is not None:
+                recorder.record_upgrade(idx)
+            game.choose_upgrade(idx)
+        elif game.state == STATE_GAME_OVER:
+            break
+        mask = policy(game)
+        if recorder is not None:
+            recorder.record_tick(mask)
+        game.step(InputSnapshot(mask))
+        done += 1
+    return game, done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación headless sin límite de FPS")
+    parser.add_argument("--ticks", type=int, default=FPS * 60 * 5, help="ticks a simular (por defecto 5 min)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--record", metavar="PATH", help="guardar la partida como replay")
+    args = parser.parse_args(argv)
+
+    game = GameState()
+    try:
+        game.start_new_game(args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    recorder = ReplayRecorder(game.seed) if args.record else None
+
+    start = time.perf_counter()
+    game, done = run(args.ticks, game=game, recorder=recorder)
+    elapsed = time.perf_counter() - start
+    if recorder is not None:
+        recorder.save(args.record, game)
+
+    rate = done / elapsed if elapsed > 0 else float("inf")
+    print(f"[HEADLESS] {done} ticks en {elapsed:.2f} s ({rate:.0f} ticks/s, x{rate / FPS:.1f} tiempo real)")
+    print(f"[HEADLESS] semilla={game.seed} estado={game.state} nivel={game.level} score={game.score} "
+          f"pv={game.player.hp}/{game.player.max_hp}")
+
+
+if __name__ == "__main__":
+    main()
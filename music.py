@@ -6,34 +6,63 @@ music_muted = False
 music_paused = False
 
 
-def start_music():
+def init_mixer():
+    """Inicializa el mixer si hace falta (en el hilo principal); devuelve si hay audio."""
+    if pygame.mixer.get_init():
+        return True
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"[MUSICA] Sin audio: {e}")
+        return False
+    return True
+
+
+def load_music():
+    """
+    Busca y carga la pista (sin reproducirla); devuelve su ruta o None.
+    No inicializa el mixer (ver init_mixer): se puede llamar desde otro hilo.
+    """
+    if not pygame.mixer.get_init():
+        return None
+
+    music_paths = [
+        os.path.join(BASE_DIR, "music_8bit.ogg"),
+        os.path.join(BASE_DIR, "music_8bit.mp3"),
+    ]
+
+    for path in music_paths:
+        if os.path.exists(path):
+            pygame.mixer.music.load(path)
+            return path
+
+    print("[MUSICA] No se encontró music_8bit.ogg ni music_8bit.mp3 en la carpeta del juego.")
+    return None
+
+
+def play_music(path):
+    """Reproduce en bucle la pista ya cargada por load_music."""
     global music_muted, music_paused
     music_muted = False
     music_paused = False
+    if path is None:
+        return
     try:
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-
-        music_paths = [
-            os.path.join(BASE_DIR, "music_8bit.ogg"),
-            os.path.join(BASE_DIR, "music_8bit.mp3"),
-        ]
-
-        loaded = False
-        for path in music_paths:
-            if os.path.exists(path):
-                pygame.mixer.music.load(path)
-                pygame.mixer.music.set_volume(MUSIC_VOLUME)
-                pygame.mixer.music.play(-1)  # loop infinito
-                print(f"[MUSICA] Reproduciendo: {path}")
-                loaded = True
-                break
-
-        if not loaded:
-            print("[MUSICA] No se encontró music_8bit.ogg ni music_8bit.mp3 en la carpeta del juego.")
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+        pygame.mixer.music.play(-1)  # loop infinito
+        print(f"[MUSICA] Reproduciendo: {path}")
+    except Exception as e:
+        print(f"[MUSICA] Error al iniciar la música: {e}")
+
 
+def start_music():
+    init_mixer()
+    try:
+        path = load_music()
     except Exception as e:
         print(f"[MUSICA] Error al iniciar la música: {e}")
+        path = None
+    play_music(path)
 
 
 def toggle_mute_music():
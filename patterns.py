@@ -0,0 +1,172 @@
+import math
+
+import numpy as np
+
+from config import WIDTH
+
+
+# ============================================================
+# PATRONES DEL BOSS (DATOS)
+# ============================================================
+# Cada patrón es un dict:
+#   emitter    -> "aimed" (balas dirigidas al jugador desde varios cañones),
+#                 "fan" (abanico centrado en el jugador), "wall" (fila de
+#                 balas que bajan recto), "radial" (círculo que gira en cada
+#                 ráfaga) o "summon" (minions)
+#   count      -> balas por ráfaga (fan, wall, radial)
+#   offsets    -> desplazamientos en X de cada cañón / minion (aimed, summon)
+#   spread     -> apertura total del abanico en radianes (fan)
+#   margin     -> margen a cada lado de la pantalla (wall)
+#   speed      -> px por tick
+#   spin       -> giro del círculo en cada ráfaga, radianes (radial)
+#   kind       -> tipo de bala ("normal", "slow_orb", "wave")
+#   path       -> trayectoria de las balas: "linear" (por defecto), "spiral"
+#                 (radial: giran alrededor del punto de salida mientras se
+#                 alejan) u "homing" (aimed/fan: giran hacia el jugador)
+#   orbit      -> rad/tick de giro de la espiral (path "spiral")
+#   turn       -> giro máximo en rad/tick (path "homing")
+#   cadence    -> multiplica el shoot_interval del boss (1 = normal)
+#   min_level  -> nivel a partir del cual el boss puede elegirlo
+#   enraged    -> True si sólo aparece en la segunda fase (enrage)
+# El índice en la tupla es el valor de Boss.current_pattern.
+BOSS_PATTERNS = (
+    # 0: ráfaga dirigida (triple shot)
+    {"emitter": "aimed", "offsets": (0, -30, 30), "speed": 5, "kind": "normal"},
+    # 1: pared de orbes lentos que bajan recto
+    {"emitter": "wall", "count": 9, "margin": 80, "speed": 3.0, "kind": "slow_orb"},
+    # 2: círculo radial giratorio
+    {"emitter": "radial", "count": 14, "speed": 4.0, "spin": 0.3, "kind": "wave"},
+    # 3: invoca minions pequeños
+    {"emitter": "summon", "offsets": (-80, 0, 80)},
+)
+
+# Patrones de demostración: el boss no los usa (cambiarían la dificultad de
+# la partida); sólo los dispara bench.py para medir el motor con ellos.
+SHOWCASE_PATTERNS = (
+    # abanico hacia el jugador
+    {"emitter": "fan", "count": 7, "spread": 0.9, "speed": 4.5, "kind": "normal", "min_level": 3},
+    # espiral densa, sólo en enrage
+    {
+        "emitter": "radial", "count": 24, "speed": 3.5, "spin": 0.17, "kind": "normal",
+        "cadence": 0.5, "min_level": 5, "enraged": True,
+    },
+    # anillo de orbes que se abre en espiral (ProjectileField.spawn_path)
+    {
+        "emitter": "radial", "count": 12, "speed": 2.2, "spin": 0.25, "kind": "slow_orb",
+        "path": "spiral", "orbit": 0.025, "min_level": 4,
+    },
+    # abanico abierto que se curva hacia el jugador (ProjectileField.spawn_homing)
+    {
+        "emitter": "fan", "count": 6, "spread": 2.6, "speed": 3.5, "kind": "wave",
+        "path": "homing", "turn": 0.035, "min_level": 6,
+    },
+)
+
+
+class Pattern:
+    """
+    Patrón compilado: las direcciones y posiciones que no dependen del
+    momento del disparo se calculan una sola vez en tablas de NumPy, y
+    cada ráfaga sólo las rota/traslada y las añade con spawn_many.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.emitter = spec["emitter"]
+        self.speed = spec.get("speed", 0.0)
+        self.kind = spec.get("kind", "normal")
+        self.cadence = spec.get("cadence", 1.0)
+        self.min_level = spec.get("min_level", 1)
+        self.enraged_only = spec.get("enraged", False)
+        self.spin = spec.get("spin", 0.0)
+        self.path = spec.get("path", "linear")
+        self.orbit = spec.get("orbit", 0.0)
+        self.turn = spec.get("turn", 0.0)
+
+        self.offsets = np.array(spec.get("offsets", ()), dtype=float)
+        count = spec.get("count", len(self.offsets))
+        if self.emitter == "radial":
+            angles = (2 * math.pi / count) * np.arange(count)
+            self.angles = angles
+            self.cos = np.cos(angles)
+            self.sin = np.sin(angles)
+        elif self.emitter == "fan":
+            angles = np.linspace(-spec["spread"] / 2, spec["spread"] / 2, count)
+            self.cos = np.cos(angles)
+            self.sin = np.sin(angles)
+        elif self.emitter == "wall":
+            margin = spec["margin"]
+            span = WIDTH - margin * 2
+            self.xs = np.array([margin + int(span * (i / (count - 1))) for i in range(count)], dtype=float)
+
+    def available(self, level, enraged):
+        return level >= self.min_level and (enraged or not self.enraged_only)
+
+    def fire(self, boss, player, enemy_bullets, summon):
+        """Una ráfaga desde `boss`; summon(x, y) crea un minion."""
+        rect = boss.rect
+        emitter = self.emitter
+
+        if emitter == "aimed":
+            if player is None:
+                return
+            px, py = player.rect.center
+            sx = rect.centerx + self.offsets
+            sy = float(rect.bottom)
+            dx = px - sx
+            dy = py - sy
+            dist = np.hypot(dx, dy)
+            dist[dist == 0] = 1
+            self._spawn_aimed(enemy_bullets, sx, sy, dx / dist * self.speed, dy / dist * self.speed, px, py)
+
+        elif emitter == "fan":
+            if player is None:
+                return
+            sx, sy = rect.centerx, rect.bottom
+            px, py = player.rect.center
+            # dirección al jugador (unitaria) y la tabla del abanico rotada hacia ella
+            dist = math.hypot(px - sx, py - sy) or 1
+            ux = (px - sx) / dist
+            uy = (py - sy) / dist
+            vx = (ux * self.cos - uy * self.sin) * self.speed
+            vy = (uy * self.cos + ux * self.sin) * self.speed
+            self._spawn_aimed(enemy_bullets, sx, sy, vx, vy, px, py)
+
+        elif emitter == "wall":
+            enemy_bullets.spawn_many(self.xs, rect.bottom, 0.0, self.speed, self.kind)
+
+        elif emitter == "radial":
+            boss.spin_angle += self.spin  # gira un poco cada ráfaga
+            if self.path == "spiral":
+                enemy_bullets.spawn_path(
+                    "spiral", rect.centerx, rect.centery, 0.0, 0.0, self.kind,
+                    omega=self.orbit, phase=boss.spin_angle + self.angles, aux=self.speed,
+                )
+                return
+            c = math.cos(boss.spin_angle)
+            s = math.sin(boss.spin_angle)
+            vx = (c * self.cos - s * self.sin) * self.speed
+            vy = (s * self.cos + c * self.sin) * self.speed
+            enemy_bullets.spawn_many(rect.centerx, rect.centery, vx, vy, self.kind)
+
+        elif emitter == "summon":
+            my = rect.bottom + 10
+            for off in self.offsets.tolist():
+                mx = rect.centerx + int(off)
+                if 20 < mx < WIDTH - 20:
+                    summon(mx, my)
+
+    def _spawn_aimed(self, enemy_bullets, sx, sy, vx, vy, px, py):
+        if self.path == "homing":
+            enemy_bullets.spawn_homing(sx, sy, vx, vy, px, py, self.turn, self.kind)
+        else:
+            enemy_bullets.spawn_many(sx, sy, vx, vy, self.kind)
+
+
+# Patrones compilados una sola vez al importar
+PATTERNS = tuple(Pattern(spec) for spec in BOSS_PATTERNS)
+
+
+def available_patterns(level, enraged):
+    """Índices de los patrones que puede usar un boss de ese nivel y fase."""
+    return [i for i, pattern in enumerate(PATTERNS) if pattern.available(level, enraged)]
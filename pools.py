@@ -0,0 +1,83 @@
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Sprite reciclable: al hacer kill() vuelve a su pool (si tiene uno) en
+    lugar de perderse. Las subclases reinician su estado en reset(), que
+    recibe los mismos argumentos que __init__.
+    """
+
+    pool = None
+    pool_free = False
+
+    def reset(self, *args, **kwargs):
+        """
+        Hook que llama SpritePool.acquire al reutilizar el sprite, con los
+        argumentos de acquire. Por defecto no hace nada: sólo sirve para
+        sprites sin estado propio. Bullet y Minion lo redefinen.
+        """
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class SpritePool:
+    """
+    Pool de sprites muertos listos para reutilizarse.
+    acquire() reinicia uno libre (hit) o crea uno nuevo si no hay (miss).
+    Como mucho se guardan `cap` sprites libres; los demás se descartan.
+    """
+
+    def __init__(self, cls, cap=1024):
+        self.cls = cls
+        self.cap = cap
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            sprite = self.cls(*args, **kwargs)
+            sprite.pool = self
+            self.misses += 1
+        sprite.pool_free = False
+        return sprite
+
+    def release(self, sprite):
+        # kill() puede llamarse varias veces sobre el mismo sprite
+        if sprite.pool_free:
+            return
+        sprite.pool_free = True
+        if len(self._free) < self.cap:
+            self._free.append(sprite)
+        else:
+            self.dropped += 1
+
+    def prefill(self, count, *args, **kwargs):
+        """Crea sprites por adelantado (con argumentos cualquiera) hasta tener `count` libres."""
+        while len(self._free) < min(count, self.cap):
+            sprite = self.cls(*args, **kwargs)
+            sprite.pool = self
+            self.release(sprite)
+
+    def stats(self):
+        return {
+            "free": len(self._free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+        }
+
+
+def recycle_group(group):
+    """Vacía un grupo matando sus sprites, para que los reciclables vuelvan a su pool."""
+    for sprite in group.sprites():
+        sprite.kill()
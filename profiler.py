@@ -0,0 +1,180 @@
+import csv
+import os
+import time
+
+import numpy as np
+import pygame
+
+from config import WIDTH, BASE_DIR, FPS, PROFILER_FRAMES
+from fonts import FONTS
+
+# Fases del bucle principal, en el orden en que ocurren
+PHASES = (
+    "events",
+    "player_boss",
+    "groups",
+    "collisions",
+    "background",
+    "entities",
+    "hud",
+    "flip",
+)
+# Grupos de sprites cuyo tamaño se guarda en cada frame
+COUNTS = ("bullets", "enemy_bullets", "minions", "specials")
+
+
+class _Phase:
+    """Context manager reutilizable que suma su duración a una fase del frame."""
+
+    __slots__ = ("profiler", "index", "start")
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.current[self.index] += time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """
+    Tiempos por fase de los últimos `size` frames en un buffer circular.
+    Uso:
+        with PROFILER.phase("hud"):
+            ...
+        PROFILER.end_frame(counts)   # una vez por frame, tras el flip
+    """
+
+    def __init__(self, size=PROFILER_FRAMES):
+        self.size = size
+        self.times = np.zeros((size, len(PHASES)))  # segundos por fase
+        self.totals = np.zeros(size)  # segundos entre end_frame y end_frame
+        self.counts = np.zeros((size, len(COUNTS)), np.int32)
+        self.current = [0.0] * len(PHASES)
+        self.frame = 0  # frames registrados en total
+        self.show_overlay = False
+        self._phases = {name: _Phase(self, i) for i, name in enumerate(PHASES)}
+        self._last_end = time.perf_counter()
+        self._font = None
+
+    def phase(self, name):
+        return self._phases[name]
+
+    def end_frame(self, counts=(0, 0, 0, 0)):
+        now = time.perf_counter()
+        row = self.frame % self.size
+        self.times[row] = self.current
+        self.totals[row] = now - self._last_end
+        self.counts[row] = counts
+        self.current = [0.0] * len(PHASES)
+        self._last_end = now
+        self.frame += 1
+
+    def _ordered(self):
+        """Índices de las filas válidas, de la más antigua a la más reciente."""
+        n = min(self.frame, self.size)
+        start = self.frame - n
+        return np.arange(start, self.frame) % self.size
+
+    def slowest_phase(self, frames=FPS):
+        """(nombre, ms medios) de la fase más cara en los últimos `frames` frames."""
+        rows = self._ordered()[-frames:]
+        if rows.size == 0:
+            return None, 0.0
+        means = self.times[rows].mean(axis=0)
+        i = int(means.argmax())
+        return PHASES[i], float(means[i] * 1000.0)
+
+    # -------------------------------------------------
+    # EXPORTACIÓN
+    # -------------------------------------------------
+    def dump_csv(self, path=None):
+        if path is None:
+            path = os.path.join(BASE_DIR, time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+        rows = self._ordered()
+        first = self.frame - rows.size
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "total_ms"] + [f"{p}_ms" for p in PHASES] + list(COUNTS))
+            for n, row in enumerate(rows):
+                writer.writerow(
+                    [first + n, f"{self.totals[row] * 1000:.3f}"]
+                    + [f"{t * 1000:.3f}" for t in self.times[row]]
+                    + self.counts[row].tolist()
+                )
+        print(f"[PERFIL] {rows.size} frames guardados en {path}")
+        return path
+
+    # -------------------------------------------------
+    # OVERLAY EN PANTALLA
+    # -------------------------------------------------
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+
+    def draw_overlay(self, surface, counts=None, extra=()):
+        """Dibuja el panel si está activo y devuelve su rect (None si no)."""
+        if not self.show_overlay:
+            return None
+        if self._font is None:
+            # fuente por defecto de pygame: no busca en las fuentes del sistema
+            self._font = FONTS.get(None, 18)
+        font = self._font
+
+        graph_w, graph_h = 240, 60
+        x = WIDTH - graph_w - 10
+        y = 90
+        panel = pygame.Rect(x - 6, y - 6, graph_w + 12, graph_h + 104 + 16 * len(extra))
+        pygame.draw.rect(surface, (0, 0, 0), panel)
+        pygame.draw.rect(surface, (80, 200, 200), panel, 1)
+
+        # gráfica de tiempo por frame (una barra por frame, 1 px de ancho)
+        rows = self._ordered()[-graph_w:]
+        budget = 1.0 / FPS
+        scale = graph_h / (budget * 2)  # la línea de 60 FPS queda a media altura
+        for i, total in enumerate(self.totals[rows].tolist()):
+            h = min(graph_h, int(total * scale))
+            color = (60, 200, 60) if total <= budget * 1.05 else (230, 80, 60)
+            pygame.draw.line(surface, color, (x + i, y + graph_h), (x + i, y + graph_h - h))
+        pygame.draw.line(surface, (230, 230, 40), (x, y + graph_h // 2), (x + graph_w, y + graph_h // 2))
+
+        lines = []
+        if rows.size:
+            recent = self.totals[rows] * 1000.0
+            lines.append(f"frame {recent[-1]:5.2f} ms  max {recent.max():5.2f} ms")
+        name, ms = self.slowest_phase()
+        if name is not None:
+            lines.append(f"fase mas lenta: {name} {ms:.2f} ms")
+        if counts is not None:
+            pairs = [f"{k}={v}" for k, v in zip(COUNTS, counts)]
+            lines.append("  ".join(pairs[:2]))
+            lines.append("  ".join(pairs[2:]))
+        lines.extend(extra)
+        lines.append("F3 overlay | F4 CSV | F5 dirty")
+
+        ty = y + graph_h + 6
+        for line in lines:
+            surface.blit(font.render(line, True, (255, 255, 255)), (x, ty))
+            ty += font.get_linesize()
+        return panel
+
+
+# Profiler compartido por el bucle principal, la lógica y el dibujo
+PROFILER = FrameProfiler()
+
+
+def group_counts(game):
+    """Tamaño de los grupos de sprites de la partida, en el orden de COUNTS."""
+    if game is None or game.player is None:
+        return (0, 0, 0, 0)
+    return (
+        len(game.bullets_group),
+        len(game.enemy_bullets),
+        len(game.minions_group),
+        len(game.special_group),
+    )
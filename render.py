@@ -0,0 +1,274 @@
+import numpy as np
+import pygame
+
+from config import WIDTH, HEIGHT, DIRTY_RECTS
+from background import BACKDROP, update_and_draw_background
+from entities import get_flash_image
+from ui import HUD, HUD_HEIGHT, draw_hud, draw_pause_overlay
+from profiler import PROFILER
+from trails import draw_bullets_with_trails
+
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+HUD_RECT = pygame.Rect(0, 0, WIDTH, HUD_HEIGHT)
+# Desplazamiento máximo (px) entre dos ticks que se interpola; más es un salto
+MAX_LERP_DISTANCE = 64
+
+_shadow = None
+
+
+def _player_shadow():
+    """Sombra elíptica bajo el jugador (se crea una sola vez)."""
+    global _shadow
+    if _shadow is None:
+        _shadow = pygame.Surface((40, 12), pygame.SRCALPHA)
+        pygame.draw.ellipse(_shadow, (0, 0, 0, 130), (0, 0, 40, 12))
+    return _shadow
+
+
+def _shadow_rect(player, where):
+    x, y = where(player)[:2]
+    w, h = player.rect.size
+    return pygame.Rect(x + w // 2 - 20, y + h - 6, 40, 12)
+
+
+def _sprite_image(sprite):
+    """Imagen a dibujar: la variante con flash blanco si acaba de recibir daño."""
+    if sprite.flash_timer > 0:
+        return get_flash_image(sprite)
+    return sprite.image
+
+
+def _rect_pos(sprite):
+    return sprite.rect
+
+
+def interpolator(game, alpha):
+    """
+    Función pos(sprite) con la posición de dibujo entre el tick anterior y
+    el actual (alpha en [0, 1]), o None si no hay nada que interpolar.
+    """
+    prev = game.prev_positions
+    if not prev or alpha >= 1.0:
+        return None
+
+    def pos(sprite):
+        x, y = sprite.rect.topleft
+        old = prev.get(sprite)
+        if old is None:
+            return x, y
+        dx = x - old[0]
+        dy = y - old[1]
+        # un salto grande es una reaparición o un sprite reutilizado del pool
+        if abs(dx) > MAX_LERP_DISTANCE or abs(dy) > MAX_LERP_DISTANCE:
+            return x, y
+        return round(old[0] + dx * alpha), round(old[1] + dy * alpha)
+
+    return pos
+
+
+def draw_entities(surface, game, alpha=1.0):
+    """
+    Dibuja boss, minions, jugador, balas y láser (sin offset).
+    `alpha` < 1 dibuja cada cosa entre su posición del tick anterior y la actual.
+    """
+    player = game.player
+    boss = game.boss
+    pos = interpolator(game, alpha)
+    where = _rect_pos if pos is None else pos
+
+    # Boss
+    if boss is not None:
+        surface.blit(_sprite_image(boss), where(boss))
+
+    # Minions
+    for m in game.minions_group:
+        surface.blit(_sprite_image(m), where(m))
+
+    # Player
+    if player is not None:
+        # sombra
+        surface.blit(_player_shadow(), _shadow_rect(player, where))
+
+        # parpadeo cuando es invencible
+        if player.invincible > 0 and (pygame.time.get_ticks() // 80) % 2 == 0:
+            pass
+        else:
+            surface.blit(_sprite_image(player), where(player))
+
+    # Balas del jugador con trail
+    draw_bullets_with_trails(surface, game.bullets_group, pos=pos)
+
+    # Balas del boss
+    game.enemy_bullets.draw(surface, alpha)
+
+    # Láser especial
+    for s in game.special_group:
+        surface.blit(s.image, where(s))
+
+
+def entity_rects(game, alpha=1.0):
+    """Rects de todo lo que pinta draw_entities (copias: los sprites se mueven)."""
+    pos = interpolator(game, alpha)
+    if pos is None:
+        def area(sprite):
+            return sprite.rect.copy()
+    else:
+        def area(sprite):
+            return pygame.Rect(pos(sprite), sprite.rect.size)
+
+    rects = []
+    if game.boss is not None:
+        rects.append(area(game.boss))
+    rects.extend(area(m) for m in game.minions_group)
+    if game.player is not None:
+        rects.append(area(game.player))
+        rects.append(_shadow_rect(game.player, pos or _rect_pos))
+    for b in game.bullets_group:
+        rects.append(area(b))
+        trail = b.trail.rect()
+        if trail is not None:
+            rects.append(trail)
+    rects.extend(game.enemy_bullets.rects(alpha))
+    rects.extend(area(s) for s in game.special_group)
+    return rects
+
+
+def draw_playing(screen, world, game, stars, alpha=1.0):
+    """
+    Dibuja un frame de PLAYING: mundo en `world` y luego a `screen` con el temblor.
+    `alpha` < 1 dibuja los sprites interpolados entre los dos últimos ticks.
+    """
+    player = game.player
+
+    # Dibujamos TODO el mundo en la superficie WORLD
+    update_and_draw_background(world, stars)
+
+    with PROFILER.phase("entities"):
+        draw_entities(world, game, alpha)
+
+    # -------------------------------------------------
+    # APLICAR SCREEN SHAKE: blitear WORLD a SCREEN con offset
+    # -------------------------------------------------
+    screen.fill((0, 0, 0))
+    screen.blit(world, game.shake_offset)
+
+    # HUD (se dibuja encima, sin sacudida)
+    if player is not None:
+        with PROFILER.phase("hud"):
+            draw_hud(screen, player, game.boss, game.level, game.score)
+
+
+def draw_paused(screen, game, stars):
+    """En pausa, dibujamos escena "congelada" sin sacudida."""
+    player = game.player
+    boss = game.boss
+
+    update_and_draw_background(screen, stars)
+    with PROFILER.phase("entities"):
+        if boss is not None:
+            screen.blit(boss.image, boss.rect)
+        game.minions_group.draw(screen)
+        if player is not None:
+            screen.blit(player.image, player.rect)
+        game.bullets_group.draw(screen)
+        game.enemy_bullets.draw(screen)
+        game.special_group.draw(screen)
+    if player is not None:
+        with PROFILER.phase("hud"):
+            draw_hud(screen, player, boss, game.level, game.score)
+    draw_pause_overlay(screen)
+
+
+# ============================================================
+# MODO DIRTY RECTS
+# ============================================================
+class DirtyRenderer:
+    """
+    Dibujo de PLAYING que sólo repinta las zonas que cambian: posición
+    anterior y actual de estrellas y sprites, y los widgets del HUD que
+    cambiaron. Se dibuja directamente en la pantalla, sin pasar por WORLD.
+
+    frame() devuelve la lista de rects para pygame.display.update(rects), o
+    None si el frame se ha dibujado completo y hay que hacer flip(): modo
+    desactivado, screen shake, o primer frame tras reset() (cambio de estado).
+    """
+
+    def __init__(self, enabled=DIRTY_RECTS):
+        self.enabled = enabled
+        self.prev_rects = []
+        # True si la pantalla tiene el último frame de PLAYING sin offset
+        self.clean = False
+        # fracción de píxeles enviada a la pantalla (último frame y media)
+        self.updated_fraction = 1.0
+        self.mean_fraction = 1.0
+        self._mask = np.zeros((WIDTH, HEIGHT), bool)
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.clean = False
+        print(f"[RENDER] Dirty rects {'activados' if self.enabled else 'desactivados'}")
+
+    def frame(self, screen, world, game, stars, alpha=1.0):
+        incremental = self.enabled and self.clean and game.shake_offset == (0, 0)
+        if incremental:
+            rects = self._draw_dirty(screen, game, stars, alpha)
+        else:
+            draw_playing(screen, world, game, stars, alpha)
+            self.prev_rects = stars.rects() + entity_rects(game, alpha)
+            self.clean = self.enabled and game.shake_offset == (0, 0)
+            rects = None
+
+        fraction = 1.0 if rects is None else self._fraction(rects)
+        self.updated_fraction = fraction
+        # media exponencial (~1 segundo) para que el overlay sea legible
+        self.mean_fraction += (fraction - self.mean_fraction) * 0.05
+        return rects
+
+    def reset(self):
+        """La pantalla ya no tiene el último frame (otro estado, overlay...): el siguiente será completo."""
+        self.clean = False
+
+    def _draw_dirty(self, screen, game, stars, alpha):
+        player = game.player
+        with PROFILER.phase("background"):
+            stars.update()
+        current = stars.rects() + entity_rects(game, alpha)
+        hud_changed = []
+        if player is not None:
+            with PROFILER.phase("hud"):
+                hud_changed = HUD.update(player, game.boss, game.level, game.score)
+
+        dirty = []
+        for r in self.prev_rects + current + hud_changed:
+            r = r.clip(SCREEN_RECT)
+            if r:
+                dirty.append(r)
+        # el HUD es translúcido: bajo él se repinta una sola zona (la unión)
+        # para no mezclarlo dos veces donde se solapan los rects
+        hud_area = None
+        if player is not None:
+            hud_rects = [r.clip(HUD_RECT) for r in dirty if r.colliderect(HUD_RECT)]
+            if hud_rects:
+                hud_area = hud_rects[0].unionall(hud_rects[1:])
+                dirty.append(hud_area)
+
+        # fondo sólo bajo las zonas sucias y después todo encima, como en draw_playing
+        with PROFILER.phase("background"):
+            BACKDROP.restore(screen, dirty)
+            stars.draw(screen)
+        with PROFILER.phase("entities"):
+            draw_entities(screen, game, alpha)
+        if hud_area is not None:
+            with PROFILER.phase("hud"):
+                screen.blit(HUD.layer, hud_area, hud_area)
+
+        self.prev_rects = current
+        return dirty
+
+    def _fraction(self, rects):
+        """Fracción de píxeles cubiertos por `rects` (los solapes cuentan una vez)."""
+        mask = self._mask
+        mask[:] = False
+        for r in rects:
+            mask[r.left:r.right, r.top:r.bottom] = True
+        return float(mask.mean())
@@ -0,0 +1,382 @@
+"""
+Replays binarios: la semilla de la partida (rng.py) más la máscara de
+entrada de cada tick y las mejoras elegidas. Con eso la lógica se repite
+igual, así que un replay reproduce una partida entera (y sus picos de
+tiempo o sus cuelgues) en otra máquina.
+
+Formato (little endian):
+    cabecera  "CPRP", versión (u8), semilla (u64), ticks/s (u16)
+    registros varint n + byte:
+        n > 0   n ticks seguidos con esa máscara de entrada
+        n == 0  evento; el byte es el código:
+                EV_UPGRADE + índice (u8) de la mejora elegida
+                EV_END + ticks (u32), score (u32), nivel (u16) al terminar
+Las máscaras se agrupan en rachas, así que una partida de 5 minutos ocupa
+unos pocos KB.
+
+Uso:
+    python replay.py replays/replay_20240101_120000.rpl          -> en tiempo real
+    python replay.py replays/replay_20240101_120000.rpl --speed 4
+    python replay.py replays/replay_20240101_120000.rpl --fast   -> sin dibujo
+"""
+import os
+import sys
+
+# --fast: sin ventana ni audio (tiene que ir antes de importar pygame/config)
+if __name__ == "__main__" and "--fast" in sys.argv[1:]:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import struct
+import time
+
+import numpy as np
+import pygame
+
+from config import (
+    WIDTH,
+    HEIGHT,
+    TICK_RATE,
+    RENDER_FPS,
+    MAX_CATCHUP_TICKS,
+    REPLAY_DIR,
+    STATE_PLAYING,
+    STATE_UPGRADE,
+)
+from background import init_stars
+from game import GameState, InputSnapshot
+from timestep import FixedTimestep
+from render import draw_playing
+from profiler import PROFILER, group_counts
+
+MAGIC = b"CPRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQH")
+FOOTER = struct.Struct("<IIH")
+
+EV_UPGRADE = 1
+EV_END = 2
+
+
+class ReplayError(ValueError):
+    """Fichero de replay inválido, o la partida ya no sigue al replay."""
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("replay truncado")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# ============================================================
+# GRABACIÓN
+# ============================================================
+class ReplayRecorder:
+    """
+    Graba una partida. Uso:
+        recorder = ReplayRecorder(game.seed)
+        recorder.record_tick(inp.mask)     # antes de cada game.step(inp)
+        recorder.record_upgrade(idx)       # antes de game.choose_upgrade(idx)
+        recorder.save(game=game)           # al terminar (o al salir)
+    """
+
+    def __init__(self, seed, tick_rate=TICK_RATE):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.data = bytearray()
+        self.ticks = 0
+        # racha actual de ticks con la misma máscara
+        self._mask = 0
+        self._run = 0
+
+    def record_tick(self, mask):
+        if mask != self._mask:
+            self._flush_run()
+            self._mask = mask
+        self._run += 1
+        self.ticks += 1
+
+    def record_upgrade(self, idx):
+        self._flush_run()
+        self.data += bytes((0, EV_UPGRADE, idx))
+
+    def _flush_run(self):
+        if self._run:
+            _write_varint(self.data, self._run)
+            self.data.append(self._mask)
+            self._run = 0
+
+    def to_bytes(self, game=None):
+        """Fichero completo; con `game` se añade el resultado final para verificar."""
+        self._flush_run()
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate))
+        out += self.data
+        if game is not None:
+            out += bytes((0, EV_END))
+            out += FOOTER.pack(game.tick, game.score, game.level)
+        return bytes(out)
+
+    def save(self, path=None, game=None):
+        if path is None:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            path = os.path.join(REPLAY_DIR, time.strftime("replay_%Y%m%d_%H%M%S.rpl"))
+        data = self.to_bytes(game)
+        with open(path, "wb") as f:
+            f.write(data)
+        print(f"[REPLAY] {self.ticks} ticks ({len(data)} bytes) guardados en {path}")
+        return path
+
+
+# ============================================================
+# LECTURA Y REPRODUCCIÓN
+# ============================================================
+class Replay:
+    """
+    Replay decodificado: seed, tick_rate, records (lista de ("tick", máscara,
+    n) y ("upgrade", índice)) y end (ticks, score, nivel) o None si la
+    partida no terminó de grabarse.
+    """
+
+    def __init__(self, seed, tick_rate, records, end=None):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.records = records
+        self.end = end
+
+    @property
+    def ticks(self):
+        return sum(rec[2] for rec in self.records if rec[0] == "tick")
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ReplayError("replay truncado")
+        magic, version, seed, tick_rate = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("no es un fichero de replay")
+        if version != VERSION:
+            raise ReplayError(f"versión de replay {version} no soportada")
+
+        records = []
+        end = None
+        pos = HEADER.size
+        while pos < len(data):
+            run, pos = _read_varint(data, pos)
+            if pos >= len(data):
+                raise ReplayError("replay truncado")
+            value = data[pos]
+            pos += 1
+            if run:
+                records.append(("tick", value, run))
+            elif value == EV_UPGRADE:
+                if pos >= len(data):
+                    raise ReplayError("replay truncado")
+                records.append(("upgrade", data[pos]))
+                pos += 1
+            elif value == EV_END:
+                if pos + FOOTER.size > len(data):
+                    raise ReplayError("replay truncado")
+                end = FOOTER.unpack_from(data, pos)
+                pos += FOOTER.size
+            else:
+                raise ReplayError(f"evento de replay desconocido: {value}")
+        return cls(seed, tick_rate, records, end)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayPlayer:
+    """
+    Devuelve las entradas de un Replay en orden. next_input() y
+    next_upgrade() tienen la forma de las policy/choose_upgrade de
+    headless.run; si la partida pide otra cosa que la siguiente del
+    replay, se ha desincronizado y se lanza ReplayError.
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.index = 0
+        self.left = 0  # ticks que quedan de la racha actual
+        self.mask = 0
+
+    @property
+    def done(self):
+        return self.left == 0 and self.index >= len(self.replay.records)
+
+    def next_input(self, game=None):
+        if self.left == 0:
+            rec = self._next("tick", game)
+            self.mask = rec[1]
+            self.left = rec[2]
+        self.left -= 1
+        return self.mask
+
+    def next_upgrade(self, game=None):
+        if self.left:
+            raise ReplayError(self._where("upgrade", game))
+        return self._next("upgrade", game)[1]
+
+    def _next(self, kind, game):
+        records = self.replay.records
+        if self.index >= len(records) or records[self.index][0] != kind:
+            raise ReplayError(self._where(kind, game))
+        rec = records[self.index]
+        self.index += 1
+        return rec
+
+    def _where(self, kind, game):
+        tick = game.tick if game is not None else "?"
+        return f"desincronizado en el tick {tick}: la partida pide '{kind}' y el replay no"
+
+    def step(self, game):
+        """
+        Avanza la partida un tick del replay (eligiendo antes la mejora si
+        toca). Devuelve False cuando el replay o la partida han terminado.
+        """
+        if self.done:
+            return False
+        if game.state == STATE_UPGRADE:
+            game.choose_upgrade(self.next_upgrade(game))
+        if game.state != STATE_PLAYING:
+            return False
+        game.step(InputSnapshot(self.next_input(game)))
+        return True
+
+
+def check_end(replay, game):
+    """Compara el final grabado con el reproducido; devuelve True si coinciden."""
+    if replay.end is None:
+        print("[REPLAY] Replay sin final grabado: no se puede verificar")
+        return True
+    got = (game.tick, game.score, game.level)
+    if got == tuple(replay.end):
+        print(f"[REPLAY] OK: tick={got[0]} score={got[1]} nivel={got[2]}")
+        return True
+    print(f"[REPLAY] DESINCRONIZADO: grabado (tick, score, nivel)={tuple(replay.end)} reproducido={got}")
+    return False
+
+
+# ============================================================
+# REPRODUCCIÓN SIN DIBUJO (LO MÁS RÁPIDO POSIBLE)
+# ============================================================
+def play_fast(replay, top=5):
+    """Reproduce sin dibujar, midiendo cada tick; imprime los más lentos."""
+    game = GameState()
+    game.start_new_game(replay.seed)
+    player = ReplayPlayer(replay)
+
+    times = np.zeros(replay.ticks)
+    clock = time.perf_counter
+    n = 0
+    start = clock()
+    while True:
+        t0 = clock()
+        if not player.step(game):
+            break
+        times[n] = clock() - t0
+        n += 1
+    elapsed = clock() - start
+
+    times = times[:n] * 1000.0
+    rate = n / elapsed if elapsed > 0 else float("inf")
+    print(f"[REPLAY] {n} ticks en {elapsed:.2f} s ({rate:.0f} ticks/s, x{rate / replay.tick_rate:.1f} tiempo real)")
+    if n:
+        p50, p99 = np.percentile(times, (50, 99))
+        print(f"[REPLAY] ms/tick p50={p50:.3f} p99={p99:.3f} max={times.max():.3f}")
+        for i in np.argsort(times)[::-1][:top].tolist():
+            print(f"[REPLAY]   tick {i + 1:7d}: {times[i]:.3f} ms")
+    return game
+
+
+# ============================================================
+# REPRODUCCIÓN EN TIEMPO REAL
+# ============================================================
+def play_realtime(replay, speed=1.0):
+    """Reproduce con ventana a `speed` veces la velocidad grabada. ESC sale; F3/F4 perfil."""
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Chroniques Pixel - Replay")
+    world = pygame.Surface((WIDTH, HEIGHT))
+    clock = pygame.time.Clock()
+
+    game = GameState()
+    game.start_new_game(replay.seed)
+    stars = init_stars()
+    player = ReplayPlayer(replay)
+    timestep = FixedTimestep(rate=replay.tick_rate * speed, max_ticks=MAX_CATCHUP_TICKS)
+
+    running = True
+    while running:
+        clock.tick(RENDER_FPS)
+        ticks = timestep.advance()
+        stars.time_scale = timestep.time_scale
+        with PROFILER.phase("events"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_F3:
+                        PROFILER.toggle_overlay()
+                    elif event.key == pygame.K_F4:
+                        PROFILER.dump_csv()
+
+        for i in range(ticks):
+            if i == ticks - 1:
+                game.save_positions()
+            if not player.step(game):
+                running = False
+                break
+
+        draw_playing(screen, world, game, stars, timestep.alpha)
+        counts = group_counts(game)
+        PROFILER.draw_overlay(screen, counts)
+        with PROFILER.phase("flip"):
+            pygame.display.flip()
+        PROFILER.end_frame(counts)
+
+    pygame.quit()
+    return game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduce un replay grabado")
+    parser.add_argument("path")
+    parser.add_argument("--fast", action="store_true", help="sin dibujo, lo más rápido posible")
+    parser.add_argument("--speed", type=float, default=1.0, help="velocidad en tiempo real (1 = grabada)")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    print(f"[REPLAY] semilla={replay.seed} ticks={replay.ticks} a {replay.tick_rate} ticks/s")
+    if args.fast:
+        game = play_fast(replay)
+    else:
+        game = play_realtime(replay, args.speed)
+        # con ESC se sale antes del final: no hay nada que verificar
+        if game.state == STATE_PLAYING and game.tick < replay.ticks:
+            return 0
+    return 0 if check_end(replay, game) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Generadores aleatorios con semilla, uno por subsistema. Todo el azar de
+la lógica sale de aquí y no del módulo global `random`: con la misma
+semilla de partida y las mismas entradas, la partida se repite igual
+(ver replay.py).
+
+Cada subsistema tiene su propio flujo, así que usar más (o menos) azar
+en uno no cambia la secuencia de los demás. Las semillas de los flujos
+se derivan de la semilla de partida y del nombre del flujo.
+"""
+import random
+
+# Subsistemas con flujo propio (el campo de estrellas usa un generador de
+# NumPy con la semilla derive("stars"))
+STREAMS = ("boss", "minions", "upgrades", "shake")
+
+# Las semillas de partida van en las cabeceras de replay.py y snapshot.py
+# (campo de 64 bits sin signo): se aceptan 0 <= semilla < 2**SEED_BITS
+SEED_BITS = 63
+
+
+class RandomStreams:
+    """
+    Un random.Random por subsistema, accesible como atributo:
+        RNG.boss.choice(patterns)
+    seed(s) reinicia todos los flujos a partir de la semilla de partida s.
+    """
+
+    def __init__(self, seed=0):
+        self.seed(seed)
+
+    def seed(self, seed):
+        self.master_seed = seed
+        for name in STREAMS:
+            setattr(self, name, random.Random(self.derive(name)))
+
+    def derive(self, name):
+        """Semilla (entero de 64 bits) del flujo `name`; estable entre versiones de Python."""
+        return random.Random(f"{self.master_seed}:{name}").getrandbits(64)
+
+
+def new_seed():
+    """Semilla para una partida nueva cuando no se pide una concreta."""
+    return random.getrandbits(SEED_BITS)
+
+
+def check_seed(seed):
+    """Devuelve `seed` si es una semilla de partida válida; si no, ValueError."""
+    if not 0 <= seed < 1 << SEED_BITS:
+        raise ValueError(f"semilla fuera de rango (0 <= semilla < 2**{SEED_BITS}): {seed}")
+    return seed
+
+
+# Flujos compartidos por todo el juego (GameState.start_new_game los reinicia)
+RNG = RandomStreams()
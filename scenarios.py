@@ -0,0 +1,287 @@
+"""
+Escenarios de benchmark con tiempos por fase (input, update, collision,
+draw, flip) y percentiles p50/p95/p99 por escenario.
+
+Uso:
+    python scenarios.py                       -> ejecuta y compara con la base
+    python scenarios.py --save-baseline       -> guarda los resultados como base
+    python scenarios.py boss_l1 orb_wall      -> sólo algunos escenarios
+
+Los resultados van a bench_results.json; la base a bench_baseline.json.
+Sale con código 1 si alguna fase empeora más que --tolerance respecto a la base.
+"""
+import os
+
+# Sin ventana ni audio: tiene que ir antes de importar pygame/config
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from config import WIDTH, HEIGHT, BASE_DIR, STATE_PLAYING, STATE_UPGRADE
+from background import init_stars
+from entities import Boss, MINION_POOL
+from game import GameState, InputSnapshot, IN_SHOOT, IN_LEFT, IN_RIGHT
+from render import draw_playing
+from ui import draw_title_screen
+
+PHASES = ("input", "update", "collision", "draw", "flip")
+PERCENTILES = (50, 95, 99)
+
+RESULTS_PATH = os.path.join(BASE_DIR, "bench_results.json")
+BASELINE_PATH = os.path.join(BASE_DIR, "bench_baseline.json")
+
+# Vida "infinita" para que los escenarios duren siempre lo mismo
+ENDLESS_HP = 10 ** 9
+
+
+# ============================================================
+# PREPARACIÓN DE ESCENARIOS
+# ============================================================
+# Cada escenario devuelve (game, policy, refill): game es None para la
+# pantalla de título, policy(game) da la máscara de entrada y refill()
+# (opcional) mantiene constante el número de entidades.
+def _new_game(level=1, fire_mode=0):
+    game = GameState()
+    game.start_new_game()
+    game.level = level
+    game.player.hp = game.player.max_hp = ENDLESS_HP
+    game.player.fire_mode = fire_mode
+    return game
+
+
+def _endless_boss(game, level):
+    boss = Boss(level)
+    boss.hp = boss.max_hp = ENDLESS_HP
+    game.boss = boss
+    return boss
+
+
+def _sweep_policy(game):
+    """Dispara siempre y barre la pantalla de lado a lado cada 2 segundos."""
+    return IN_SHOOT | (IN_LEFT if (game.tick // 120) % 2 else IN_RIGHT)
+
+
+def setup_title():
+    return None, None, None
+
+
+def setup_boss_l1():
+    game = _new_game(level=1)
+    _endless_boss(game, 1)
+    return game, _sweep_policy, None
+
+
+def setup_boss_l10_radial():
+    game = _new_game(level=10, fire_mode=2)
+    boss = _endless_boss(game, 10)
+    # por debajo del 50% -> enrage en el primer update
+    boss.hp = int(boss.max_hp * 0.4)
+    # patrón 2 (radial) fijo durante todo el escenario
+    boss.current_pattern = 2
+    boss.pattern_duration = ENDLESS_HP
+    return game, _sweep_policy, None
+
+
+def setup_orb_wall(count=5000):
+    game = _new_game()
+    game.boss = None
+
+    def top_up():
+        # mantiene el muro en `count` orbes: los que salen por abajo se reponen arriba
+        missing = count - len(game.enemy_bullets)
+        xs = [random.randrange(WIDTH) for _ in range(missing)]
+        ys = [random.randrange(HEIGHT // 2) for _ in range(missing)]
+        game.enemy_bullets.spawn_many(xs, ys, 0, 3.0, kind="slow_orb")
+
+    return game, lambda game: 0, top_up
+
+
+def setup_bullet_storm(count=20000):
+    # el objetivo son 60 FPS; hoy el p95 del frame aún pasa de 16.7 ms (ver ProjectileField)
+    game = _new_game()
+    game.boss = None
+    rng = np.random.default_rng(1)
+
+    def top_up():
+        # la mitad dirigidas en todas direcciones y la mitad "wave" bajando
+        missing = count - len(game.enemy_bullets)
+        half = missing // 2
+        angles = rng.uniform(0, 2 * np.pi, half)
+        game.enemy_bullets.spawn_many(
+            rng.uniform(0, WIDTH, half), rng.uniform(0, HEIGHT, half), np.cos(angles) * 4, np.sin(angles) * 4
+        )
+        rest = missing - half
+        game.enemy_bullets.spawn_many(rng.uniform(0, WIDTH, rest), rng.uniform(0, HEIGHT, rest), 0, 3.0, kind="wave")
+
+    return game, _sweep_policy, top_up
+
+
+def setup_minions(count=200):
+    game = _new_game(fire_mode=2)
+    game.boss = None
+    game.player.shoot_cooldown_max = 3
+
+    def top_up():
+        missing = count - len(game.minions_group)
+        for _ in range(missing):
+            minion = MINION_POOL.acquire(random.randrange(20, WIDTH - 20), random.randrange(HEIGHT // 2), 1)
+            game.minions_group.add(minion)
+
+    return game, _sweep_policy, top_up
+
+
+SCENARIOS = {
+    "title": setup_title,
+    "boss_l1": setup_boss_l1,
+    "boss_l10_radial": setup_boss_l10_radial,
+    "orb_wall": setup_orb_wall,
+    "bullet_storm": setup_bullet_storm,
+    "minions": setup_minions,
+}
+
+
+# ============================================================
+# EJECUCIÓN
+# ============================================================
+def run_scenario(name, frames, seed=1):
+    """Ejecuta un escenario y devuelve {fase: array de ms por frame}."""
+    random.seed(seed)
+    screen = pygame.display.get_surface()
+    world = pygame.Surface((WIDTH, HEIGHT))
+    stars = init_stars(seed=seed)
+    # refill() repone entidades antes de cada frame, fuera de la medida
+    game, policy, refill = SCENARIOS[name]()
+
+    samples = {phase: np.zeros(frames) for phase in PHASES}
+    clock = time.perf_counter
+    for i in range(frames):
+        if refill is not None:
+            refill()
+        t0 = clock()
+        pygame.event.pump()
+        inp = InputSnapshot(policy(game)) if game is not None else None
+        t1 = clock()
+        if game is not None:
+            if game.state == STATE_UPGRADE:
+                game.choose_upgrade(0)
+            if game.state == STATE_PLAYING:
+                game.update(inp)
+        t2 = clock()
+        if game is not None and game.state == STATE_PLAYING:
+            game.collide()
+            game.tick_timers()
+        t3 = clock()
+        if game is None:
+            draw_title_screen(screen, stars)
+        else:
+            draw_playing(screen, world, game, stars)
+        t4 = clock()
+        pygame.display.flip()
+        t5 = clock()
+
+        samples["input"][i] = t1 - t0
+        samples["update"][i] = t2 - t1
+        samples["collision"][i] = t3 - t2
+        samples["draw"][i] = t4 - t3
+        samples["flip"][i] = t5 - t4
+
+    if game is not None:
+        for group in game.groups():
+            for sprite in group.sprites():
+                sprite.kill()
+    return {phase: values * 1000.0 for phase, values in samples.items()}
+
+
+def summarize(samples):
+    """{fase: {"p50": ms, "p95": ms, "p99": ms}} + total por frame."""
+    total = sum(samples.values())
+    summary = {}
+    for phase, values in list(samples.items()) + [("total", total)]:
+        summary[phase] = {f"p{p}": round(float(np.percentile(values, p)), 4) for p in PERCENTILES}
+    return summary
+
+
+def compare(results, baseline, tolerance):
+    """Lista de (escenario, fase, base, actual) para los p95 que empeoran más que `tolerance`."""
+    regressions = []
+    for name, phases in results["scenarios"].items():
+        base_phases = baseline.get("scenarios", {}).get(name)
+        if base_phases is None:
+            continue
+        for phase, stats in phases.items():
+            base = base_phases.get(phase, {}).get("p95")
+            if base is None:
+                continue
+            # margen absoluto para no marcar ruido en fases de microsegundos
+            if stats["p95"] > base * (1 + tolerance) and stats["p95"] - base > 0.05:
+                regressions.append((name, phase, base, stats["p95"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks por escenarios con percentiles por fase")
+    parser.add_argument("scenarios", nargs="*", help=f"escenarios ({', '.join(SCENARIOS)})")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="guarda los resultados como nueva base")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="empeoramiento de p95 permitido (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"escenarios desconocidos: {', '.join(unknown)}")
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    results = {
+        "frames": args.frames,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "scenarios": {},
+    }
+    for name in names:
+        summary = summarize(run_scenario(name, args.frames))
+        results["scenarios"][name] = summary
+        line = " | ".join(f"{phase} {summary[phase]['p95']:7.3f}" for phase in PHASES + ("total",))
+        print(f"{name:<16} p95 ms: {line}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"[BENCH] Resultados en {args.output}")
+
+    status = 0
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] Base guardada en {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, phase, base, now in regressions:
+            print(f"[BENCH] REGRESION {name}/{phase}: p95 {base:.3f} ms -> {now:.3f} ms")
+        if not regressions:
+            print("[BENCH] Sin regresiones respecto a la base")
+        status = 1 if regressions else 0
+    else:
+        print(f"[BENCH] No hay base en {args.baseline} (usa --save-baseline)")
+
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Efectos de sonido. Los sonidos se sintetizan una vez al arrancar (ondas
+cuadradas, sierras y ruido con envolvente, en el estilo 8 bits de la
+música) y se reproducen por un grupo fijo de canales del mixer:
+
+    - cada categoría tiene sus propios canales (voces máximas); si están
+      todos sonando se corta el que lleva más tiempo, no se abre otro.
+    - los eventos de un frame se agrupan por categoría: 30 balas que
+      impactan en el mismo frame son UNA reproducción (algo más fuerte),
+      no 30.
+
+Así el trabajo del mixer está acotado por SFX_CATEGORIES, haya las balas
+que haya. La lógica (game.GameState) sólo cuenta eventos en sound_events;
+el bucle principal los pasa a SFX.play_events una vez por frame.
+"""
+import math
+
+import numpy as np
+import pygame
+
+from config import SFX_VOLUME
+from music import init_mixer
+
+# Categoría: (voces máximas, volumen)
+SFX_CATEGORIES = {
+    "shot": (2, 0.25),
+    "boss_shot": (1, 0.2),
+    "boss_hit": (2, 0.35),
+    "minion_death": (2, 0.45),
+    "player_hit": (1, 0.7),
+    "laser": (1, 0.5),
+}
+
+
+# ============================================================
+# SÍNTESIS
+# ============================================================
+def _time(rate, seconds):
+    return np.arange(int(rate * seconds)) / rate
+
+
+def _sweep(t, f0, f1):
+    """Fase de un barrido lineal de frecuencia f0 -> f1 Hz (en ciclos)."""
+    duration = t[-1] if len(t) > 1 else 1.0
+    return f0 * t + (f1 - f0) * t * t / (2.0 * duration)
+
+
+def _square(phase):
+    return np.where(phase % 1.0 < 0.5, 1.0, -1.0)
+
+
+def _saw(phase):
+    return 2.0 * (phase % 1.0) - 1.0
+
+
+def _decay(t, speed):
+    return np.exp(-speed * t)
+
+
+def _noise(n):
+    # semilla fija: el mismo sonido siempre (y no toca los flujos de rng.py)
+    return np.random.default_rng(0).uniform(-1.0, 1.0, n)
+
+
+def _synth_shot(rate):
+    t = _time(rate, 0.06)
+    return 0.6 * _square(_sweep(t, 880, 660)) * _decay(t, 40)
+
+
+def _synth_boss_shot(rate):
+    t = _time(rate, 0.09)
+    return 0.5 * _square(_sweep(t, 240, 160)) * _decay(t, 30)
+
+
+def _synth_boss_hit(rate):
+    t = _time(rate, 0.08)
+    return (0.5 * _noise(len(t)) + 0.4 * _square(_sweep(t, 150, 110))) * _decay(t, 45)
+
+
+def _synth_minion_death(rate):
+    t = _time(rate, 0.22)
+    # ruido "triturado": cada muestra se repite más a medida que avanza
+    hold = np.minimum(1 + (t * 120).astype(int), 24)
+    noise = _noise(len(t))[np.arange(len(t)) // hold * hold]
+    return 0.7 * noise * _decay(t, 14)
+
+
+def _synth_player_hit(rate):
+    t = _time(rate, 0.25)
+    return 0.8 * _square(_sweep(t, 320, 70)) * _decay(t, 9)
+
+
+def _synth_laser(rate):
+    t = _time(rate, 0.4)
+    return 0.5 * _saw(_sweep(t, 1400, 300)) * _decay(t, 5)
+
+
+SYNTHS = {
+    "shot": _synth_shot,
+    "boss_shot": _synth_boss_shot,
+    "boss_hit": _synth_boss_hit,
+    "minion_death": _synth_minion_death,
+    "player_hit": _synth_player_hit,
+    "laser": _synth_laser,
+}
+
+
+def _make_sound(wave, channels):
+    samples = (np.clip(wave, -1.0, 1.0) * 32767).astype(np.int16)
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+
+
+# ============================================================
+# CANALES
+# ============================================================
+class SoundEffects:
+    """
+    Uso:
+        SFX.init()                               # una vez (o synthesize() + setup())
+        SFX.play_events(game.take_sound_events())  # una vez por frame
+    Sin mixer (o sin audio) init() devuelve False y todo lo demás no hace nada.
+    """
+
+    def __init__(self, categories=SFX_CATEGORIES, volume=SFX_VOLUME):
+        self.categories = categories
+        self.volume = volume
+        self.enabled = False
+        self.muted = False
+        self.sounds = {}
+        self._channels = {}  # categoría -> [pygame.mixer.Channel]
+        self._started = {}   # Channel -> frame en que empezó a sonar
+        self.frame = 0
+        # estadísticas
+        self.requested = 0  # eventos recibidos
+        self.played = 0     # reproducciones reales
+        self.stolen = 0     # voces cortadas para dejar sitio
+
+    def init(self):
+        """Inicializa el mixer, sintetiza los sonidos y reserva los canales; devuelve si hay efectos."""
+        init_mixer()
+        return self.setup(self.synthesize())
+
+    def synthesize(self):
+        """
+        Sonidos de todas las categorías ({nombre: Sound}), o None sin mixer
+        válido. No inicializa el mixer: se puede llamar desde otro hilo.
+        """
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            print("[SFX] Sin efectos de sonido: mixer sin inicializar")
+            return None
+        rate, fmt, channels = mixer
+        if fmt != -16:
+            print(f"[SFX] Formato de mixer {fmt} no soportado: sin efectos de sonido")
+            return None
+        return {name: _make_sound(SYNTHS[name](rate), channels) for name in self.categories}
+
+    def setup(self, sounds):
+        """Reserva los canales para `sounds` (de synthesize); devuelve si hay efectos."""
+        if sounds is None:
+            return False
+        self.sounds = sounds
+
+        # los primeros canales quedan reservados para los efectos: Sound.play()
+        # de cualquier otro sitio no los usa nunca
+        total = sum(voices for voices, _ in self.categories.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for name, (voices, _) in self.categories.items():
+            self._channels[name] = [pygame.mixer.Channel(i) for i in range(index, index + voices)]
+            index += voices
+
+        self.enabled = True
+        print(f"[SFX] {len(sounds)} efectos en {total} canales ({pygame.mixer.get_init()[0]} Hz)")
+        return True
+
+    def play_events(self, events):
+        """Reproduce los eventos de un frame: {categoría: veces}."""
+        self.frame += 1
+        for name, count in events.items():
+            self.play(name, count)
+
+    def play(self, name, count=1):
+        """Una sola reproducción de `name` por `count` eventos simultáneos."""
+        self.requested += count
+        if not self.enabled or self.muted or count <= 0:
+            return
+        channel = self._free_channel(name)
+        # más eventos a la vez suenan algo más fuerte, no más veces
+        volume = min(1.0, self.volume * self.categories[name][1] * (1.0 + 0.15 * math.log2(count)))
+        channel.set_volume(volume)
+        channel.play(self.sounds[name])
+        self._started[channel] = self.frame
+        self.played += 1
+
+    def _free_channel(self, name):
+        channels = self._channels[name]
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        # todas las voces ocupadas: se corta la más antigua
+        self.stolen += 1
+        return min(channels, key=lambda c: self._started.get(c, 0))
+
+    def toggle_mute(self):
+        self.muted = not self.muted
+        if self.muted:
+            for channels in self._channels.values():
+                for channel in channels:
+                    channel.stop()
+        print(f"[SFX] Mute {'ON' if self.muted else 'OFF'}")
+
+    def stats(self):
+        return {"requested": self.requested, "played": self.played, "stolen": self.stolen}
+
+
+# Efectos compartidos por todo el juego
+SFX = SoundEffects()
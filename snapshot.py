@@ -0,0 +1,308 @@
+"""
+Snapshots binarios del estado completo de una partida (GameState): jugador,
+boss, todos los sprites de los grupos, balas del boss, estado de los
+generadores aleatorios (rng.py), score, nivel y temblor.
+
+No se guarda ninguna Surface: cada sprite se guarda por su tipo y sus
+números, y al restaurar la imagen sale de entities.get_image (o del
+jugador/boss existentes). Restaurar y seguir jugando da exactamente la
+misma partida que sin restaurar, así que sirve para reintentar un boss,
+guardar y seguir partidas largas o rebobinar.
+
+Uso:
+    data = capture(game)          # bytes
+    restore(game, data)
+    save(game, path) / load(game, path)
+"""
+import math
+import struct
+
+import numpy as np
+
+from config import (
+    TRAIL_LENGTH,
+    STATE_TITLE,
+    STATE_PLAYING,
+    STATE_PAUSED,
+    STATE_GAME_OVER,
+    STATE_UPGRADE,
+)
+from entities import Player, Boss, SpecialAttack, BULLET_POOL, MINION_POOL
+from pools import recycle_group
+from rng import RNG, STREAMS, check_seed
+from upgrades import UPGRADES
+
+MAGIC = b"CPSN"
+VERSION = 2
+
+STATES = (STATE_TITLE, STATE_PLAYING, STATE_PAUSED, STATE_GAME_OVER, STATE_UPGRADE)
+BULLET_KINDS = ("normal", "spread", "wave")
+
+# flags de la cabecera
+HAS_SEED = 1 << 0
+HAS_PLAYER = 1 << 1
+HAS_BOSS = 1 << 2
+
+# magic, versión, flags, estado, nivel, score, tick, semilla, shake, shake_offset
+HEADER = struct.Struct("<4sBBBHiqQhhh")
+
+# Jugador: rect.x, rect.y y estos atributos, todos enteros
+PLAYER_FIELDS = (
+    "base_speed", "slow_speed", "fast_speed", "max_hp", "hp",
+    "shoot_cooldown", "shoot_cooldown_max", "special_cooldown", "special_charges",
+    "bullet_speed", "bullet_damage", "invincible", "fire_mode", "flash_timer",
+)
+PLAYER = struct.Struct("<2i" + "i" * len(PLAYER_FIELDS))
+
+# Boss: rect.x, rect.y, enraged y estos atributos (enteros y después floats)
+BOSS_INT_FIELDS = (
+    "level", "hp", "max_hp", "shoot_timer", "shoot_interval",
+    "pattern_time", "pattern_duration", "current_pattern", "age", "flash_timer",
+)
+BOSS_FLOAT_FIELDS = ("speed_x", "spin_angle")
+BOSS = struct.Struct("<2i?" + "i" * len(BOSS_INT_FIELDS) + "d" * len(BOSS_FLOAT_FIELDS))
+
+# Estado de un random.Random: 624 palabras + posición, y gauss_next (NaN si None)
+RNG_STATE = struct.Struct("<625Id")
+RNG_SIZE = len(STREAMS) * RNG_STATE.size
+
+COUNT = struct.Struct("<I")
+
+# Un registro por sprite de cada grupo (cx, cy: centro del rect)
+BULLET_DTYPE = np.dtype([
+    ("x0", "f8"), ("y0", "f8"), ("vx", "f8"), ("vy", "f8"), ("speed", "f8"), ("cx", "i4"), ("cy", "i4"),
+    ("age", "i4"), ("kind", "u1"), ("trail_n", "u1"), ("trail", "i2", (TRAIL_LENGTH, 2)),
+])
+MINION_DTYPE = np.dtype([
+    ("x0", "f8"), ("y0", "f8"), ("speed_y", "f8"), ("sway_amp", "f8"), ("sway_phase", "f8"),
+    ("cx", "i4"), ("cy", "i4"), ("age", "i4"), ("hp", "i4"), ("max_hp", "i4"), ("flash_timer", "i4"),
+])
+_NO_TRAIL = [(0, 0)] * TRAIL_LENGTH
+SPECIAL_DTYPE = np.dtype([("x", "i4"), ("lifetime", "i4")])
+
+
+class SnapshotError(ValueError):
+    """Datos que no son un snapshot de esta versión."""
+
+
+# ============================================================
+# CAPTURA
+# ============================================================
+def capture(game):
+    """Estado completo de `game` en bytes."""
+    player = game.player
+    boss = game.boss
+    flags = 0
+    if game.seed is not None:
+        flags |= HAS_SEED
+    if player is not None:
+        flags |= HAS_PLAYER
+    if boss is not None:
+        flags |= HAS_BOSS
+
+    # game.seed ya cabe en el campo Q: start_new_game lo valida con rng.check_seed
+    parts = [HEADER.pack(
+        MAGIC, VERSION, flags, STATES.index(game.state), game.level, game.score,
+        game.tick, game.seed or 0, game.shake, *game.shake_offset,
+    )]
+    if player is not None:
+        parts.append(PLAYER.pack(
+            player.rect.x, player.rect.y,
+            *(getattr(player, name) for name in PLAYER_FIELDS),
+        ))
+    if boss is not None:
+        parts.append(BOSS.pack(
+            boss.rect.x, boss.rect.y, boss.enraged,
+            *(getattr(boss, name) for name in BOSS_INT_FIELDS),
+            *(getattr(boss, name) for name in BOSS_FLOAT_FIELDS),
+        ))
+
+    for name in STREAMS:
+        _, words, gauss = getattr(RNG, name).getstate()
+        parts.append(RNG_STATE.pack(*words, float("nan") if gauss is None else gauss))
+
+    parts.append(_records(game.bullets_group, BULLET_DTYPE, _bullet_record))
+    parts.append(_records(game.minions_group, MINION_DTYPE, _minion_record))
+    parts.append(_records(game.special_group, SPECIAL_DTYPE, _special_record))
+    parts.append(game.enemy_bullets.dump())
+
+    options = [UPGRADES.index(option) for option in game.upgrade_options]
+    parts.append(bytes([len(options), *options]))
+    return b"".join(parts)
+
+
+def _records(group, dtype, record):
+    rows = [record(sprite) for sprite in group]
+    return COUNT.pack(len(rows)) + np.array(rows, dtype).tobytes()
+
+
+def _bullet_record(bullet):
+    x0, y0 = bullet.origin
+    cx, cy = bullet.rect.center
+    points = bullet.trail.ordered()
+    n = len(points)
+    trail = points + _NO_TRAIL[n:]
+    return (
+        x0, y0, bullet.vx, bullet.vy, bullet.speed, cx, cy,
+        bullet.age, BULLET_KINDS.index(bullet.kind), n, trail,
+    )
+
+
+def _minion_record(minion):
+    x0, y0 = minion.origin
+    cx, cy = minion.rect.center
+    return (
+        x0, y0, minion.speed_y, minion.sway_amp, minion.sway_phase, cx, cy,
+        minion.age, minion.hp, minion.max_hp, minion.flash_timer,
+    )
+
+
+def _special_record(beam):
+    return beam.rect.centerx, beam.lifetime
+
+
+# ============================================================
+# RESTAURACIÓN
+# ============================================================
+def restore(game, data):
+    """Deja `game` exactamente como estaba al hacer capture()."""
+    if len(data) < HEADER.size:
+        raise SnapshotError("snapshot truncado")
+    magic, version, flags, state, level, score, tick, seed, shake, ox, oy = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("no es un snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"versión de snapshot {version} no soportada")
+    if flags & HAS_SEED:
+        # la misma regla que start_new_game: una semilla que no pudo escribirse así
+        try:
+            check_seed(seed)
+        except ValueError as e:
+            raise SnapshotError(str(e)) from None
+    offset = HEADER.size
+
+    game.state = STATES[state]
+    game.level = level
+    game.score = score
+    game.tick = tick
+    game.seed = seed if flags & HAS_SEED else None
+    game.shake = shake
+    game.shake_offset = (ox, oy)
+
+    if flags & HAS_PLAYER:
+        x, y, *values = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        # el jugador siempre tiene el mismo aspecto: se reutiliza si existe
+        player = game.player if game.player is not None else Player()
+        player.rect.topleft = (x, y)
+        for name, value in zip(PLAYER_FIELDS, values):
+            setattr(player, name, value)
+        game.player = player
+    else:
+        game.player = None
+
+    if flags & HAS_BOSS:
+        x, y, enraged, *values = BOSS.unpack_from(data, offset)
+        offset += BOSS.size
+        ints = dict(zip(BOSS_INT_FIELDS, values))
+        boss = game.boss
+        if boss is None or boss.level != ints["level"]:
+            boss = Boss(ints["level"])
+        if boss.enraged != enraged:
+            boss.enraged = enraged
+            boss.redraw()
+        boss.rect.topleft = (x, y)
+        for name, value in zip(BOSS_INT_FIELDS + BOSS_FLOAT_FIELDS, values):
+            setattr(boss, name, value)
+        game.boss = boss
+    else:
+        game.boss = None
+
+    # los generadores se restauran al final: reset() de los minions gasta números
+    rng_offset = offset
+    offset += RNG_SIZE
+
+    # los sprites actuales vuelven a sus pools y se sacan de nuevo de ellos
+    for group in game.groups():
+        recycle_group(group)
+    offset = _restore_bullets(game.bullets_group, data, offset)
+    offset = _restore_minions(game.minions_group, data, offset)
+    offset = _restore_specials(game.special_group, data, offset)
+    offset = game.enemy_bullets.load(data, offset)
+
+    n = data[offset]
+    game.upgrade_options = [UPGRADES[i] for i in data[offset + 1:offset + 1 + n]]
+    offset += 1 + n
+
+    for name in STREAMS:
+        *words, gauss = RNG_STATE.unpack_from(data, rng_offset)
+        rng_offset += RNG_STATE.size
+        getattr(RNG, name).setstate((3, tuple(words), None if math.isnan(gauss) else gauss))
+
+    # nada que interpolar desde antes del snapshot
+    game.prev_positions = {}
+
+
+def _read_records(data, offset, dtype):
+    (n,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    arr = np.frombuffer(data, dtype, n, offset)
+    return arr, offset + n * dtype.itemsize
+
+
+def _restore_bullets(group, data, offset):
+    arr, offset = _read_records(data, offset, BULLET_DTYPE)
+    bullets = []
+    for x0, y0, vx, vy, speed, cx, cy, age, kind, n, trail in arr.tolist():
+        bullet = BULLET_POOL.acquire(x0, y0, None, speed, BULLET_KINDS[kind])
+        bullet.vx = vx
+        bullet.vy = vy
+        bullet.age = age
+        bullet.rect.center = (cx, cy)
+        bullet.trail.load(trail[:n])
+        bullets.append(bullet)
+    group.add(*bullets)
+    return offset
+
+
+def _restore_minions(group, data, offset):
+    arr, offset = _read_records(data, offset, MINION_DTYPE)
+    minions = []
+    for x0, y0, speed_y, sway_amp, sway_phase, cx, cy, age, hp, max_hp, flash_timer in arr.tolist():
+        minion = MINION_POOL.acquire(x0, y0, 1)
+        minion.speed_y = speed_y
+        minion.sway_amp = sway_amp
+        minion.sway_phase = sway_phase
+        minion.rect.center = (cx, cy)
+        minion.age = age
+        minion.hp = hp
+        minion.max_hp = max_hp
+        minion.flash_timer = flash_timer
+        minions.append(minion)
+    group.add(*minions)
+    return offset
+
+
+def _restore_specials(group, data, offset):
+    arr, offset = _read_records(data, offset, SPECIAL_DTYPE)
+    for x, lifetime in arr.tolist():
+        beam = SpecialAttack(x)
+        beam.lifetime = lifetime
+        group.add(beam)
+    return offset
+
+
+# ============================================================
+# FICHEROS
+# ============================================================
+def save(game, path):
+    data = capture(game)
+    with open(path, "wb") as f:
+        f.write(data)
+    print(f"[SNAPSHOT] {len(data)} bytes guardados en {path}")
+    return path
+
+
+def load(game, path):
+    with open(path, "rb") as f:
+        restore(game, f.read())
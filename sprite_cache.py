@@ -0,0 +1,153 @@
+"""
+Caché en disco del arte dibujado por código (entities.IMAGE_BUILDERS).
+Cada sprite se dibuja una vez, se guarda como píxeles RGBA en crudo y en
+los arranques siguientes se lee ya hecho.
+
+La clave de cada sprite es un hash de sus parámetros de dibujo: nombre y
+variante, el código de la función que lo dibuja, los valores de las
+constantes globales que usa (colores, HEIGHT...) y la versión de pygame.
+Si cambia cualquiera de ellos la clave es otra y el sprite se vuelve a
+dibujar; CACHE_VERSION cambia el formato entero (otra carpeta).
+
+Uso:
+    python sprite_cache.py            -> dibuja y guarda todo el arte
+    python sprite_cache.py --clear    -> borra la caché
+"""
+import hashlib
+import os
+import shutil
+import struct
+import sys
+import time
+
+import pygame
+
+from config import SPRITE_DISK_CACHE, SPRITE_CACHE_DIR
+
+CACHE_VERSION = 1
+# ancho y alto (u16) y después los píxeles RGBA
+HEADER = struct.Struct("<HH")
+# tipos de las constantes globales que entran en la clave
+_PARAM_TYPES = (int, float, str, bool, tuple)
+
+
+def _code_params(code):
+    """Bytecode y constantes de una función (y de las que define dentro)."""
+    parts = [code.co_code]
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            parts.extend(_code_params(const))
+        else:
+            parts.append(repr(const).encode())
+    return parts
+
+
+def art_key(name, variant, builder):
+    """Hash (hex) de todo lo que decide cómo se dibuja el sprite."""
+    h = hashlib.sha1()
+    h.update(repr((name, variant, pygame.version.ver)).encode())
+    for part in _code_params(builder.__code__):
+        h.update(part)
+    # valores de las constantes globales que lee la función (colores, tamaños)
+    env = builder.__globals__
+    for global_name in sorted(builder.__code__.co_names):
+        value = env.get(global_name)
+        if isinstance(value, _PARAM_TYPES):
+            h.update(f"{global_name}={value!r}".encode())
+    return h.hexdigest()
+
+
+class SpriteCache:
+    """
+    bake(name, variant, builder) devuelve la Surface de builder(variant),
+    leída de disco si ya se dibujó antes con los mismos parámetros. Los
+    errores de disco no son fatales: el sprite se dibuja y ya está.
+    """
+
+    def __init__(self, directory=SPRITE_CACHE_DIR, enabled=SPRITE_DISK_CACHE):
+        self.directory = os.path.join(directory, f"v{CACHE_VERSION}")
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._warned = False
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".rgba")
+
+    def bake(self, name, variant, builder):
+        if not self.enabled:
+            return builder(variant)
+        key = art_key(name, variant, builder)
+        surface = self.load(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = builder(variant)
+        self.store(key, surface)
+        return surface
+
+    def load(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        w, h = HEADER.unpack_from(data)
+        pixels = data[HEADER.size:]
+        if len(pixels) != w * h * 4:
+            return None  # fichero cortado: se vuelve a dibujar
+        return pygame.image.frombytes(pixels, (w, h), "RGBA")
+
+    def store(self, key, surface):
+        w, h = surface.get_size()
+        data = HEADER.pack(w, h) + pygame.image.tobytes(surface, "RGBA")
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            # rename atómico: nadie lee nunca un fichero a medias
+            os.replace(tmp, path)
+        except OSError as e:
+            if not self._warned:
+                print(f"[SPRITES] No se puede escribir la caché en {self.directory}: {e}")
+                self._warned = True
+
+    def clear(self):
+        """Borra la caché de esta versión."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Caché compartida por entities.get_image
+SPRITE_CACHE = SpriteCache()
+
+
+def main(argv=None):
+    args = argv if argv is not None else sys.argv[1:]
+    if "--clear" in args:
+        SPRITE_CACHE.clear()
+        print(f"[SPRITES] Caché borrada: {SPRITE_CACHE.directory}")
+        return
+
+    # entities importa este módulo: aquí se importa al usarlo (y su
+    # SPRITE_CACHE es el del módulo sprite_cache, no el de __main__)
+    import entities
+
+    cache = entities.SPRITE_CACHE
+    start = time.perf_counter()
+    count = entities.preload_images()
+    ms = (time.perf_counter() - start) * 1000.0
+    stats = cache.stats()
+    print(f"[SPRITES] {count} sprites en {ms:.2f} ms (leídos {stats['hits']}, dibujados {stats['misses']}) "
+          f"-> {cache.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Regresión: un replay grabado con varios ticks por frame (dibujo más lento
+que TICK_RATE, como en main.py) se reproduce igual.
+
+    python -m pytest -q test_replay.py
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+from config import STATE_GAME_OVER, STATE_UPGRADE
+from game import GameState, InputSnapshot
+from headless import default_policy
+from replay import Replay, ReplayPlayer, ReplayRecorder
+
+
+def record(seed, ticks_per_frame, frames):
+    """Graba una partida como el bucle de main.py: `ticks_per_frame` ticks por frame."""
+    game = GameState()
+    game.start_new_game(seed)
+    recorder = ReplayRecorder(seed)
+    upgrades = 0
+    for _ in range(frames):
+        if game.state == STATE_UPGRADE:
+            recorder.record_upgrade(0)
+            game.choose_upgrade(0)
+            upgrades += 1
+        elif game.state == STATE_GAME_OVER:
+            break
+        # la misma entrada en todos los ticks del frame (teclas leídas una vez)
+        inp = InputSnapshot(default_policy(game))
+        game.step_frame([inp] * ticks_per_frame, recorder)
+    return Replay.from_bytes(recorder.to_bytes(game)), upgrades
+
+
+@pytest.mark.parametrize("ticks_per_frame", [1, 3, 5])
+def test_replay_with_several_ticks_per_frame(ticks_per_frame):
+    replay, upgrades = record(5, ticks_per_frame, 4000)
+    assert upgrades > 0  # la mejora tiene que caer a mitad de un frame para probar algo
+
+    game = GameState()
+    game.start_new_game(replay.seed)
+    player = ReplayPlayer(replay)
+    while player.step(game):
+        pass
+    assert (game.tick, game.score, game.level) == tuple(replay.end)
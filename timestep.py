@@ -0,0 +1,53 @@
+import time
+
+from config import TICK_RATE, MAX_CATCHUP_TICKS
+
+
+class FixedTimestep:
+    """
+    Acumulador de paso fijo: convierte el tiempo real de cada frame en un
+    número entero de ticks de lógica a `rate` Hz, como mucho `max_ticks`
+    por frame (el tiempo sobrante se descarta y el juego va más lento en
+    vez de entrar en una espiral de frames cada vez más largos).
+
+    Uso, una vez por frame:
+        ticks = timestep.advance()
+        for _ in range(ticks):
+            game.step(inp)
+        draw(..., alpha=timestep.alpha)
+    """
+
+    def __init__(self, rate=TICK_RATE, max_ticks=MAX_CATCHUP_TICKS, clock=time.perf_counter):
+        self.dt = 1.0 / rate
+        self.max_ticks = max_ticks
+        self.clock = clock
+        self.accumulator = 0.0
+        self.last = clock()
+        self.frame_time = 0.0  # segundos reales del último frame
+        self.dropped = 0  # ticks descartados en total por el límite
+
+    def advance(self):
+        """Suma el tiempo desde la última llamada y devuelve los ticks a simular."""
+        now = self.clock()
+        self.frame_time = now - self.last
+        self.last = now
+        self.accumulator += self.frame_time
+
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks:
+            self.dropped += ticks - self.max_ticks
+            ticks = self.max_ticks
+            self.accumulator = self.accumulator % self.dt
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fracción del siguiente tick ya transcurrida, en [0, 1)."""
+        return max(0.0, self.accumulator / self.dt)
+
+    @property
+    def time_scale(self):
+        """Ticks de tiempo real del último frame (con el mismo límite)."""
+        return min(self.frame_time / self.dt, float(self.max_ticks))
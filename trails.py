@@ -0,0 +1,112 @@
+from array import array
+
+import pygame
+
+from config import WIDTH, HEIGHT, TRAIL_LENGTH
+
+# Rectángulo de la pantalla: las balas fuera de él no guardan ni dibujan trail
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+_stamps = {}
+
+
+def get_trail_stamps(length=TRAIL_LENGTH):
+    """
+    Círculos pre-renderizados del trail, del punto más viejo (más transparente)
+    al más nuevo. Con 6 puntos son los alfas originales 40, 60, ..., 140.
+    """
+    stamps = _stamps.get(length)
+    if stamps is None:
+        step = 100 / (length - 1) if length > 1 else 0
+        stamps = []
+        for i in range(length):
+            alpha = int(40 + i * step)
+            s = pygame.Surface((8, 8), pygame.SRCALPHA)
+            pygame.draw.circle(s, (255, 255, 200, alpha), (4, 4), 3)
+            if pygame.display.get_surface() is not None:
+                s = s.convert_alpha()
+            stamps.append(s)
+        _stamps[length] = stamps
+    return stamps
+
+
+class Trail:
+    """
+    Últimas posiciones de una bala en un buffer circular de tamaño fijo.
+    Las coordenadas van seguidas en un array("h") (x0, y0, x1, y1, ...):
+    unos 20 bytes por punto en vez de una tupla con dos enteros.
+    """
+
+    __slots__ = ("coords", "length", "head", "count")
+
+    def __init__(self, length=TRAIL_LENGTH):
+        self.coords = array("h", bytes(4 * length))
+        self.length = length
+        self.head = 0
+        self.count = 0
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def push(self, center):
+        coords = self.coords
+        i = self.head * 2
+        # se guarda ya la esquina del stamp de 8x8 centrado en la bala
+        coords[i] = center[0] - 4
+        coords[i + 1] = center[1] - 4
+        self.head = (self.head + 1) % self.length
+        if self.count < self.length:
+            self.count += 1
+
+    def load(self, points):
+        """Sustituye el contenido por `points` (esquinas, de la más vieja a la más nueva)."""
+        self.clear()
+        for x, y in points[-self.length:]:
+            self.push((x + 4, y + 4))
+
+    def rect(self):
+        """Rect que cubre todos los stamps del trail (None si está vacío)."""
+        if not self.count:
+            return None
+        points = self.ordered()
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        return pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 8, max(ys) - min(ys) + 8)
+
+    def ordered(self):
+        """Posiciones de la más vieja a la más nueva."""
+        coords = self.coords
+        if self.count < self.length:
+            # aún no ha dado la vuelta: los puntos empiezan en 0
+            flat = coords[:self.count * 2]
+        else:
+            head = self.head * 2
+            flat = coords[head:] + coords[:head]
+        it = iter(flat)
+        return list(zip(it, it))
+
+
+def update_trails(bullets):
+    """Añade la posición actual de cada bala visible a su trail."""
+    on_screen = SCREEN_RECT.colliderect
+    for bullet in bullets:
+        if on_screen(bullet.rect):
+            bullet.trail.push(bullet.rect.center)
+
+
+def draw_bullets_with_trails(surface, bullets, length=TRAIL_LENGTH, pos=None):
+    """
+    Dibuja las balas visibles, cada una encima de su trail, con un único
+    Surface.blits para todas. `pos(bullet)` da la posición de dibujo de la
+    bala (interpolada); por defecto su rect.
+    """
+    stamps = get_trail_stamps(length)
+    on_screen = SCREEN_RECT.colliderect
+    seq = []
+    for bullet in bullets:
+        if on_screen(bullet.rect):
+            seq.extend(zip(stamps, bullet.trail.ordered()))
+            seq.append((bullet.image, bullet.rect if pos is None else pos(bullet)))
+    if seq:
+        surface.blits(seq, doreturn=False)
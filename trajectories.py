@@ -0,0 +1,98 @@
+"""
+Trayectorias paramétricas en forma cerrada: la posición (centro) de una
+bala o un minion se calcula directamente a partir del origen, los
+parámetros y los ticks `t` desde que apareció, sin acumular nada tick a
+tick. Así no hay deriva por redondeo, se puede evaluar en bloque con
+NumPy y se puede saltar a cualquier tick pasado o futuro.
+
+Todas las funciones aceptan escalares o arrays de NumPy (se difunden).
+"""
+import math
+
+import numpy as np
+
+# Tipos de trayectoria (el índice se guarda en los arrays de ProjectileField)
+PATHS = ("linear", "sine", "spiral", "homing")
+PATH_INDEX = {name: i for i, name in enumerate(PATHS)}
+LINEAR, SINE, SPIRAL, HOMING = range(len(PATHS))
+
+
+def accumulated_sine(step_amp, omega, phase=0.0):
+    """
+    Parámetros (amp, phase) de sine_at equivalentes a la regla incremental
+        x += step_amp * sin(phase + omega * k)   en cada tick k = 1, 2, ...
+    (la suma de senos en progresión aritmética es otro seno).
+    """
+    amp = step_amp / (2 * math.sin(omega / 2))
+    return amp, phase + omega / 2 - math.pi / 2
+
+
+def linear_at(t, x0, y0, vx, vy):
+    """Recta: origen + velocidad * t."""
+    return x0 + vx * t, y0 + vy * t
+
+
+def sine_at(t, x0, y0, vx, vy, amp, omega, phase):
+    """Recta con una oscilación en X: amp * (sin(phase + omega*t) - sin(phase))."""
+    return x0 + vx * t + amp * (np.sin(phase + omega * t) - np.sin(phase)), y0 + vy * t
+
+
+def spiral_at(t, cx, cy, vx, vy, r0, omega, theta0, radial_speed):
+    """
+    Espiral alrededor de un centro que se mueve con (vx, vy): el ángulo gira
+    `omega` rad/tick desde theta0 y el radio crece `radial_speed` px/tick desde r0.
+    """
+    r = r0 + radial_speed * t
+    theta = theta0 + omega * t
+    return cx + vx * t + r * np.cos(theta), cy + vy * t + r * np.sin(theta)
+
+
+def homing_params(x, y, vx, vy, tx, ty, max_turn):
+    """
+    Parámetros de homing_at para una bala en (x, y) con velocidad (vx, vy)
+    que gira como mucho `max_turn` rad/tick hacia el punto fijo (tx, ty).
+
+    Con velocidad constante y giro máximo la trayectoria es un arco de
+    círculo de radio speed/max_turn hasta que la bala apunta al objetivo
+    (tangente desde el objetivo) y después una recta.
+
+    Devuelve (cx, cy, radius, omega, phi0, t_turn, ok): centro del círculo,
+    radio, velocidad angular con signo, ángulo inicial sobre el círculo,
+    ticks que dura el arco y si hay arco. ok es False cuando el objetivo ya
+    está justo delante o dentro del círculo de giro: esas balas van rectas.
+    """
+    x, y, vx, vy, tx, ty = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, y, vx, vy, tx, ty)))
+    speed = np.hypot(vx, vy)
+    safe_speed = np.where(speed > 0, speed, 1.0)
+    ux = vx / safe_speed
+    uy = vy / safe_speed
+    qx = tx - x
+    qy = ty - y
+    # lado hacia el que hay que girar (+1: el ángulo crece, de X hacia Y)
+    cross = ux * qy - uy * qx
+    side = np.where(cross >= 0, 1.0, -1.0)
+
+    radius = speed / max_turn
+    cx = x - side * radius * uy
+    cy = y + side * radius * ux
+    phi0 = np.arctan2(y - cy, x - cx)
+
+    dist = np.hypot(tx - cx, ty - cy)
+    ok = (speed > 0) & (dist > radius) & (np.abs(cross) > 1e-9)
+    # punto de tangencia sobre el círculo: beta -/+ alpha según el sentido
+    beta = np.arctan2(ty - cy, tx - cx)
+    alpha = np.arccos(np.clip(radius / np.where(dist > 0, dist, 1.0), -1.0, 1.0))
+    sweep = np.mod(side * (beta - side * alpha - phi0), 2 * math.pi)
+    t_turn = np.where(ok, sweep / max_turn, 0.0)
+    return cx, cy, radius, side * max_turn, phi0, t_turn, ok
+
+
+def homing_at(t, cx, cy, radius, omega, phi0, t_turn):
+    """Arco de círculo durante t_turn ticks y recta tangente al final del arco después."""
+    t_arc = np.minimum(t, t_turn)
+    phi = phi0 + omega * t_arc
+    x = cx + radius * np.cos(phi)
+    y = cy + radius * np.sin(phi)
+    # tras el arco: velocidad tangente (radius * omega) en la dirección de giro
+    extra = (t - t_arc) * radius * omega
+    return x - np.sin(phi) * extra, y + np.cos(phi) * extra
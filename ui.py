@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import pygame
 from config import (
     WIDTH,
@@ -11,12 +13,61 @@ from config import (
     YELLOW,
     GREY,
     CYAN,
+    TEXT_CACHE_SIZE,
 )
 from background import update_and_draw_background
 
 
+class TextCache:
+    """
+    Caché LRU de textos ya renderizados, por (texto, fuente, color, antialias).
+    Los textos fijos (título, pausa, etiquetas del HUD) se renderizan una vez;
+    los numéricos ("Score : 120") sólo cuando cambia su valor.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, tuple(color), antialias)
+        img = self._entries.get(key)
+        if img is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return img
+
+        self.misses += 1
+        img = font.render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            img = img.convert_alpha()
+        self._entries[key] = img
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return img
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Caché compartida por todas las pantallas
+TEXT_CACHE = TextCache()
+
+
 def draw_text(surface, text, font, color, x, y, center=False):
-    img = font.render(text, True, color)
+    img = TEXT_CACHE.render(font, text, color)
     rect = img.get_rect()
     if center:
         rect.center = (x, y)
@@ -31,7 +82,16 @@ def draw_health_bar(surface, x, y, w, h, hp, max_hp, color):
     pygame.draw.rect(surface, color, (x, y, w * ratio, h), border_radius=6)
 
 
-def draw_title_screen(surface, stars):
+def draw_loading_bar(surface, progress):
+    """Barra fina bajo el panel del título con el progreso de assets.ASSETS."""
+    w, h = int(WIDTH * 0.4), 8
+    x, y = (WIDTH - w) // 2, HEIGHT - 90
+    pygame.draw.rect(surface, GREY, (x, y, w, h), border_radius=4)
+    pygame.draw.rect(surface, CYAN, (x, y, int(w * progress), h), border_radius=4)
+
+
+def draw_title_screen(surface, stars, loading=None):
+    """`loading`: el AssetLoader que carga en segundo plano (barra de progreso)."""
     update_and_draw_background(surface, stars)
 
     # panel central con fade-in suave
@@ -44,6 +104,12 @@ def draw_title_screen(surface, stars):
     surface.blit(panel, rect.topleft)
     pygame.draw.rect(surface, CYAN, rect, 2)
 
+    if loading is not None and loading.progress < 1.0:
+        draw_loading_bar(surface, loading.progress)
+        # sin fuentes aún no hay textos: buscarlas aquí bloquearía el frame
+        if not loading.ready("fonts"):
+            return
+
     draw_text(surface, "CHRONIQUES PIXEL", BIG_FONT, YELLOW, WIDTH // 2, rect.top + 60, center=True)
     draw_text(surface, "Assaut des Boss", FONT, WHITE, WIDTH // 2, rect.top + 110, center=True)
     draw_text(surface, "By Leziak",        FONT, CYAN,  WIDTH // 2, rect.top + 145, center=True)
@@ -59,7 +125,7 @@ def draw_title_screen(surface, stars):
     draw_text(surface, "Appuie sur ENTREE pour commencer",
               FONT, GREEN, WIDTH // 2, rect.top + 370, center=True)
 
-    draw_text(surface, "M : mute musique | B : pause musique",
+    draw_text(surface, "M : mute musique | N : sons | B : pause",
               FONT, WHITE, WIDTH // 2, rect.top + 400, center=True)
 
 
@@ -77,7 +143,7 @@ def draw_pause_overlay(surface):
     draw_text(surface, "PAUSE", BIG_FONT, YELLOW, WIDTH // 2, rect.top + 40, center=True)
     draw_text(surface, "R : reprendre la partie", FONT, WHITE, WIDTH // 2, rect.top + 110, center=True)
     draw_text(surface, "T : retour a l'ecran titre", FONT, WHITE, WIDTH // 2, rect.top + 145, center=True)
-    draw_text(surface, "M : mute musique | B : pause musique", FONT, WHITE, WIDTH // 2, rect.top + 180, center=True)
+    draw_text(surface, "M : mute musique | N : sons | B : pause", FONT, WHITE, WIDTH // 2, rect.top + 180, center=True)
 
 
 def draw_game_over(surface, level, stars):
@@ -94,35 +160,140 @@ def draw_game_over(surface, level, stars):
     draw_text(surface, "Appuie sur ENTREE pour retourner au titre", FONT, WHITE, WIDTH // 2, rect.top + 170, center=True)
 
 
-def draw_hud(surface, player, boss, level, score):
-    # Panel translúcido arriba
-    panel = pygame.Surface((WIDTH, 80), pygame.SRCALPHA)
-    panel.fill((0, 0, 0, 140))
-    surface.blit(panel, (0, 0))
-    pygame.draw.line(surface, CYAN, (0, 80), (WIDTH, 80), 2)
+# ============================================================
+# HUD
+# ============================================================
+HUD_HEIGHT = 82  # panel de 80 px + línea cyan de 2 px
+HUD_PANEL_COLOR = (0, 0, 0, 140)
+BOSS_BAR_W = 260
+BOSS_BAR_X = (WIDTH - BOSS_BAR_W) // 2
+_UNSET = object()
+
 
-    # HUD jugador
+def _draw_pv_label(surface, value):
     draw_text(surface, "PV", FONT, WHITE, 20, 20)
-    draw_health_bar(surface, 60, 22, 220, 16, player.hp, player.max_hp, GREEN)
 
-    draw_text(surface, f"Pouvoirs (X) : {player.special_charges}", FONT, WHITE, 20, 50)
-    draw_text(surface, f"Niveau : {level}", FONT, WHITE, WIDTH - 230, 20)
-    draw_text(surface, f"Score : {score}", FONT, CYAN, WIDTH - 230, 50)
 
+def _draw_player_bar(surface, value):
+    hp, max_hp = value
+    draw_health_bar(surface, 60, 22, 220, 16, hp, max_hp, GREEN)
+
+
+def _draw_charges(surface, value):
+    draw_text(surface, f"Pouvoirs (X) : {value}", FONT, WHITE, 20, 50)
+
+
+def _draw_level(surface, value):
+    draw_text(surface, f"Niveau : {value}", FONT, WHITE, WIDTH - 230, 20)
+
+
+def _draw_score(surface, value):
+    draw_text(surface, f"Score : {value}", FONT, CYAN, WIDTH - 230, 50)
+
+
+def _draw_boss_bar(surface, value):
     # HP del boss (centrado)
-    if boss is not None:
-        boss_color = RED if boss.hp > boss.max_hp * 0.3 else ORANGE
-        bar_w = 260
-        bar_x = (WIDTH - bar_w) // 2
-
-        draw_text(surface, "Boss", FONT, WHITE, bar_x - 60, 20)
-        # sombra de la barra
-        pygame.draw.rect(surface, (0, 0, 0), (bar_x - 2, 20, bar_w + 4, 20), border_radius=8)
-        # base gris
-        pygame.draw.rect(surface, (60, 60, 60), (bar_x, 22, bar_w, 16), border_radius=6)
-        # vida real
-        ratio = max(boss.hp, 0) / boss.max_hp
-        pygame.draw.rect(surface, boss_color, (bar_x, 22, bar_w * ratio, 16), border_radius=6)
+    if value is None:
+        return
+    hp, max_hp = value
+    boss_color = RED if hp > max_hp * 0.3 else ORANGE
+    bar_w = BOSS_BAR_W
+    bar_x = BOSS_BAR_X
+
+    draw_text(surface, "Boss", FONT, WHITE, bar_x - 60, 20)
+    # sombra de la barra
+    pygame.draw.rect(surface, (0, 0, 0), (bar_x - 2, 20, bar_w + 4, 20), border_radius=8)
+    # base gris
+    pygame.draw.rect(surface, (60, 60, 60), (bar_x, 22, bar_w, 16), border_radius=6)
+    # vida real
+    ratio = max(hp, 0) / max_hp
+    pygame.draw.rect(surface, boss_color, (bar_x, 22, bar_w * ratio, 16), border_radius=6)
+
+
+class Hud:
+    """
+    HUD pre-compuesto en una capa translúcida propia.
+    Cada widget tiene un valor ligado (PV, cargas, nivel, score, boss) y una
+    zona fija de la capa: sólo se repintan las zonas cuyo valor cambió, y
+    update() devuelve esos rectángulos. En reposo el HUD cuesta un único blit.
+    Las zonas dependen del alto de línea de FONT: se calculan en el primer
+    update(), no al importar ui (eso cargaría la fuente antes de la ventana).
+    """
+
+    def __init__(self):
+        self.widgets = None
+        self.layer = None
+        self.values = {}
+        self.rebuilds = 0
+
+    def _layout(self):
+        line_h = FONT.get_linesize()
+        # (nombre, valor ligado, función de dibujo, zona de la capa), en orden de dibujo
+        self.widgets = [
+            ("pv_label", lambda p, b, lv, sc: None, _draw_pv_label,
+             pygame.Rect(20, 20, 40, line_h)),
+            ("player_bar", lambda p, b, lv, sc: (p.hp, p.max_hp), _draw_player_bar,
+             pygame.Rect(60, 22, 220, 16)),
+            ("charges", lambda p, b, lv, sc: p.special_charges, _draw_charges,
+             pygame.Rect(20, 50, 250, line_h)),
+            ("level", lambda p, b, lv, sc: lv, _draw_level,
+             pygame.Rect(WIDTH - 230, 20, 230, line_h)),
+            ("score", lambda p, b, lv, sc: sc, _draw_score,
+             pygame.Rect(WIDTH - 230, 50, 230, line_h)),
+            ("boss_bar", lambda p, b, lv, sc: None if b is None else (b.hp, b.max_hp), _draw_boss_bar,
+             pygame.Rect(BOSS_BAR_X - 60, 20, 60, line_h).union((BOSS_BAR_X - 2, 20, BOSS_BAR_W + 4, 20))),
+        ]
+
+    def _build(self):
+        self.layer = pygame.Surface((WIDTH, HUD_HEIGHT), pygame.SRCALPHA)
+        self.layer.fill(HUD_PANEL_COLOR, (0, 0, WIDTH, 80))
+        pygame.draw.line(self.layer, CYAN, (0, 80), (WIDTH, 80), 2)
+        for name, _, draw_fn, _ in self.widgets:
+            draw_fn(self.layer, self.values[name])
+        self.rebuilds += 1
+
+    def update(self, player, boss, level, score):
+        """Actualiza la capa con los valores actuales; devuelve los rects cambiados."""
+        if self.widgets is None:
+            self._layout()
+        changed = []
+        for name, value_fn, _, area in self.widgets:
+            value = value_fn(player, boss, level, score)
+            if self.values.get(name, _UNSET) != value:
+                self.values[name] = value
+                changed.append(area)
+
+        if self.layer is None:
+            self._build()
+            return [self.layer.get_rect()]
+
+        layer = self.layer
+        for area in changed:
+            # se limpia la zona y se repinta todo lo que la toca, recortado a ella
+            layer.set_clip(area)
+            layer.fill(HUD_PANEL_COLOR, area)
+            for name, _, draw_fn, widget_area in self.widgets:
+                if widget_area.colliderect(area):
+                    draw_fn(layer, self.values[name])
+        layer.set_clip(None)
+        return [area.copy() for area in changed]
+
+    def draw(self, surface):
+        surface.blit(self.layer, (0, 0))
+
+    def invalidate(self):
+        self.layer = None
+
+
+# HUD compartido por PLAYING y PAUSED
+HUD = Hud()
+
+
+def draw_hud(surface, player, boss, level, score):
+    """Dibuja el HUD y devuelve los rects que cambiaron desde el frame anterior."""
+    dirty = HUD.update(player, boss, level, score)
+    HUD.draw(surface)
+    return dirty
 
 
 def draw_upgrade_screen(surface, stars, upgrade_options, mouse_pos):